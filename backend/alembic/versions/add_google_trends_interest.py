@@ -0,0 +1,40 @@
+"""
+Alembic migration: Relational Google Trends interest series
+
+Adds google_trends_interest, one (signal_id, observed_at, interest) row per
+series point, unique per signal and timestamp. Existing signals stored the
+series without timestamps, so nothing is backfilled.
+
+Revision ID: add_google_trends_interest
+Revises: add_signal_metric_snapshots
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_google_trends_interest'
+down_revision = 'add_signal_metric_snapshots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'google_trends_interest',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('signal_id', sa.Integer(), nullable=False),
+        sa.Column('observed_at', sa.DateTime(timezone=True), nullable=False, comment='Start of the interval'),
+        sa.Column('interest', sa.SmallInteger(), nullable=False, comment='Relative interest, 0-100'),
+        sa.ForeignKeyConstraint(['signal_id'], ['raw_signals.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'uq_trends_interest_signal_time', 'google_trends_interest',
+        ['signal_id', 'observed_at'], unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('uq_trends_interest_signal_time', table_name='google_trends_interest')
+    op.drop_table('google_trends_interest')
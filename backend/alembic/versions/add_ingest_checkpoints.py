@@ -0,0 +1,38 @@
+"""
+Alembic migration: Add ingest_checkpoints for incremental scraping
+
+Revision ID: add_ingest_checkpoints
+Revises: add_signal_identifier_hash
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = 'add_ingest_checkpoints'
+down_revision = 'add_signal_identifier_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'ingest_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('platform', sa.String(50), nullable=False),
+        sa.Column('scope', sa.String(200), nullable=False, comment='Subreddit, search keyword, etc.'),
+        sa.Column('cursor', sa.String(200), nullable=True, comment='Newest item seen (fullname, video ID, page token)'),
+        sa.Column('last_seen_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('checkpoint_metadata', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ingest_checkpoints_id', 'ingest_checkpoints', ['id'])
+    op.create_index('uq_ingest_checkpoint_scope', 'ingest_checkpoints', ['platform', 'scope'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_ingest_checkpoint_scope', table_name='ingest_checkpoints')
+    op.drop_index('ix_ingest_checkpoints_id', table_name='ingest_checkpoints')
+    op.drop_table('ingest_checkpoints')
@@ -0,0 +1,114 @@
+"""
+Alembic migration: Unique indexes backing bulk ingest upserts
+
+Merges existing duplicate raw_signals (same identifier) and detected_trends
+(same normalized_phrase + category) into their lowest-id row, then adds the
+unique indexes used as ON CONFLICT targets. signal_count is recomputed
+from the remaining associations for every trend either merge touched.
+
+Revision ID: add_ingest_unique_indexes
+Revises: add_detected_trends
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'add_ingest_unique_indexes'
+down_revision = 'add_detected_trends'
+branch_labels = None
+depends_on = None
+
+
+def _merge_duplicate_trends():
+    op.execute("""
+        CREATE TEMP TABLE trend_dupes ON COMMIT DROP AS
+        SELECT id, min(id) OVER (PARTITION BY normalized_phrase, category) AS keeper_id
+        FROM detected_trends
+    """)
+    op.execute("DELETE FROM trend_dupes WHERE id = keeper_id")
+    op.execute("INSERT INTO touched_trends SELECT DISTINCT keeper_id FROM trend_dupes")
+
+    # Associations that would collide once repointed to the keeper
+    op.execute("""
+        DELETE FROM signal_trend_associations a
+        USING (
+            SELECT a2.id, row_number() OVER (
+                PARTITION BY a2.signal_id, COALESCE(d.keeper_id, a2.detected_trend_id)
+                ORDER BY a2.id
+            ) AS rn
+            FROM signal_trend_associations a2
+            LEFT JOIN trend_dupes d ON d.id = a2.detected_trend_id
+        ) ranked
+        WHERE a.id = ranked.id AND ranked.rn > 1
+    """)
+    op.execute("""
+        UPDATE signal_trend_associations a SET detected_trend_id = d.keeper_id
+        FROM trend_dupes d WHERE a.detected_trend_id = d.id
+    """)
+    op.execute("DELETE FROM detected_trends t USING trend_dupes d WHERE t.id = d.id")
+
+
+def _merge_duplicate_signals():
+    op.execute("""
+        CREATE TEMP TABLE signal_dupes ON COMMIT DROP AS
+        SELECT id, min(id) OVER (PARTITION BY identifier) AS keeper_id
+        FROM raw_signals
+    """)
+    op.execute("DELETE FROM signal_dupes WHERE id = keeper_id")
+
+    # Trends whose associations are collapsed or repointed below
+    op.execute("""
+        INSERT INTO touched_trends
+        SELECT DISTINCT a.detected_trend_id
+        FROM signal_trend_associations a JOIN signal_dupes d ON d.id = a.signal_id
+    """)
+    op.execute("""
+        DELETE FROM signal_trend_associations a
+        USING (
+            SELECT a2.id, row_number() OVER (
+                PARTITION BY COALESCE(d.keeper_id, a2.signal_id), a2.detected_trend_id
+                ORDER BY a2.id
+            ) AS rn
+            FROM signal_trend_associations a2
+            LEFT JOIN signal_dupes d ON d.id = a2.signal_id
+        ) ranked
+        WHERE a.id = ranked.id AND ranked.rn > 1
+    """)
+    op.execute("""
+        UPDATE signal_trend_associations a SET signal_id = d.keeper_id
+        FROM signal_dupes d WHERE a.signal_id = d.id
+    """)
+    op.execute("""
+        UPDATE trend_evidence e SET signal_id = d.keeper_id
+        FROM signal_dupes d WHERE e.signal_id = d.id
+    """)
+    op.execute("DELETE FROM raw_signals s USING signal_dupes d WHERE s.id = d.id")
+
+
+def _recount_touched_trends():
+    """signal_count from the associations left after both merges"""
+    op.execute("""
+        UPDATE detected_trends t SET signal_count = (
+            SELECT count(*) FROM signal_trend_associations a WHERE a.detected_trend_id = t.id
+        )
+        WHERE t.id IN (SELECT id FROM touched_trends)
+    """)
+
+
+def upgrade():
+    op.execute("CREATE TEMP TABLE touched_trends (id integer) ON COMMIT DROP")
+    _merge_duplicate_trends()
+    _merge_duplicate_signals()
+    _recount_touched_trends()
+
+    op.create_index('uq_raw_signals_identifier', 'raw_signals', ['identifier'], unique=True)
+    op.create_index(
+        'uq_detected_trends_phrase_category', 'detected_trends',
+        ['normalized_phrase', 'category'], unique=True
+    )
+
+
+def downgrade():
+    # Merged duplicates are not restored
+    op.drop_index('uq_detected_trends_phrase_category', table_name='detected_trends')
+    op.drop_index('uq_raw_signals_identifier', table_name='raw_signals')
@@ -0,0 +1,37 @@
+"""
+Alembic migration: Track trend extraction per signal
+
+Adds raw_signals.extractor_version (the TrendExtractor version whose
+associations a signal has) and a partial index over signals not extracted
+yet, which the post-ingest ExtractionWorker reads in id order. Existing
+signals start unextracted; the worker's first run links them (associations
+already written inline are kept, not duplicated).
+
+Revision ID: add_signal_extractor_version
+Revises: add_google_trends_interest
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_signal_extractor_version'
+down_revision = 'add_google_trends_interest'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('raw_signals', sa.Column(
+        'extractor_version', sa.String(20), nullable=True,
+        comment='TrendExtractor version whose associations this signal has'
+    ))
+    op.create_index(
+        'idx_raw_signals_unextracted', 'raw_signals', ['id'],
+        postgresql_where=sa.text('extractor_version IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_raw_signals_unextracted', table_name='raw_signals')
+    op.drop_column('raw_signals', 'extractor_version')
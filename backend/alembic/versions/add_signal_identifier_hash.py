@@ -0,0 +1,56 @@
+"""
+Alembic migration: Hashed, indexed identifier for raw_signals dedup
+
+Adds raw_signals.identifier_hash (md5 hex of identifier), backfills it in
+id-range batches, and moves the unique dedup index from the 500-char
+identifier to the 32-char hash.
+
+The backfill commits each batch on its own (autocommit block), so the
+column addition is already committed when it starts: if the upgrade fails
+later, drop identifier_hash before running it again.
+
+Revision ID: add_signal_identifier_hash
+Revises: add_ingest_unique_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_signal_identifier_hash'
+down_revision = 'add_ingest_unique_indexes'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH = 50000
+
+
+def upgrade():
+    op.add_column(
+        'raw_signals',
+        sa.Column('identifier_hash', sa.String(32), nullable=True, comment='md5(identifier), dedup key')
+    )
+
+    # Backfill in id ranges, committing each one, so row locks are released
+    # batch by batch instead of being held on the whole table until the end
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        max_id = bind.execute(sa.text("SELECT coalesce(max(id), 0) FROM raw_signals")).scalar()
+        for start in range(0, max_id + 1, BACKFILL_BATCH):
+            bind.execute(
+                sa.text(
+                    "UPDATE raw_signals SET identifier_hash = md5(identifier) "
+                    "WHERE id >= :start AND id < :end AND identifier_hash IS NULL"
+                ),
+                {'start': start, 'end': start + BACKFILL_BATCH}
+            )
+
+    op.alter_column('raw_signals', 'identifier_hash', nullable=False)
+    op.create_index('uq_raw_signals_identifier_hash', 'raw_signals', ['identifier_hash'], unique=True)
+    op.drop_index('uq_raw_signals_identifier', table_name='raw_signals')
+
+
+def downgrade():
+    op.create_index('uq_raw_signals_identifier', 'raw_signals', ['identifier'], unique=True)
+    op.drop_index('uq_raw_signals_identifier_hash', table_name='raw_signals')
+    op.drop_column('raw_signals', 'identifier_hash')
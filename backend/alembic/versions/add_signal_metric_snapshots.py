@@ -0,0 +1,47 @@
+"""
+Alembic migration: Append-only signal_metric_snapshots
+
+Stores one (signal_id, observed_at, metric_value) row per scrape so
+engagement growth survives the in-place raw_signals update. Seeds each
+existing signal with its current value.
+
+Revision ID: add_signal_metric_snapshots
+Revises: add_ingest_checkpoints
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_signal_metric_snapshots'
+down_revision = 'add_ingest_checkpoints'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'signal_metric_snapshots',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('signal_id', sa.Integer(), nullable=False),
+        sa.Column('observed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('metric_value', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['signal_id'], ['raw_signals.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_snapshot_signal_observed', 'signal_metric_snapshots', ['signal_id', 'observed_at'])
+    op.create_index('idx_snapshot_observed', 'signal_metric_snapshots', ['observed_at'])
+
+    # Current values become each signal's first observation
+    op.execute("""
+        INSERT INTO signal_metric_snapshots (signal_id, observed_at, metric_value)
+        SELECT id, coalesce(collected_at, now()), metric_value
+        FROM raw_signals
+        WHERE metric_value IS NOT NULL
+    """)
+
+
+def downgrade():
+    op.drop_index('idx_snapshot_observed', table_name='signal_metric_snapshots')
+    op.drop_index('idx_snapshot_signal_observed', table_name='signal_metric_snapshots')
+    op.drop_table('signal_metric_snapshots')
@@ -13,6 +13,10 @@ class Settings(BaseSettings):
     REDDIT_USER_AGENT: str = "Seer/1.0"
     
     YOUTUBE_API_KEY: str = ""
+    YOUTUBE_QUOTA_PER_RUN: int = 10000  # API units one scrape may spend (project default: 10,000/day)
+    YOUTUBE_INITIAL_WINDOW_DAYS: int = 7  # Publish window for keywords never searched before
+    YOUTUBE_WINDOW_OVERLAP_HOURS: int = 6  # Re-cover the end of the last window (late-indexed videos)
+    YOUTUBE_MAX_SEARCH_PAGES: int = 3  # search().list pages per keyword (100 units each)
     
     SPOTIFY_CLIENT_ID: str = ""
     SPOTIFY_CLIENT_SECRET: str = ""
@@ -35,6 +39,79 @@ class Settings(BaseSettings):
     SCRAPER_INTERVAL_HOURS: int = 4
     PROCESSING_INTERVAL_HOURS: int = 1
     
+    # Subreddit listings fetched concurrently (1 = one at a time)
+    REDDIT_FETCH_WORKERS: int = 4
+    
+    # Ingest pipeline: extraction processes (0 = extract on a thread) and
+    # writer batches (flushed at this many signals or this many seconds)
+    REDDIT_EXTRACT_WORKERS: int = 2
+    REDDIT_WRITE_BATCH_SIZE: int = 500
+    REDDIT_WRITE_BATCH_SECONDS: float = 5.0
+    
+    # Read only posts newer than each subreddit's checkpoint, then refresh
+    # metrics of posts stored within the refresh window
+    REDDIT_INCREMENTAL: bool = False
+    REDDIT_REFRESH_WINDOW_HOURS: int = 48
+    
+    # One combined listing per category instead of one per subreddit
+    REDDIT_MULTIREDDIT: bool = False
+    
+    # Google Trends: payload cache (0 hours disables) and adaptive pacing.
+    # Cached payloads count as already ingested, so keep the TTL well below
+    # SCRAPER_INTERVAL_HOURS or scheduled runs will skip keywords.
+    GOOGLE_TRENDS_CACHE_PATH: str = ".cache/google_trends_cache.sqlite3"
+    GOOGLE_TRENDS_CACHE_TTL_HOURS: int = 1
+    GOOGLE_TRENDS_RATE_PER_SECOND: float = 0.5
+    GOOGLE_TRENDS_MAX_RATE_PER_SECOND: float = 2.0
+    GOOGLE_TRENDS_MAX_RETRIES: int = 4
+    
+    # Scraper resilience: attempts per request with jittered exponential
+    # backoff, retries allowed as a share of requests, and per-host circuit
+    # breakers (open after N consecutive transient failures, probe after
+    # the reset time); every request also gets a timeout
+    SCRAPER_RETRY_MAX_ATTEMPTS: int = 4
+    SCRAPER_RETRY_BASE_SECONDS: float = 1.0
+    SCRAPER_RETRY_MAX_SECONDS: float = 30.0
+    SCRAPER_RETRY_BUDGET_RATIO: float = 0.2
+    SCRAPER_RETRY_BUDGET_MIN: int = 10
+    SCRAPER_BREAKER_FAILURES: int = 5
+    SCRAPER_BREAKER_RESET_SECONDS: float = 60.0
+    SCRAPER_REQUEST_TIMEOUT_SECONDS: float = 20.0
+    
+    # Scraper HTTP: off, record (capture live responses) or replay (serve
+    # them from <dir>/<platform>.jsonl, no network)
+    INGEST_HTTP_FIXTURES: str = "off"
+    INGEST_HTTP_FIXTURES_DIR: str = "fixtures/http"
+    
+    # Metric snapshot retention: every snapshot for SNAPSHOT_RAW_HOURS, then
+    # the last one per hour until SNAPSHOT_HOURLY_DAYS, the last one per day
+    # until SNAPSHOT_DAILY_DAYS, then none
+    SNAPSHOT_RAW_HOURS: int = 48
+    SNAPSHOT_HOURLY_DAYS: int = 14
+    SNAPSHOT_DAILY_DAYS: int = 90
+    
+    # Trend extraction cache (local, redis, none)
+    EXTRACTION_CACHE_BACKEND: str = "local"
+    EXTRACTION_CACHE_PATH: str = ".cache/extraction_cache.sqlite3"
+    EXTRACTION_CACHE_MAX_ENTRIES: int = 200000
+    EXTRACTION_CACHE_TTL_HOURS: int = 72
+    
+    # Skip POS tagging for titles that contain an already-tracked phrase
+    KNOWN_PHRASE_FAST_PATH: bool = False
+    
+    # Trend extractor tier: full (POS tagging) or fast (regex + n-grams)
+    TREND_EXTRACTOR_MODE: str = "full"
+    
+    # Skip NLP for non-English, emoji-only and one-word titles
+    TITLE_PREFILTER_ENABLED: bool = True
+    
+    # Post-ingest extraction: signals per batch and extraction processes
+    # (0 = in the worker's own process). With inline extraction off, Reddit
+    # leaves its posts to the worker like every other platform.
+    EXTRACTION_WORKER_BATCH_SIZE: int = 2000
+    EXTRACTION_WORKER_PROCESSES: int = 2
+    REDDIT_INLINE_EXTRACTION: bool = True
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -3,13 +3,16 @@ Database models for Seer application.
 Import all models here for Alembic to detect them.
 """
 
-from app.models.signal import RawSignal
+from app.models.signal import RawSignal, SignalMetricSnapshot, TrendInterestPoint
 from app.models.trend import Trend, TrendEvidence
 from app.models.user import User, Watchlist, CalendarEvent
 from app.models.detected_trend import DetectedTrend, SignalTrendAssociation
+from app.models.ingest_checkpoint import IngestCheckpoint
 
 __all__ = [
     "RawSignal",
+    "SignalMetricSnapshot",
+    "TrendInterestPoint",
     "Trend",
     "TrendEvidence",
     "User",
@@ -17,4 +20,5 @@ __all__ = [
     "CalendarEvent",
     "DetectedTrend",
     "SignalTrendAssociation",
+    "IngestCheckpoint",
 ]
\ No newline at end of file
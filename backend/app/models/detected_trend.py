@@ -104,6 +104,8 @@ class DetectedTrend(Base):
     # Composite indexes for common queries
     __table_args__ = (
         Index('idx_category_signal_count', 'category', 'signal_count'),
+        # One row per phrase per category; ON CONFLICT target for bulk upserts
+        Index('uq_detected_trends_phrase_category', 'normalized_phrase', 'category', unique=True),
     )
     
     def __repr__(self):
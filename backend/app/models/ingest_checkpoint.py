@@ -0,0 +1,36 @@
+"""
+Per-source ingestion checkpoints (high-water marks)
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class IngestCheckpoint(Base):
+    """
+    Where the last successful ingest of one source scope stopped, so the
+    next run only reads newer content.
+
+    Example: platform="reddit", scope="SkincareAddiction",
+    cursor="t3_1abcde" (newest post fullname), last_seen_at=its created time
+    """
+    __tablename__ = "ingest_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    platform = Column(String(50), nullable=False)  # reddit, youtube, google_trends
+    scope = Column(String(200), nullable=False)  # subreddit, search keyword, etc.
+
+    cursor = Column(String(200))  # Newest item seen (fullname, video ID, page token)
+    last_seen_at = Column(DateTime(timezone=True))  # Created time of that item
+    last_run_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    checkpoint_metadata = Column(JSON)  # Source-specific extras
+
+    __table_args__ = (
+        Index('uq_ingest_checkpoint_scope', 'platform', 'scope', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<IngestCheckpoint(platform={self.platform}, scope={self.scope}, cursor={self.cursor})>"
@@ -2,12 +2,23 @@
 Raw signal model with trend association support
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Index
+import hashlib
+
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, String, Float, DateTime, JSON, Index, ForeignKey, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
 
+def hash_identifier(identifier: str) -> str:
+    """md5 hex of a signal identifier; matches PostgreSQL md5(identifier)"""
+    return hashlib.md5(identifier.encode('utf-8')).hexdigest()
+
+
+def _default_identifier_hash(context) -> str:
+    return hash_identifier(context.get_current_parameters()['identifier'])
+
+
 class RawSignal(Base):
     """
     Raw data points collected from various platforms (Reddit, YouTube, TikTok, etc.)
@@ -21,6 +32,7 @@ class RawSignal(Base):
     platform = Column(String(50), nullable=False, index=True)  # reddit, youtube, tiktok, instagram
     signal_type = Column(String(50), nullable=False)  # post, video, hashtag, search_volume
     identifier = Column(String(500), nullable=False)  # URL, post ID, video ID, etc.
+    identifier_hash = Column(String(32), nullable=False, default=_default_identifier_hash)  # md5(identifier), dedup key
     
     # Content information
     title = Column(String(500))
@@ -34,6 +46,9 @@ class RawSignal(Base):
     # Metadata (flexible JSON for platform-specific data)
     signal_metadata = Column(JSON)  # author, subreddit, hashtags, detected_trends, keywords
     
+    # TrendExtractor.version whose associations this signal has (NULL = not extracted yet)
+    extractor_version = Column(String(20))
+    
     # Timestamps
     collected_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     content_created_at = Column(DateTime(timezone=True), index=True)
@@ -49,6 +64,10 @@ class RawSignal(Base):
     __table_args__ = (
         Index('idx_platform_category_created', 'platform', 'category', 'content_created_at'),
         Index('idx_category_collected', 'category', 'collected_at'),
+        # Dedup lookups and ON CONFLICT target for bulk upserts
+        Index('uq_raw_signals_identifier_hash', 'identifier_hash', unique=True),
+        # Backlog of the post-ingest ExtractionWorker, in id order
+        Index('idx_raw_signals_unextracted', 'id', postgresql_where=text('extractor_version IS NULL')),
     )
 
     def __repr__(self):
@@ -68,4 +87,50 @@ class RawSignal(Base):
             'signal_metadata': self.signal_metadata,
             'collected_at': self.collected_at.isoformat() if self.collected_at else None,
             'content_created_at': self.content_created_at.isoformat() if self.content_created_at else None
-        }
\ No newline at end of file
+        }
+
+
+class SignalMetricSnapshot(Base):
+    """
+    Append-only history of a signal's metric, one row per scrape that saw
+    it. raw_signals.metric_value only holds the latest value; these rows
+    show how it grew. Old rows are thinned out by SnapshotRetention.
+    """
+    __tablename__ = "signal_metric_snapshots"
+
+    id = Column(BigInteger, primary_key=True)
+    signal_id = Column(Integer, ForeignKey('raw_signals.id', ondelete='CASCADE'), nullable=False)
+    observed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    metric_value = Column(Float, nullable=False)
+
+    __table_args__ = (
+        # Per-signal history in time order
+        Index('idx_snapshot_signal_observed', 'signal_id', 'observed_at'),
+        # Retention sweeps by age
+        Index('idx_snapshot_observed', 'observed_at'),
+    )
+
+    def __repr__(self):
+        return f"<SignalMetricSnapshot(signal_id={self.signal_id}, observed_at={self.observed_at}, value={self.metric_value})>"
+
+
+class TrendInterestPoint(Base):
+    """
+    One Google Trends interest reading (0-100) for a signal's keyword at
+    one point of the series. Each scrape appends the points of its window;
+    a timestamp already stored takes the newer reading.
+    """
+    __tablename__ = "google_trends_interest"
+
+    id = Column(BigInteger, primary_key=True)
+    signal_id = Column(Integer, ForeignKey('raw_signals.id', ondelete='CASCADE'), nullable=False)
+    observed_at = Column(DateTime(timezone=True), nullable=False)  # Start of the interval
+    interest = Column(SmallInteger, nullable=False)
+
+    __table_args__ = (
+        # Dedup key, ON CONFLICT target and range reads per keyword
+        Index('uq_trends_interest_signal_time', 'signal_id', 'observed_at', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<TrendInterestPoint(signal_id={self.signal_id}, observed_at={self.observed_at}, interest={self.interest})>"
@@ -0,0 +1,3 @@
+"""
+Benchmarks for Seer backend services
+"""
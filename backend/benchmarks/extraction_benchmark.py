@@ -0,0 +1,205 @@
+"""
+Throughput benchmark for the trend extraction layer.
+Runs TrendExtractor entry points and normalization helpers over a fixed,
+seeded synthetic corpus at several scales and reports titles/sec,
+p50/p99 per-title latency and peak traced memory. Results are written as
+JSON (one file per commit) so regressions can be diffed across commits.
+
+Usage (from backend/):
+    python -m benchmarks.extraction_benchmark
+    python -m benchmarks.extraction_benchmark --scales 1000,10000 --mode fast
+    python -m benchmarks.extraction_benchmark --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic_corpus import generate_titles
+from services.ingestion.title_prefilter import TitlePrefilter
+from services.ingestion.trend_extractor import TrendExtractor
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return 'unknown'
+
+
+def per_title_scenarios(extractor: TrendExtractor) -> Dict[str, Callable]:
+    """Scenarios timed one title at a time (real per-title latency)"""
+    return {
+        'extract_from_title': lambda title, category: extractor.extract_from_title(title, category=category),
+        'normalize_phrase': lambda title, category: extractor.normalize_phrase(title),
+        'extract_hashtags': lambda title, category: extractor.extract_hashtags(title),
+        'extract_capitalized_phrases': lambda title, category: extractor.extract_capitalized_phrases(title),
+    }
+
+
+def batch_scenarios(extractor: TrendExtractor, workers: int) -> Dict[str, Callable]:
+    """Scenarios timed over the whole corpus (throughput only)"""
+    scenarios = {
+        'extract_batch': lambda titles, categories: extractor.extract_batch(titles, categories),
+        'extract_stream': lambda titles, categories: extractor.extract_stream(iter(titles), iter(categories)),
+    }
+    if workers > 1:
+        scenarios[f'extract_batch_x{workers}'] = (
+            lambda titles, categories: extractor.extract_batch(titles, categories, workers=workers)
+        )
+    return scenarios
+
+
+def run_per_title(fn: Callable, corpus: List) -> Dict:
+    latencies = []
+    start = time.perf_counter()
+    for title, category in corpus:
+        t0 = time.perf_counter()
+        fn(title, category)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'seconds': round(elapsed, 4),
+        'titles_per_sec': round(len(corpus) / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 4),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 4),
+    }
+
+
+def run_batch(fn: Callable, corpus: List) -> Dict:
+    titles = [title for title, _ in corpus]
+    categories = [category for _, category in corpus]
+
+    start = time.perf_counter()
+    fn(titles, categories)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'seconds': round(elapsed, 4),
+        'titles_per_sec': round(len(corpus) / elapsed, 1) if elapsed else None,
+        'p50_ms': None,
+        'p99_ms': None,
+    }
+
+
+def peak_memory_mb(run: Callable) -> float:
+    """Peak Python heap allocated while `run` executes (separate, traced pass)"""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / (1024 * 1024), 2)
+
+
+def run_benchmarks(scales: List[int], mode: str, seed: int, workers: int, memory: bool,
+                   prefilter: bool = False) -> Dict:
+    extractor = TrendExtractor(mode=mode, prefilter=TitlePrefilter() if prefilter else None)
+
+    # Load NLTK resources before anything is timed
+    extractor.extract_from_title("Warm up the tagger #warmup")
+
+    results = []
+    for scale in scales:
+        corpus = generate_titles(scale, seed=seed)
+        logger.info(f"Scale {scale}:")
+
+        runs = [(name, fn, run_per_title) for name, fn in per_title_scenarios(extractor).items()]
+        runs += [(name, fn, run_batch) for name, fn in batch_scenarios(extractor, workers).items()]
+
+        for name, fn, runner in runs:
+            result = runner(fn, corpus)
+            if memory:
+                result['peak_mem_mb'] = peak_memory_mb(lambda: runner(fn, corpus))
+            result.update({'scenario': name, 'scale': scale})
+            results.append(result)
+
+            latency = (f"p50={result['p50_ms']}ms p99={result['p99_ms']}ms"
+                       if result['p50_ms'] is not None else "p50/p99 n/a (batch)")
+            logger.info(f"  {name:<30} {result['titles_per_sec']:>12} titles/sec"
+                        f"  {latency}  peak={result.get('peak_mem_mb')}MB")
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'mode': mode,
+        'seed': seed,
+        'workers': workers,
+        'prefilter': extractor.prefilter.stats() if extractor.prefilter else None,
+        'results': results,
+    }
+
+
+def compare(report: Dict, baseline_path: str):
+    """Log titles/sec change per scenario/scale against an earlier report"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    previous = {(r['scenario'], r['scale']): r for r in baseline['results']}
+    logger.info(f"Compared with {baseline.get('commit')} ({baseline_path}):")
+    for result in report['results']:
+        old = previous.get((result['scenario'], result['scale']))
+        if not old or not old['titles_per_sec'] or not result['titles_per_sec']:
+            continue
+        change = (result['titles_per_sec'] / old['titles_per_sec'] - 1) * 100
+        logger.info(f"  {result['scenario']:<30} {result['scale']:>7}  {change:+.1f}% titles/sec")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the trend extraction layer")
+    parser.add_argument('--scales', default='1000,10000,100000', help="comma-separated corpus sizes")
+    parser.add_argument('--mode', default='full', choices=['full', 'fast'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=1, help="also benchmark extract_batch with N processes")
+    parser.add_argument('--prefilter', action='store_true', help="enable the title prefilter")
+    parser.add_argument('--no-memory', action='store_true', help="skip the traced peak-memory pass")
+    parser.add_argument('--output', help="results path (default: benchmarks/results/extraction-<commit>.json)")
+    parser.add_argument('--compare', help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',') if s]
+    report = run_benchmarks(scales, args.mode, args.seed, args.workers, memory=not args.no_memory,
+                            prefilter=args.prefilter)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"extraction-{report['commit']}-{args.mode}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Results written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
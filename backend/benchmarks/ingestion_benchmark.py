@@ -0,0 +1,199 @@
+"""
+End-to-end ingestion benchmark over replayed HTTP fixtures.
+Runs the Reddit, YouTube and Google Trends scrapers through SourceRunner
+with INGEST_HTTP_FIXTURES=replay (no network or credentials) against the
+configured database and reports signals/sec, DB statements/sec and rows
+written/sec per source. Results are written as JSON (one file per commit)
+so regressions can be diffed across commits.
+
+Writes real rows: point DATABASE_URL at a throwaway, migrated Postgres.
+
+Usage (from backend/):
+    python -m benchmarks.ingestion_benchmark --generate
+    python -m benchmarks.ingestion_benchmark --fixtures-dir fixtures/recorded --sources reddit
+    python -m benchmarks.ingestion_benchmark --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+
+from app.config import settings
+from benchmarks.extraction_benchmark import RESULTS_DIR, git_commit
+from benchmarks.synthetic_fixtures import write_fixtures
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SOURCES = ('reddit', 'youtube', 'google_trends')
+
+
+class StatementCounter:
+    """Counts statements and affected rows on an engine while attached"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = 0
+        self.rows_written = 0
+        self._lock = threading.Lock()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        written = statement.lstrip()[:6].upper() in ('INSERT', 'UPDATE', 'DELETE')
+        with self._lock:
+            self.statements += 1
+            if written and cursor.rowcount and cursor.rowcount > 0:
+                self.rows_written += cursor.rowcount
+
+    def __enter__(self) -> 'StatementCounter':
+        event.listen(self.engine, 'after_cursor_execute', self._after_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'after_cursor_execute', self._after_execute)
+
+
+def configure_replay(fixtures_dir: str):
+    """Serve every scraper from fixtures and take pacing out of the measurement"""
+    settings.INGEST_HTTP_FIXTURES = 'replay'
+    settings.INGEST_HTTP_FIXTURES_DIR = fixtures_dir
+    settings.GOOGLE_TRENDS_CACHE_TTL_HOURS = 0
+    settings.GOOGLE_TRENDS_RATE_PER_SECOND = 1000.0
+    settings.GOOGLE_TRENDS_MAX_RATE_PER_SECOND = 1000.0
+    settings.YOUTUBE_QUOTA_PER_RUN = 10 ** 9
+
+    # PRAW refuses to build a client without credentials, even for replay
+    settings.REDDIT_CLIENT_ID = settings.REDDIT_CLIENT_ID or 'fixture'
+    settings.REDDIT_CLIENT_SECRET = settings.REDDIT_CLIENT_SECRET or 'fixture'
+
+
+def source_runs(posts_per_subreddit: int) -> Dict[str, Callable[[], Dict[str, int]]]:
+    """One callable per source, returning signals saved per category"""
+    from app.database import get_db
+
+    def reddit():
+        from services.ingestion.reddit_scraper import RedditScraper
+
+        scraper = RedditScraper()
+        scraper.rate_limit = None  # Replayed responses carry no real rate-limit headers
+        return scraper.scrape_all_categories(posts_per_subreddit=posts_per_subreddit, incremental=False)
+
+    def youtube():
+        from services.ingestion.youtube_scraper import CATEGORY_KEYWORDS, YouTubeScraper
+
+        db = next(get_db())
+        try:
+            return YouTubeScraper('fixture').scrape_categories(list(CATEGORY_KEYWORDS.keys()), db)
+        finally:
+            db.close()
+
+    def google_trends():
+        from services.ingestion.google_trends_scraper import CATEGORY_KEYWORDS, GoogleTrendsScraper
+
+        db = next(get_db())
+        try:
+            return GoogleTrendsScraper().scrape_categories(list(CATEGORY_KEYWORDS.keys()), db)
+        finally:
+            db.close()
+
+    return {'reddit': reddit, 'youtube': youtube, 'google_trends': google_trends}
+
+
+def run_benchmarks(sources: List[str], fixtures_dir: str, posts_per_subreddit: int) -> Dict:
+    configure_replay(fixtures_dir)
+    from app.database import engine
+
+    runs = source_runs(posts_per_subreddit)
+    results = []
+    for source in sources:
+        with StatementCounter(engine) as counter:
+            start = time.perf_counter()
+            saved = runs[source]()
+            elapsed = time.perf_counter() - start
+
+        signals = sum(saved.values())
+        result = {
+            'source': source,
+            'signals': signals,
+            'seconds': round(elapsed, 4),
+            'signals_per_sec': round(signals / elapsed, 1) if elapsed else None,
+            'db_statements': counter.statements,
+            'db_statements_per_sec': round(counter.statements / elapsed, 1) if elapsed else None,
+            'rows_written': counter.rows_written,
+            'rows_written_per_sec': round(counter.rows_written / elapsed, 1) if elapsed else None,
+        }
+        results.append(result)
+        logger.info(f"  {source:<15} {result['signals_per_sec']:>10} signals/sec"
+                    f"  {result['db_statements_per_sec']:>10} statements/sec"
+                    f"  {result['rows_written_per_sec']:>10} rows/sec  ({signals} signals)")
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'fixtures_dir': fixtures_dir,
+        'posts_per_subreddit': posts_per_subreddit,
+        'results': results,
+    }
+
+
+def compare(report: Dict, baseline_path: str):
+    """Log signals/sec change per source against an earlier report"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    previous = {r['source']: r for r in baseline['results']}
+    logger.info(f"Compared with {baseline.get('commit')} ({baseline_path}):")
+    for result in report['results']:
+        old = previous.get(result['source'])
+        if not old or not old['signals_per_sec'] or not result['signals_per_sec']:
+            continue
+        change = (result['signals_per_sec'] / old['signals_per_sec'] - 1) * 100
+        logger.info(f"  {result['source']:<15} {change:+.1f}% signals/sec")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end ingestion over replayed HTTP fixtures")
+    parser.add_argument('--sources', default=','.join(SOURCES), help="comma-separated sources to run")
+    parser.add_argument('--fixtures-dir', default=os.path.join('fixtures', 'synthetic'))
+    parser.add_argument('--generate', action='store_true', help="write synthetic fixtures to --fixtures-dir first")
+    parser.add_argument('--posts-per-subreddit', type=int, default=100)
+    parser.add_argument('--videos-per-keyword', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="results path (default: benchmarks/results/ingestion-<commit>.json)")
+    parser.add_argument('--compare', help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    sources = [s for s in args.sources.split(',') if s]
+    unknown = set(sources) - set(SOURCES)
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(sorted(unknown))}")
+
+    if args.generate:
+        write_fixtures(args.fixtures_dir, args.posts_per_subreddit, args.videos_per_keyword,
+                       points=168, seed=args.seed)
+
+    report = run_benchmarks(sources, args.fixtures_dir, args.posts_per_subreddit)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"ingestion-{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Results written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
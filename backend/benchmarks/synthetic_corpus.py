@@ -0,0 +1,89 @@
+"""
+Deterministic synthetic social-media titles for benchmarks.
+Titles mix recurring trend phrases (Zipf-distributed, so some trends are
+hot and most are long-tail), brands, hashtags, emoji, questions, filler
+and some non-English titles, roughly in the shape of Reddit/YouTube
+titles per category.
+The same seed always produces the same corpus.
+"""
+
+import random
+from typing import List, Tuple
+
+TREND_PHRASES = {
+    "Beauty": ["glass skin routine", "dopamine makeup", "clean girl aesthetic", "slugging",
+               "skin cycling", "latte makeup", "lip oil", "blush draping"],
+    "Fashion": ["quiet luxury", "dopamine dressing", "coastal grandmother", "mob wife aesthetic",
+                "capsule wardrobe", "ballet flats", "barrel jeans"],
+    "Food": ["cottage cheese ice cream", "butter board", "smashed burger", "protein pudding",
+             "air fryer recipe", "girl dinner"],
+    "Fitness": ["hot girl walk", "zone 2 training", "pilates princess", "75 hard",
+                "weighted vest walk", "hybrid training"],
+    "Tech": ["vision pro", "mechanical keyboard", "ai pin", "foldable phone",
+             "local llm", "mini pc"],
+    "Gaming": ["cozy games", "roguelike deckbuilder", "speedrun strats", "handheld pc"],
+    "Home": ["cluttercore", "japandi interior", "smart lighting", "peel and stick wallpaper"],
+    "Travel": ["slow travel", "workation", "set jetting", "hush trips"],
+}
+
+BRANDS = ["Glossier", "Sephora", "Uniqlo", "Zara", "Apple", "Samsung", "Nintendo", "IKEA",
+          "Trader Joes", "Lululemon", "Stanley", "Dyson", "CeraVe", "Rare Beauty"]
+
+TEMPLATES = [
+    "My {Trend} finally worked after {n} weeks",
+    "Anyone else trying the {trend}?",
+    "{Trend} is changing my life",
+    "How to get {trend} in {n} steps #{tag}",
+    "Honest review: {brand} {trend} {emoji}",
+    "Is {trend} still a thing in {year}?",
+    "I tried {trend} for {n} days and here's what happened",
+    "{brand} just dropped something for {trend} fans {emoji}{emoji}",
+    "PSA: {trend} tips nobody tells you",
+    "Unpopular opinion: {trend} is overrated",
+    "{Trend} vs {other} - which one?",
+    "Day {n} of {trend} #{tag} #{tag2}",
+    "Best {brand} haul ever",
+    "Quick question about my setup",
+    "{emoji}{emoji}{emoji}",
+    "Help",
+    "What do you think?",
+    "Mi rutina de {trend} para la noche {emoji}",
+    "Das ist mein neues {trend} Setup für {year}",
+    "Le meilleur {trend} pour la rentrée",
+    "今日の{trend}ルーティン",
+]
+
+EMOJI = ["✨", "\U0001F525", "\U0001F60D", "\U0001F480", "\U0001F64F", "\U0001F4AF"]
+
+
+def _zipf_choice(rng: random.Random, items: List[str], s: float = 1.2) -> str:
+    weights = [1.0 / (rank ** s) for rank in range(1, len(items) + 1)]
+    return rng.choices(items, weights=weights, k=1)[0]
+
+
+def generate_titles(n: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """Return n (title, category) pairs; identical for identical (n, seed)"""
+    rng = random.Random(seed)
+    categories = list(TREND_PHRASES)
+    titles = []
+
+    for _ in range(n):
+        category = rng.choice(categories)
+        trend = _zipf_choice(rng, TREND_PHRASES[category])
+        other = rng.choice(TREND_PHRASES[category])
+        template = rng.choice(TEMPLATES)
+
+        title = template.format(
+            trend=trend,
+            Trend=trend.title(),
+            other=other,
+            brand=rng.choice(BRANDS),
+            tag=trend.replace(' ', ''),
+            tag2=category.lower(),
+            n=rng.randint(2, 90),
+            year=rng.choice([2024, 2025, 2026]),
+            emoji=rng.choice(EMOJI),
+        )
+        titles.append((title, category))
+
+    return titles
@@ -0,0 +1,218 @@
+"""
+Synthetic HTTP fixtures for offline ingestion runs.
+Writes reddit.jsonl, youtube.jsonl and google_trends.jsonl in the format
+of services.ingestion.http_fixtures, shaped like the real API responses
+the scrapers parse (PRAW listings, YouTube search/videos resources,
+pytrends explore/multiline payloads), with titles from the seeded
+synthetic corpus. The same (scale, seed) always produces the same files.
+
+Usage (from backend/):
+    python -m benchmarks.synthetic_fixtures --posts-per-subreddit 500 --videos-per-keyword 200
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.synthetic_corpus import generate_titles
+from services.ingestion.reddit_scraper import SUBREDDIT_MAP
+from services.ingestion.youtube_scraper import CATEGORY_KEYWORDS as YOUTUBE_KEYWORDS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REDDIT_OAUTH = "https://oauth.reddit.com"
+YOUTUBE_API = "https://youtube.googleapis.com/youtube/v3"
+TRENDS_API = "https://trends.google.com/trends"
+
+JSON_HEADERS = {'content-type': 'application/json; charset=UTF-8'}
+
+
+def _entry(method: str, url: str, body, params: Dict = None, headers: Dict = None) -> Dict:
+    return {
+        'method': method,
+        'url': url,
+        'params': params,
+        'status': 200,
+        'headers': headers or JSON_HEADERS,
+        'body': body if isinstance(body, str) else json.dumps(body),
+    }
+
+
+def _base36(number: int) -> str:
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    out = ''
+    while True:
+        number, remainder = divmod(number, 36)
+        out = digits[remainder] + out
+        if not number:
+            return out
+
+
+def reddit_fixtures(posts_per_subreddit: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    now = int(time.time())
+    titles = iter(generate_titles(posts_per_subreddit * sum(len(s) for s in SUBREDDIT_MAP.values()), seed=seed))
+    entries = [
+        _entry('POST', 'https://www.reddit.com/api/v1/access_token', {
+            'access_token': 'fixture', 'token_type': 'bearer', 'expires_in': 86400, 'scope': '*'
+        }),
+        # Metric refreshes find nothing new
+        _entry('GET', f"{REDDIT_OAUTH}/api/info/", {'kind': 'Listing', 'data': {'after': None, 'children': []}}),
+    ]
+
+    post_number = 0
+    for subreddits in SUBREDDIT_MAP.values():
+        combined = []
+        for subreddit in subreddits:
+            children = []
+            for _ in range(posts_per_subreddit):
+                post_number += 1
+                post_id = _base36(36 ** 5 + post_number)
+                title, _ = next(titles)
+                children.append({'kind': 't3', 'data': {
+                    'id': post_id,
+                    'name': f"t3_{post_id}",
+                    'title': title,
+                    'selftext': '',
+                    'author': f"user{rng.randint(1, 50000)}",
+                    'subreddit': subreddit,
+                    'subreddit_name_prefixed': f"r/{subreddit}",
+                    'permalink': f"/r/{subreddit}/comments/{post_id}/{title[:30].lower().replace(' ', '_')}/",
+                    'url': f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/",
+                    'score': rng.randint(1, 20000),
+                    'upvote_ratio': round(rng.uniform(0.6, 1.0), 2),
+                    'num_comments': rng.randint(0, 2000),
+                    'total_awards_received': rng.randint(0, 5),
+                    'is_original_content': False,
+                    'link_flair_text': None,
+                    'created_utc': float(now - rng.randint(60, 86400)),
+                    'stickied': False,
+                }})
+            combined.extend(children)
+
+            listing = {'kind': 'Listing', 'data': {'after': None, 'children': children}}
+            entries.append(_entry('GET', f"{REDDIT_OAUTH}/r/{subreddit}/top", listing))
+            entries.append(_entry('GET', f"{REDDIT_OAUTH}/r/{subreddit}/new", listing))
+
+        # REDDIT_MULTIREDDIT listings
+        combined.sort(key=lambda child: -child['data']['created_utc'])
+        listing = {'kind': 'Listing', 'data': {'after': None, 'children': combined}}
+        entries.append(_entry('GET', f"{REDDIT_OAUTH}/r/{'+'.join(subreddits)}/top", listing))
+        entries.append(_entry('GET', f"{REDDIT_OAUTH}/r/{'+'.join(subreddits)}/new", listing))
+
+    return entries
+
+
+def youtube_fixtures(videos_per_keyword: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    keywords = sorted({keyword for keywords in YOUTUBE_KEYWORDS.values() for keyword in keywords})
+    titles = iter(generate_titles(videos_per_keyword * len(keywords), seed=seed))
+    entries = []
+    videos = []
+
+    for k, keyword in enumerate(keywords):
+        ids = [f"yt{k:03d}{i:07d}" for i in range(videos_per_keyword)]
+        entries.append(_entry('GET', f"{YOUTUBE_API}/search", {
+            'kind': 'youtube#searchListResponse',
+            'items': [{'kind': 'youtube#searchResult', 'id': {'kind': 'youtube#video', 'videoId': i}} for i in ids],
+        }, params={'q': keyword}))
+
+        for video_id in ids:
+            title, _ = next(titles)
+            videos.append({
+                'kind': 'youtube#video',
+                'id': video_id,
+                'snippet': {
+                    'title': title,
+                    'description': title,
+                    'channelTitle': f"channel{rng.randint(1, 5000)}",
+                    'channelId': f"UC{rng.randint(10 ** 8, 10 ** 9)}",
+                    'publishedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() - rng.randint(60, 86400))),
+                    'tags': [keyword],
+                    'categoryId': '22',
+                },
+                'statistics': {
+                    'viewCount': str(rng.randint(100, 5_000_000)),
+                    'likeCount': str(rng.randint(0, 200_000)),
+                    'commentCount': str(rng.randint(0, 10_000)),
+                },
+                'contentDetails': {'duration': f"PT{rng.randint(10, 59)}S"},
+            })
+
+    # FixtureHttp narrows this to the requested ids of each videos().list call
+    entries.append(_entry('GET', f"{YOUTUBE_API}/videos", {'kind': 'youtube#videoListResponse', 'items': videos}))
+    return entries
+
+
+def google_trends_fixtures(points: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    now = int(time.time()) // 3600 * 3600
+    timeline = [
+        {
+            'time': str(now - (points - i) * 3600),
+            'formattedTime': time.strftime('%b %d, %Y at %H:%M', time.gmtime(now - (points - i) * 3600)),
+            # Up to 5 keywords per payload; columns beyond the payload's keywords are ignored
+            'value': [rng.randint(0, 100) for _ in range(5)],
+            'hasData': [True] * 5,
+        }
+        for i in range(points)
+    ]
+    timeline[-1]['isPartial'] = True
+
+    explore = ")]}'" + json.dumps({'widgets': [
+        {'id': 'TIMESERIES', 'token': 'fixture', 'request': {'time': 'now 7-d', 'resolution': 'HOUR'}}
+    ]})
+    html = {'content-type': 'text/html; charset=UTF-8'}
+
+    # pytrends strips the anti-JSON-hijacking prefix (4 and 5 characters).
+    # Cookie URL and explore method differ between pytrends releases; both are served.
+    return [
+        _entry('GET', f"{TRENDS_API}/", '', headers=html),
+        _entry('GET', f"{TRENDS_API}/explore/", '', headers=html),
+        _entry('POST', f"{TRENDS_API}/api/explore", explore),
+        _entry('GET', f"{TRENDS_API}/api/explore", explore),
+        _entry('GET', f"{TRENDS_API}/api/widgetdata/multiline", ")]}'," + json.dumps({
+            'default': {'timelineData': timeline}
+        })),
+    ]
+
+
+def write_fixtures(directory: str, posts_per_subreddit: int, videos_per_keyword: int,
+                   points: int, seed: int) -> Dict[str, int]:
+    """Write all three fixture files; returns entries per platform"""
+    os.makedirs(directory, exist_ok=True)
+    generated = {
+        'reddit': reddit_fixtures(posts_per_subreddit, seed),
+        'youtube': youtube_fixtures(videos_per_keyword, seed),
+        'google_trends': google_trends_fixtures(points, seed),
+    }
+    for platform, entries in generated.items():
+        path = os.path.join(directory, f"{platform}.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        logger.info(f"Wrote {len(entries)} fixtures to {path}")
+    return {platform: len(entries) for platform, entries in generated.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic scraper HTTP fixtures")
+    parser.add_argument('--output-dir', default=os.path.join('fixtures', 'synthetic'))
+    parser.add_argument('--posts-per-subreddit', type=int, default=100)
+    parser.add_argument('--videos-per-keyword', type=int, default=50)
+    parser.add_argument('--points', type=int, default=168, help="hourly Google Trends points (168 = 7 days)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    write_fixtures(args.output_dir, args.posts_per_subreddit, args.videos_per_keyword, args.points, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
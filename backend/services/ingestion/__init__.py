@@ -3,7 +3,26 @@ Seer Data Ingestion Services
 Scrapers for collecting trend signals from various platforms
 """
 
-from .reddit_scraper import RedditScraper
-from .google_trends_scraper import GoogleTrendsScraper
+import importlib
 
-__all__ = ['RedditScraper', 'GoogleTrendsScraper']
\ No newline at end of file
+# Scrapers are imported on first access so that importing this package
+# (or a lightweight submodule like trend_extractor) doesn't pull in
+# praw/pytrends/SQLAlchemy up front.
+_LAZY_EXPORTS = {
+    'RedditScraper': '.reddit_scraper',
+    'GoogleTrendsScraper': '.google_trends_scraper',
+    'YouTubeScraper': '.youtube_scraper',
+    'SignalSource': '.sources',
+    'SourceRunner': '.sources',
+    'ExtractionWorker': '.extraction_worker',
+}
+
+__all__ = ['RedditScraper', 'GoogleTrendsScraper', 'YouTubeScraper', 'SignalSource', 'SourceRunner',
+           'ExtractionWorker']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
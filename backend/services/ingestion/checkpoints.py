@@ -0,0 +1,97 @@
+"""
+Read and advance ingest_checkpoints for incremental scrapes.
+Checkpoints for a platform are loaded once at run start; fetch threads
+read the in-memory copy and the writer advances them after each
+successful save.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.ingest_checkpoint import IngestCheckpoint
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """High-water marks for one platform, keyed by scope."""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self._marks: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> 'CheckpointStore':
+        rows = db.query(IngestCheckpoint).filter(IngestCheckpoint.platform == self.platform)
+        with self._lock:
+            self._marks = {
+                row.scope: {
+                    'cursor': row.cursor,
+                    'last_seen_at': row.last_seen_at,
+                    'last_run_at': row.last_run_at,
+                    'metadata': row.checkpoint_metadata or {},
+                }
+                for row in rows
+            }
+        logger.info(f"Loaded {len(self._marks)} {self.platform} checkpoints")
+        return self
+
+    def get(self, scope: str) -> Optional[Dict]:
+        with self._lock:
+            return self._marks.get(scope)
+
+    def advance(
+        self,
+        db: Session,
+        scope: str,
+        cursor: Optional[str],
+        last_seen_at: Optional[datetime],
+        metadata: Optional[Dict] = None
+    ):
+        """
+        Move a scope's mark forward (never backwards) with one upsert.
+        The caller commits.
+        """
+        current = self.get(scope)
+        if current and current['last_seen_at'] and last_seen_at and last_seen_at < current['last_seen_at']:
+            return
+
+        now = datetime.now(timezone.utc)
+        table = IngestCheckpoint.__table__
+        stmt = insert(table).values(
+            platform=self.platform,
+            scope=scope,
+            cursor=cursor,
+            last_seen_at=last_seen_at,
+            last_run_at=now,
+            checkpoint_metadata=metadata,
+        )
+        # Another run may have moved the stored mark further already
+        is_newer = or_(
+            table.c.last_seen_at.is_(None),
+            stmt.excluded.last_seen_at >= table.c.last_seen_at
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.platform, table.c.scope],
+            set_={
+                'cursor': case((is_newer, stmt.excluded.cursor), else_=table.c.cursor),
+                'last_seen_at': func.greatest(table.c.last_seen_at, stmt.excluded.last_seen_at),
+                'last_run_at': stmt.excluded.last_run_at,
+                'checkpoint_metadata': stmt.excluded.checkpoint_metadata,
+            }
+        ))
+
+        with self._lock:
+            self._marks[scope] = {
+                'cursor': cursor,
+                'last_seen_at': last_seen_at,
+                'last_run_at': now,
+                'metadata': metadata or {},
+            }
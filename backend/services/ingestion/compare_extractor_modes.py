@@ -0,0 +1,137 @@
+"""
+Compare TrendExtractor 'full' and 'fast' modes on the same corpus.
+Reports titles/sec for each mode and how much of the full mode's output
+the fast mode recovers, to pick a mode per deployment.
+
+Usage:
+    python -m services.ingestion.compare_extractor_modes --corpus titles.txt
+    python -m services.ingestion.compare_extractor_modes --from-db --limit 20000
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+from services.ingestion.trend_extractor import TrendExtractor
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_corpus_file(path: str, limit: int = None) -> List[str]:
+    """One title per line; blank lines are skipped"""
+    with open(path, encoding='utf-8') as f:
+        titles = [line.strip() for line in f if line.strip()]
+    return titles[:limit] if limit else titles
+
+
+def load_corpus_db(limit: int) -> List[str]:
+    """Most recently collected signal titles"""
+    from app.database import SessionLocal
+    from app.models.signal import RawSignal
+
+    db = SessionLocal()
+    try:
+        rows = db.query(RawSignal.title).filter(
+            RawSignal.title.isnot(None)
+        ).order_by(RawSignal.collected_at.desc()).limit(limit).all()
+        return [row.title for row in rows]
+    finally:
+        db.close()
+
+
+def run_mode(mode: str, titles: List[str], batch_size: int = 500) -> Dict:
+    """Extract every title in `mode`; returns timing and per-title phrase sets"""
+    extractor = TrendExtractor(mode=mode)
+
+    # Load NLTK resources outside the timed region
+    extractor.extract_many(titles[:1])
+
+    start = time.perf_counter()
+    results = []
+    for i in range(0, len(titles), batch_size):
+        results.extend(extractor.extract_many(titles[i:i + batch_size]))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'mode': mode,
+        'seconds': round(elapsed, 3),
+        'titles_per_sec': round(len(titles) / elapsed, 1) if elapsed else None,
+        'phrase_sets': [
+            {trend['normalized'] for trend in result['trend_phrases']}
+            for result in results
+        ],
+    }
+
+
+def compare_phrases(full_sets: List[set], fast_sets: List[set], top_k: int = 100) -> Dict:
+    """Per-title and corpus-level overlap of fast-mode phrases with full-mode phrases"""
+    shared = sum(len(a & b) for a, b in zip(full_sets, fast_sets))
+    full_total = sum(len(a) for a in full_sets)
+    fast_total = sum(len(b) for b in fast_sets)
+
+    jaccards = [
+        len(a & b) / len(a | b)
+        for a, b in zip(full_sets, fast_sets)
+        if a or b
+    ]
+
+    # Corpus-level: do both modes surface the same recurring phrases?
+    full_counts = Counter(p for phrases in full_sets for p in phrases)
+    fast_counts = Counter(p for phrases in fast_sets for p in phrases)
+    full_top = {p for p, c in full_counts.most_common(top_k) if c >= 2}
+    fast_top = {p for p, c in fast_counts.most_common(top_k) if c >= 2}
+
+    return {
+        'phrase_recall': round(shared / full_total, 4) if full_total else None,
+        'phrase_precision': round(shared / fast_total, 4) if fast_total else None,
+        'mean_title_jaccard': round(sum(jaccards) / len(jaccards), 4) if jaccards else None,
+        f'top_{top_k}_overlap': round(len(full_top & fast_top) / len(full_top), 4) if full_top else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full vs fast TrendExtractor modes")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--corpus', help="file with one title per line")
+    source.add_argument('--from-db', action='store_true', help="use recent raw_signals titles")
+    parser.add_argument('--limit', type=int, default=10000, help="max titles to use")
+    parser.add_argument('--json', help="also write the report to this path")
+    args = parser.parse_args()
+
+    titles = load_corpus_file(args.corpus, args.limit) if args.corpus else load_corpus_db(args.limit)
+    if not titles:
+        logger.error("Corpus is empty")
+        return 1
+
+    logger.info(f"Comparing extractor modes on {len(titles)} titles")
+    full = run_mode('full', titles)
+    fast = run_mode('fast', titles)
+
+    report = {
+        'titles': len(titles),
+        'full': {k: v for k, v in full.items() if k != 'phrase_sets'},
+        'fast': {k: v for k, v in fast.items() if k != 'phrase_sets'},
+        'speedup': round(full['seconds'] / fast['seconds'], 2) if fast['seconds'] else None,
+        'overlap': compare_phrases(full['phrase_sets'], fast['phrase_sets']),
+    }
+
+    logger.info(f"  full: {report['full']['titles_per_sec']} titles/sec")
+    logger.info(f"  fast: {report['fast']['titles_per_sec']} titles/sec ({report['speedup']}x)")
+    for metric, value in report['overlap'].items():
+        logger.info(f"  {metric}: {value}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
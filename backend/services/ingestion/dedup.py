@@ -0,0 +1,96 @@
+"""
+Per-run signal dedup shared by the scrapers.
+Keeps the identifier hashes already seen this run (preloaded from recent
+raw_signals plus everything written since) in memory, so most "does this
+signal exist?" checks never reach the database. The rest go out as one
+IN query on the indexed identifier_hash column per batch.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Set
+
+from sqlalchemy.orm import Session
+
+from app.models.signal import RawSignal, hash_identifier
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SeenSignals:
+    """
+    In-memory set of signal identifiers already seen this run (saved, or
+    found in raw_signals). Stores 16-byte md5 digests rather than
+    identifier strings.
+    """
+
+    def __init__(self):
+        self._seen: Set[bytes] = set()
+        self.memory_hits = 0
+        self.db_lookups = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, identifier: str) -> bool:
+        return bytes.fromhex(hash_identifier(identifier)) in self._seen
+
+    def add(self, identifier: str):
+        self._seen.add(bytes.fromhex(hash_identifier(identifier)))
+
+    def add_many(self, identifiers: Iterable[str]):
+        for identifier in identifiers:
+            self.add(identifier)
+
+    def preload(self, db: Session, platform: str, days: int = 7) -> int:
+        """Load hashes of this platform's recently collected signals in one streaming query"""
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        rows = db.query(RawSignal.identifier_hash).filter(
+            RawSignal.platform == platform,
+            RawSignal.collected_at >= since
+        ).yield_per(10000)
+
+        before = len(self._seen)
+        for (identifier_hash,) in rows:
+            self._seen.add(bytes.fromhex(identifier_hash))
+
+        loaded = len(self._seen) - before
+        logger.info(f"Preloaded {loaded} {platform} signal hashes from the last {days} days")
+        return loaded
+
+    def existing(self, db: Session, identifiers: List[str]) -> Set[str]:
+        """
+        Identifiers that already exist, checking memory first and the
+        database (one IN query) only for the rest. Everything found is
+        remembered for the rest of the run.
+        """
+        existing = set()
+        unknown = {}
+        for identifier in identifiers:
+            identifier_hash = hash_identifier(identifier)
+            if bytes.fromhex(identifier_hash) in self._seen:
+                existing.add(identifier)
+            else:
+                unknown[identifier_hash] = identifier
+
+        self.memory_hits += len(existing)
+        if not unknown:
+            return existing
+
+        self.db_lookups += 1
+        found = db.query(RawSignal.identifier_hash).filter(
+            RawSignal.identifier_hash.in_(list(unknown))
+        ).all()
+        for (identifier_hash,) in found:
+            self._seen.add(bytes.fromhex(identifier_hash))
+            existing.add(unknown[identifier_hash])
+
+        return existing
+
+    def stats(self):
+        return {
+            'seen': len(self._seen),
+            'memory_hits': self.memory_hits,
+            'db_lookups': self.db_lookups,
+        }
@@ -0,0 +1,308 @@
+"""
+Persistent cache for TrendExtractor results.
+Reddit's daily top listings overlap heavily between runs, so most titles
+were already extracted a few hours earlier. Results are keyed by a hash of
+the normalized title plus the extractor version and stored either in Redis
+or in a local SQLite file (the stand-in when Redis isn't configured).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title for cache keying.
+    Case is kept on purpose: capitalized-phrase extraction depends on it.
+    """
+    title = unicodedata.normalize('NFC', title)
+    return ' '.join(title.split())
+
+
+def make_cache_key(title: str, version: str) -> str:
+    """Hash of extractor version + normalized title"""
+    payload = f"{version}\x00{normalize_title(title)}".encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()
+
+
+class LocalCacheBackend:
+    """
+    SQLite-backed cache file with TTL and least-recently-used eviction.
+    Safe to share between processes; each process opens its own connection.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200_000, ttl_seconds: int = 72 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._writes_since_prune = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Connections can't cross process boundaries; reopen lazily
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_used "
+                "ON extraction_cache (last_used)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Return {key: raw value} for the keys that are cached and fresh"""
+        if not keys:
+            return {}
+
+        now = time.time()
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value FROM extraction_cache "
+                    f"WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, now - self.ttl_seconds)
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                conn.executemany(
+                    "UPDATE extraction_cache SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+        return found
+
+    def set_many(self, items: Dict[str, str]):
+        """Store raw values and evict the least recently used overflow"""
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO extraction_cache (key, value, created_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, value, now, now) for key, value in items.items()]
+            )
+
+            # Checking the table size on every write is wasteful; prune in steps
+            self._writes_since_prune += len(items)
+            if self._writes_since_prune >= max(self.max_entries // 20, 100):
+                self._prune(conn, now)
+                self._writes_since_prune = 0
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then the oldest ones beyond max_entries"""
+        expired = conn.execute(
+            "DELETE FROM extraction_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,)
+        ).rowcount
+
+        size = conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+        overflow = size - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM extraction_cache WHERE key IN ("
+                " SELECT key FROM extraction_cache ORDER BY last_used LIMIT ?)",
+                (overflow,)
+            )
+
+        self.evictions += expired + max(overflow, 0)
+
+    def size(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache. Entries expire after the TTL; size is bounded by
+    the TTL plus the server's maxmemory eviction policy.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 72 * 3600, prefix: str = "seer:extraction:"):
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.evictions = 0  # Redis evicts server-side; not observable here
+        self._client = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_client'] = None
+        return state
+
+    def _connect(self):
+        if self._client is None:
+            import redis
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    def ping(self) -> bool:
+        try:
+            return bool(self._connect().ping())
+        except Exception as e:
+            logger.warning(f"Redis unavailable at {self.url}: {e}")
+            return False
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        values = self._connect().mget([self.prefix + key for key in keys])
+        return {
+            key: value.decode('utf-8')
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    def set_many(self, items: Dict[str, str]):
+        if not items:
+            return
+        pipe = self._connect().pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self.prefix + key, value, ex=self.ttl_seconds)
+        pipe.execute()
+
+    def size(self) -> int:
+        # Counting keys needs a SCAN; not worth it for stats
+        return -1
+
+
+class ExtractionCache:
+    """
+    Memoizes extract_from_title results across scrape runs.
+    Tracks hit/miss counters; backend errors degrade to cache misses.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls) -> Optional['ExtractionCache']:
+        """
+        Build the cache configured in app settings.
+        Falls back to the local SQLite file when Redis isn't reachable.
+        Returns None when caching is disabled.
+        """
+        from app.config import settings
+
+        backend_name = settings.EXTRACTION_CACHE_BACKEND.lower()
+        ttl_seconds = settings.EXTRACTION_CACHE_TTL_HOURS * 3600
+
+        if backend_name == 'none':
+            return None
+
+        if backend_name == 'redis':
+            backend = RedisCacheBackend(settings.REDIS_URL, ttl_seconds=ttl_seconds)
+            if backend.ping():
+                logger.info("Extraction cache: redis")
+                return cls(backend)
+            logger.warning("Extraction cache: falling back to local SQLite")
+
+        logger.info(f"Extraction cache: local ({settings.EXTRACTION_CACHE_PATH})")
+        return cls(LocalCacheBackend(
+            settings.EXTRACTION_CACHE_PATH,
+            max_entries=settings.EXTRACTION_CACHE_MAX_ENTRIES,
+            ttl_seconds=ttl_seconds
+        ))
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """Return {key: cached result} for the keys that hit"""
+        try:
+            raw = self.backend.get_many(keys)
+        except Exception as e:
+            logger.error(f"Extraction cache read failed: {e}")
+            self.errors += 1
+            raw = {}
+
+        self.hits += len(raw)
+        self.misses += len(keys) - len(raw)
+        return {key: json.loads(value) for key, value in raw.items()}
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.get_many([key]).get(key)
+
+    def set_many(self, results: Dict[str, Dict]):
+        try:
+            self.backend.set_many({key: json.dumps(value) for key, value in results.items()})
+        except Exception as e:
+            logger.error(f"Extraction cache write failed: {e}")
+            self.errors += 1
+
+    def set(self, key: str, result: Dict):
+        self.set_many({key: result})
+
+    def take_counters(self) -> Dict[str, int]:
+        """
+        Counters since the last call, then reset them. Pool workers send
+        these back so the parent's stats() covers their lookups too.
+        """
+        counters = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'errors': self.errors,
+            'evictions': self.backend.evictions,
+        }
+        self.hits = self.misses = self.errors = 0
+        self.backend.evictions = 0
+        return counters
+
+    def add_counters(self, counters: Dict[str, int]):
+        """Fold in counters taken from a pool worker's copy of this cache"""
+        self.hits += counters['hits']
+        self.misses += counters['misses']
+        self.errors += counters['errors']
+        self.backend.evictions += counters['evictions']
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for logging and monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'errors': self.errors,
+            'evictions': self.backend.evictions,
+        }
@@ -0,0 +1,250 @@
+"""
+Post-ingest trend extraction for every platform.
+Scrapers only store signals; this worker picks up the ones not yet
+extracted by the current TrendExtractor version (raw_signals.extractor_version)
+and links them to detected trends in large batches:
+    select next batch (id order) -> extract (process pool) -> write_trends + mark_extracted -> commit
+Each platform contributes the text that describes it best: Reddit titles,
+YouTube titles plus the first description line and tags, Google Trends
+search keywords (often one word, so they bypass the title prefilter).
+Results are stored as detected_trends and associations only;
+signal_metadata is left as the scraper wrote it. Bumping EXTRACTOR_VERSION
+(or switching TREND_EXTRACTOR_MODE) queues every signal again; associations
+from the earlier version are kept.
+"""
+
+import os
+import re
+import sys
+import logging
+import time
+from typing import Dict, List, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.config import settings
+from app.models.signal import RawSignal
+from services.ingestion.extraction_cache import ExtractionCache
+from services.ingestion.persistence import BulkSignalWriter
+from services.ingestion.phrase_matcher import KnownPhraseMatcher
+from services.ingestion.phrase_registry import PhraseRegistry
+from services.ingestion.title_prefilter import TitlePrefilter
+from services.ingestion.trend_extractor import TrendExtractor, extract_titles
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# YouTube text: the first description line and a few tags next to the title
+MAX_DESCRIPTION_CHARS = 200
+MAX_TAGS = 10
+
+
+def signal_text(platform: str, title: Optional[str], content_preview: Optional[str],
+                metadata: Optional[Dict]) -> str:
+    """Text a signal is extracted from"""
+    metadata = metadata or {}
+    title = title or ''
+
+    if platform == 'youtube':
+        parts = [title]
+        description = (content_preview or '').strip().split('\n', 1)[0][:MAX_DESCRIPTION_CHARS]
+        if description and description != title:
+            parts.append(description)
+        # Tags read as hashtags (spaces dropped: "glass skin" -> #glassskin)
+        tags = [re.sub(r'\W', '', tag) for tag in (metadata.get('tags') or [])[:MAX_TAGS]]
+        parts.append(' '.join(f"#{tag}" for tag in tags if tag))
+        return ' '.join(part for part in parts if part)
+
+    if platform == 'google_trends':
+        return metadata.get('keyword') or title
+
+    return title
+
+
+class ExtractionWorker:
+    """
+    Links stored signals to detected trends, batch by batch.
+
+    Args:
+        extractor: TrendExtractor to run (defaults to one built from settings)
+        batch_size: Signals selected, extracted and written per transaction
+        processes: Extraction processes (0 = extract in this process)
+        platforms: Only these platforms (default: all)
+    """
+
+    def __init__(
+        self,
+        extractor: Optional[TrendExtractor] = None,
+        batch_size: Optional[int] = None,
+        processes: Optional[int] = None,
+        platforms: Optional[List[str]] = None
+    ):
+        self.extractor = extractor or TrendExtractor(
+            cache=ExtractionCache.from_settings(),
+            mode=settings.TREND_EXTRACTOR_MODE,
+            prefilter=TitlePrefilter() if settings.TITLE_PREFILTER_ENABLED else None
+        )
+        self.batch_size = batch_size or settings.EXTRACTION_WORKER_BATCH_SIZE
+        self.processes = settings.EXTRACTION_WORKER_PROCESSES if processes is None else processes
+        self.platforms = platforms
+        # Phrases created since the pool started, sent to its workers' matchers
+        self._new_phrases: List = []
+
+    def requeue_stale(self, db: Session) -> int:
+        """Queue signals extracted by another extractor version again (commits)"""
+        try:
+            requeued = db.query(RawSignal).filter(
+                RawSignal.extractor_version != self.extractor.version
+            ).update({RawSignal.extractor_version: None}, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        if requeued:
+            logger.info(f"Re-queued {requeued} signals extracted by an earlier extractor version")
+        return requeued
+
+    def pending(self, db: Session, after_id: int = 0) -> List:
+        """Next batch of unextracted signals after `after_id`, in id order"""
+        query = db.query(
+            RawSignal.id,
+            RawSignal.platform,
+            RawSignal.title,
+            RawSignal.content_preview,
+            RawSignal.category,
+            RawSignal.signal_metadata,
+            RawSignal.content_created_at,
+        ).filter(
+            RawSignal.extractor_version.is_(None),
+            RawSignal.id > after_id
+        )
+        if self.platforms:
+            query = query.filter(RawSignal.platform.in_(self.platforms))
+        return query.order_by(RawSignal.id).limit(self.batch_size).all()
+
+    def _extract(self, texts: List[str], categories: List[str], unfiltered: List[bool], pool) -> List[Dict]:
+        if pool is None:
+            return self.extractor.extract_many(texts, categories, unfiltered)
+
+        # One chunk per process; map keeps chunk order
+        size = -(-len(texts) // self.processes)
+        chunks = [
+            (texts[i:i + size], categories[i:i + size], unfiltered[i:i + size], self._new_phrases)
+            for i in range(0, len(texts), size)
+        ]
+        results = []
+        for chunk_results, counters in pool.map(extract_titles, chunks):
+            results.extend(chunk_results)
+            self.extractor.add_counters(counters)
+        return results
+
+    def process_batch(self, db: Session, rows: List, registry: PhraseRegistry, pool=None) -> Dict:
+        """Extract one batch, write its trends and associations and mark it (commits)"""
+        texts = [
+            signal_text(row.platform, row.title, row.content_preview, row.signal_metadata)
+            for row in rows
+        ]
+        categories = [row.category or 'unknown' for row in rows]
+        unfiltered = [row.platform == 'google_trends' for row in rows]
+        results = self._extract(texts, categories, unfiltered, pool)
+
+        signals = [
+            (row.id, {
+                'category': category,
+                'content_created_at': row.content_created_at,
+                'signal_metadata': {
+                    'detected_trends': trend_data['trend_phrases'],
+                    'keywords': trend_data['keywords'],
+                    'hashtags': trend_data['hashtags'],
+                },
+            })
+            for row, category, trend_data in zip(rows, categories, results)
+        ]
+
+        writer = BulkSignalWriter(registry, snapshots=False)
+        stats = None
+        try:
+            stats = writer.write_trends(db, signals)
+            writer.mark_extracted(db, [row.id for row in rows], self.extractor.version)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Rolled-back phrase IDs must not stay registered
+            if stats is not None:
+                registry.forget(stats['new_trend_keys'])
+            raise
+        return stats
+
+    def run(self, db: Session, max_batches: Optional[int] = None) -> Dict:
+        """
+        Extract every pending signal (or `max_batches` batches).
+
+        Returns:
+            Stats dict: signals, batches, failed_batches, trends_created,
+            associations_created, seconds, signals_per_sec
+        """
+        start = time.perf_counter()
+        totals = {'signals': 0, 'batches': 0, 'failed_batches': 0, 'trends_created': 0, 'associations_created': 0}
+
+        self.requeue_stale(db)
+
+        # Already-tracked phrases are matched even where NLP would miss them
+        registry = PhraseRegistry.from_db(db)
+        matcher = KnownPhraseMatcher()
+        matcher.add_many(registry.keys())
+        self.extractor.phrase_matcher = matcher
+        self._new_phrases = []
+
+        pool = self.extractor.worker_pool(self.processes) if self.processes > 0 else None
+        after_id = 0
+        try:
+            while max_batches is None or totals['batches'] + totals['failed_batches'] < max_batches:
+                rows = self.pending(db, after_id)
+                if not rows:
+                    break
+                after_id = rows[-1].id
+
+                try:
+                    stats = self.process_batch(db, rows, registry, pool)
+                except Exception as e:
+                    # Left unextracted for the next run
+                    logger.error(f"Extraction batch ending at signal {after_id} failed: {str(e)}")
+                    totals['failed_batches'] += 1
+                    continue
+
+                matcher.add_many(stats['new_trend_keys'])
+                self._new_phrases.extend(stats['new_trend_keys'])
+                totals['signals'] += len(rows)
+                totals['batches'] += 1
+                totals['trends_created'] += stats['trends_created']
+                totals['associations_created'] += stats['associations_created']
+                logger.info(
+                    f"Extracted {len(rows)} signals: {stats['trends_created']} new trends, "
+                    f"{stats['associations_created']} new associations"
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        elapsed = time.perf_counter() - start
+        totals['seconds'] = round(elapsed, 2)
+        totals['signals_per_sec'] = round(totals['signals'] / elapsed, 1) if elapsed else None
+        logger.info(f"Extraction worker finished: {totals}")
+        return totals
+
+
+def main():
+    """Extract every pending signal once (schedule after the scrapers)"""
+    db = next(get_db())
+    try:
+        ExtractionWorker().run(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
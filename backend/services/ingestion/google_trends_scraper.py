@@ -6,11 +6,11 @@ No API key required!
 
 import os
 import sys
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional, Tuple
 import json
-import time
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -19,8 +19,12 @@ from pytrends.request import TrendReq
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.signal import RawSignal
 from app.config import settings
+from services.ingestion.extraction_cache import LocalCacheBackend
+from services.ingestion.rate_limit import AdaptiveTokenBucket
+from services.ingestion.interest_series import InterestSeries
+from services.ingestion.resilience import GOOGLE_TRENDS_HOST, RetryPolicy, retry_after, status_code
+from services.ingestion.sources import SignalSource, SourceRunner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -87,11 +91,40 @@ CATEGORY_KEYWORDS = {
 }
 
 
-class GoogleTrendsScraper:
+def _is_rate_limited(error: Exception) -> bool:
+    """pytrends raises TooManyRequestsError or a ResponseError carrying the 429"""
+    return type(error).__name__ == 'TooManyRequestsError' or status_code(error) == 429
+
+
+class GoogleTrendsScraper(SignalSource):
+    platform = "google_trends"
+    fetch_workers = 1  # TrendReq keeps per-payload state; one request at a time
+    
     def __init__(self):
         """Initialize Google Trends client"""
-        self.pytrends = TrendReq(hl='en-US', tz=0)
+        super().__init__()
+        self.pytrends = None  # Created on first use: its constructor already fetches a cookie
         self.timeframe = 'now 7-d'  # Last 7 days
+        self.categories = list(CATEGORY_KEYWORDS.keys())
+        self.series = InterestSeries()  # Hourly points in google_trends_interest
+        
+        # Identical payloads within the TTL are served from disk
+        self.cache = LocalCacheBackend(
+            settings.GOOGLE_TRENDS_CACHE_PATH,
+            ttl_seconds=settings.GOOGLE_TRENDS_CACHE_TTL_HOURS * 3600
+        ) if settings.GOOGLE_TRENDS_CACHE_TTL_HOURS > 0 else None
+        self.cache_hits = 0
+        # Payloads written this run, cached once their batch has committed
+        self._written: Dict[str, str] = {}
+        
+        # Google publishes no limits: start at a safe pace, speed up while
+        # requests succeed, halve and back off on 429s
+        self.bucket = AdaptiveTokenBucket(
+            rate=settings.GOOGLE_TRENDS_RATE_PER_SECOND,
+            max_rate=settings.GOOGLE_TRENDS_MAX_RATE_PER_SECOND
+        )
+        # 429s, server errors and timeouts are retried with jittered backoff
+        self.resilience = RetryPolicy.from_settings(max_attempts=settings.GOOGLE_TRENDS_MAX_RETRIES + 1)
         
     def calculate_velocity(self, trend_data: List[int]) -> float:
         """
@@ -134,11 +167,20 @@ class GoogleTrendsScraper:
         score = (avg_interest * 0.4) + (peak_interest * 0.3) + (velocity * 0.3)
         return round(score, 2)
     
-    def get_interest_over_time(self, keywords: List[str]) -> Dict:
-        """
-        Get interest over time for keywords
-        Returns data for each keyword
-        """
+    def payload_key(self, keywords: List[str]) -> str:
+        """Cache key for one build_payload request"""
+        payload = json.dumps({
+            'keywords': keywords,
+            'cat': 0,
+            'timeframe': self.timeframe,
+            'geo': '',
+            'gprop': ''
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def _request_interest(self, keywords: List[str]):
+        """One paced build_payload + interest_over_time round trip"""
+        self.bucket.acquire()
         try:
             # Google Trends allows max 5 keywords at once
             self.pytrends.build_payload(
@@ -151,124 +193,191 @@ class GoogleTrendsScraper:
             
             # Get interest over time
             interest_df = self.pytrends.interest_over_time()
-            
-            if interest_df.empty:
-                return {}
-            
-            # Convert to dictionary format
-            result = {}
-            for keyword in keywords:
-                if keyword in interest_df.columns:
-                    result[keyword] = {
-                        'values': interest_df[keyword].tolist(),
-                        'dates': interest_df.index.tolist()
-                    }
-            
-            return result
-            
+        except Exception as e:
+            if _is_rate_limited(e):
+                # Slow every later request down too, not just this retry
+                self.bucket.on_throttle(retry_after(e))
+            raise
+        
+        self.bucket.on_success()
+        return interest_df
+    
+    def _fetch_interest(self, keywords: List[str]) -> Dict:
+        """One paced request, retried with backoff while Google is throttling or failing"""
+        if self.pytrends is None:
+            self.pytrends = TrendReq(hl='en-US', tz=0, timeout=settings.SCRAPER_REQUEST_TIMEOUT_SECONDS)
+        
+        interest_df = self.resilience.call(GOOGLE_TRENDS_HOST, self._request_interest, keywords)
+        if interest_df.empty:
+            return {}
+        
+        # Convert to dictionary format
+        result = {}
+        for keyword in keywords:
+            if keyword in interest_df.columns:
+                result[keyword] = {
+                    'values': interest_df[keyword].tolist(),
+                    'dates': [timestamp.isoformat() for timestamp in interest_df.index]
+                }
+        
+        return result
+    
+    def cached_interest(self, keywords: List[str]) -> Optional[Dict]:
+        """Payload for keywords fetched within the cache TTL, or None"""
+        if self.cache is None:
+            return None
+        key = self.payload_key(keywords)
+        try:
+            cached = self.cache.get_many([key])
+        except Exception as e:
+            logger.error(f"Google Trends cache read failed: {e}")
+            return None
+        if key not in cached:
+            return None
+        self.cache_hits += 1
+        return json.loads(cached[key])
+    
+    def _cache_interest(self, payloads: Dict[str, str]):
+        if self.cache is None or not payloads:
+            return
+        try:
+            self.cache.set_many(payloads)
+        except Exception as e:
+            logger.error(f"Google Trends cache write failed: {e}")
+    
+    def get_interest_over_time(self, keywords: List[str]) -> Dict:
+        """
+        Get interest over time for keywords
+        Returns data for each keyword (cached on disk per payload)
+        """
+        cached = self.cached_interest(keywords)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = self._fetch_interest(keywords)
         except Exception as e:
             logger.error(f"Error fetching trends for {keywords}: {e}")
             return {}
+        
+        self._cache_interest({self.payload_key(keywords): json.dumps(result)})
+        return result
+    
+    def scrape_categories(self, categories: List[str], db: Session) -> Dict[str, int]:
+        """
+        Scrape Google Trends for several categories through the shared
+        SourceRunner (batched upserts, metric snapshots, interest series)
+        Returns number of signals saved per category
+        """
+        self.categories = categories
+        saved = SourceRunner(self).run(db)
+        return {category: saved.get(category, 0) for category in categories}
     
     def scrape_category(self, category: str, db: Session) -> int:
         """
         Scrape Google Trends for a specific category
         Returns number of signals saved
         """
-        keywords = CATEGORY_KEYWORDS.get(category, [])
-        signals_saved = 0
-        
-        logger.info(f"Scraping {category} with {len(keywords)} keywords")
+        return self.scrape_categories([category], db)[category]
+    
+    @staticmethod
+    def identifier(category: str, keyword: str) -> str:
+        return f"google_trends_{category.lower()}_{keyword.replace(' ', '_')}"
+    
+    # SignalSource plugin: one job per category batch of 5 keywords (Google Trends limit).
+    # A payload still in the cache was ingested by a recent run: it is
+    # skipped rather than written again as fresh metrics and snapshots.
+    # Payloads enter the cache only after their batch commits.
+    
+    def start(self, db: Session):
+        self._written = {}
+    
+    def jobs(self, db: Session) -> Iterable[Tuple[str, List[str]]]:
+        jobs = []
+        for category in self.categories:
+            keywords = CATEGORY_KEYWORDS.get(category, [])
+            jobs.extend((category, keywords[i:i + 5]) for i in range(0, len(keywords), 5))
+        return jobs
+    
+    def fetch(self, job: Tuple[str, List[str]]) -> Tuple[str, List[str], Dict]:
+        category, batch = job
+        if self.cached_interest(batch) is not None:
+            logger.info(f"Skipping {batch}: ingested within the last {settings.GOOGLE_TRENDS_CACHE_TTL_HOURS}h")
+            return category, batch, {}
+        try:
+            return category, batch, self._fetch_interest(batch)
+        except Exception as e:
+            logger.error(f"Error fetching trends for {batch}: {e}")
+            return category, batch, {}
+    
+    def normalize(self, payload: Tuple[str, List[str], Dict]) -> List[Dict]:
+        category, _, trends_data = payload
+        now = datetime.now(timezone.utc)
+        signals = []
         
-        # Process keywords in batches of 5 (Google Trends limit)
-        for i in range(0, len(keywords), 5):
-            batch = keywords[i:i+5]
-            
-            try:
-                # Get trend data
-                trends_data = self.get_interest_over_time(batch)
-                
-                if not trends_data:
-                    continue
-                
-                # Process each keyword
-                for keyword, data in trends_data.items():
-                    try:
-                        # Create unique identifier
-                        identifier = f"google_trends_{category.lower()}_{keyword.replace(' ', '_')}"
-                        
-                        # Check if already exists
-                        existing = db.query(RawSignal).filter(
-                            RawSignal.identifier == identifier
-                        ).first()
-                        
-                        if existing:
-                            # Update existing signal with new data
-                            existing.metric_value = self.calculate_engagement_score(data)
-                            existing.signal_metadata = {
-                                "keyword": keyword,
-                                "interest_values": data['values'],
-                                "velocity": self.calculate_velocity(data['values']),
-                                "avg_interest": round(sum(data['values']) / len(data['values']), 2),
-                                "peak_interest": max(data['values']),
-                                "timeframe": self.timeframe,
-                                "last_updated": datetime.utcnow().isoformat()
-                            }
-                            existing.collected_at = datetime.utcnow()
-                            continue
-                        
-                        # Calculate metrics
-                        engagement = self.calculate_engagement_score(data)
-                        velocity = self.calculate_velocity(data['values'])
-                        
-                        # Create metadata
-                        metadata = {
-                            "keyword": keyword,
-                            "interest_values": data['values'],
-                            "velocity": velocity,
-                            "avg_interest": round(sum(data['values']) / len(data['values']), 2),
-                            "peak_interest": max(data['values']),
-                            "timeframe": self.timeframe
-                        }
-                        
-                        # Create signal
-                        signal = RawSignal(
-                            platform="google_trends",
-                            signal_type="search_volume",
-                            identifier=identifier,
-                            title=f"Search interest: {keyword}",
-                            content_preview=f"Google Trends data for '{keyword}' in {category} category",
-                            category=category,
-                            metric_name="interest_score",
-                            metric_value=engagement,
-                            signal_metadata=metadata,
-                            content_created_at=datetime.utcnow() - timedelta(days=7)  # Start of tracking period
-                        )
-                        
-                        db.add(signal)
-                        signals_saved += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing keyword '{keyword}': {e}")
-                        continue
-                
-                # Commit after each batch
-                try:
-                    db.commit()
-                    logger.info(f"  Batch complete: {signals_saved} signals saved so far")
-                except Exception as e:
-                    logger.error(f"Database commit error: {e}")
-                    db.rollback()
-                
-                # Rate limiting - be nice to Google
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing batch {batch}: {e}")
-                time.sleep(5)  # Longer wait on error
+        for keyword, data in trends_data.items():
+            values = data['values']
+            if not values:
                 continue
+            
+            signals.append({
+                "platform": "google_trends",
+                "signal_type": "search_volume",
+                "identifier": self.identifier(category, keyword),
+                "title": f"Search interest: {keyword}",
+                "content_preview": f"Google Trends data for '{keyword}' in {category} category",
+                "category": category,
+                "metric_name": "interest_score",
+                "metric_value": self.calculate_engagement_score(data),
+                # Series points live in google_trends_interest
+                "signal_metadata": {
+                    "keyword": keyword,
+                    "velocity": self.calculate_velocity(values),
+                    "avg_interest": round(sum(values) / len(values), 2),
+                    "peak_interest": max(values),
+                    "timeframe": self.timeframe,
+                    "last_updated": now.isoformat()
+                },
+                "content_created_at": now - timedelta(days=7),  # Start of tracking period
+            })
         
-        return signals_saved
+        return signals
+    
+    def on_write(self, db: Session, payloads: List[Tuple[str, List[str], Dict]], result: Optional[Dict]):
+        """Append each keyword's series, in the same transaction as its signal"""
+        if result is None:
+            return
+        self._written.update({
+            self.payload_key(batch): json.dumps(trends_data)
+            for _, batch, trends_data in payloads
+            if trends_data
+        })
+        signal_ids = result['signal_ids']
+        self.series.write(db, [
+            point
+            for category, _, trends_data in payloads
+            for keyword, data in trends_data.items()
+            if self.identifier(category, keyword) in signal_ids
+            for point in self.series.points(
+                signal_ids[self.identifier(category, keyword)], data['dates'], data['values']
+            )
+        ])
+    
+    def on_write_failed(self, payloads: List[Tuple[str, List[str], Dict]]):
+        # Rolled back: fetch these again next run
+        for _, batch, _ in payloads:
+            self._written.pop(self.payload_key(batch), None)
+    
+    def finish(self, db: Session):
+        self._cache_interest(self._written)
+        self._written = {}
+    
+    def stats(self) -> Dict:
+        return {
+            'requests': self.bucket.stats(),
+            'cache_hits': self.cache_hits,
+            'resilience': self.resilience.stats(),
+        }
 
 
 def main():
@@ -283,29 +392,10 @@ def main():
     # Get database session
     db = next(get_db())
     
-    total_signals = 0
-    category_counts = {}
-    
     try:
-        # Scrape each category
-        for category in CATEGORY_KEYWORDS.keys():
-            try:
-                logger.info(f"\n{'='*50}")
-                logger.info(f"Processing: {category}")
-                logger.info(f"{'='*50}")
-                
-                count = scraper.scrape_category(category, db)
-                category_counts[category] = count
-                total_signals += count
-                
-                logger.info(f"✓ {category}: {count} signals saved")
-                
-                # Small delay between categories
-                time.sleep(3)
-                
-            except Exception as e:
-                logger.error(f"Error scraping {category}: {e}")
-                continue
+        # All categories go through one paced, batched run
+        category_counts = scraper.scrape_categories(list(CATEGORY_KEYWORDS.keys()), db)
+        total_signals = sum(category_counts.values())
         
         logger.info(f"\n{'='*50}")
         logger.info(f"Scraping complete! Total signals: {total_signals}")
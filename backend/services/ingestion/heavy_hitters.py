@@ -0,0 +1,84 @@
+"""
+Bounded-memory heavy-hitter counting (Space-Saving algorithm).
+Used by TrendExtractor.extract_stream to track candidate phrases over
+streams far larger than memory, e.g. backfills over millions of signals.
+"""
+
+import heapq
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
+
+
+class SpaceSaving:
+    """
+    Space-Saving top-K counter (Metwally et al.) with at most `capacity` keys.
+
+    When a new key arrives and the table is full, the key with the smallest
+    count is evicted and the newcomer inherits that count as its error.
+    For every monitored key: count - error <= true count <= count, and any
+    key seen more than N / capacity times is guaranteed to be monitored.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.evictions = 0
+        # key -> [count, error, payload]
+        self._entries: Dict[Hashable, List] = {}
+        # Min-heap of (count, tick, key); stale entries are skipped lazily
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def offer(self, key: Hashable, new_payload: Callable[[], Any]) -> Any:
+        """
+        Count one occurrence of `key` and return its payload.
+        `new_payload` builds a fresh payload when the key starts being
+        monitored (including after evicting another key).
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[0] += 1
+        else:
+            if len(self._entries) < self.capacity:
+                entry = [1, 0, new_payload()]
+            else:
+                min_count, victim = self._pop_min()
+                del self._entries[victim]
+                self.evictions += 1
+                entry = [min_count + 1, min_count, new_payload()]
+            self._entries[key] = entry
+
+        self._push(key, entry[0])
+        return entry[2]
+
+    def _push(self, key: Hashable, count: int):
+        self._tick += 1
+        heapq.heappush(self._heap, (count, self._tick, key))
+
+        # Keep the heap bounded too: rebuild from live counts when it bloats
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [
+                (entry[0], i, k) for i, (k, entry) in enumerate(self._entries.items())
+            ]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, Hashable]:
+        """Pop the monitored key with the smallest count"""
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == count:
+                return count, key
+
+    def items(self) -> Iterator[Tuple[Hashable, int, int, Any]]:
+        """Yield (key, count, error, payload) for every monitored key"""
+        for key, (count, error, payload) in self._entries.items():
+            yield key, count, error, payload
+
+    @property
+    def max_error(self) -> int:
+        """Largest overestimate of any monitored count"""
+        return max((entry[1] for entry in self._entries.values()), default=0)
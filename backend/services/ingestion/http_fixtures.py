@@ -0,0 +1,260 @@
+"""
+Record/replay HTTP fixtures for the scraper clients.
+PRAW (via prawcore) and pytrends talk HTTP through requests.Session;
+googleapiclient talks through an httplib2-style `http` object. Both are
+intercepted here, so a live run can be captured to local JSON-lines files
+and served back later with no credentials or network access (offline
+profiling, benchmarks/ingestion_benchmark.py).
+
+Fixture files hold one response per line:
+    {"method": "GET", "url": "https://oauth.reddit.com/r/gaming/top",
+     "params": {"t": "day", "limit": "25"}, "status": 200,
+     "headers": {...}, "body": "..."}
+A request is served by the entry with the same method and URL whose
+params are all present in the request (the most specific entry wins);
+"params": null matches any query, which is what synthetic fixtures use.
+Repeated recordings of the same request are served in turn.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Credentials and per-request noise never written to or matched against fixtures
+IGNORED_PARAMS = {
+    'key', 'access_token', 'refresh_token', 'client_secret', 'password', 'code',
+    'alt', 'prettyPrint',
+}
+
+# Token fields replaced in recorded response bodies (e.g. Reddit's OAuth response)
+REDACTED_FIELDS = ('access_token', 'refresh_token', 'id_token')
+
+# Response headers worth keeping (content type and rate-limit state)
+KEPT_HEADERS = ('content-type', 'x-ratelimit-remaining', 'x-ratelimit-used', 'x-ratelimit-reset', 'retry-after')
+
+MODES = ('off', 'record', 'replay')
+
+
+class FixtureMissing(LookupError):
+    """Replay found no fixture for a request (never falls through to the network)"""
+
+
+def split_request(url: str, params: Optional[Dict] = None, data=None) -> Tuple[str, Dict[str, str]]:
+    """Query-less URL and the string params of a request (query string + params + form body)"""
+    parts = urlsplit(url)
+    merged = dict(parse_qsl(parts.query, keep_blank_values=True))
+    for extra in (params, data):
+        if isinstance(extra, dict):
+            merged.update({key: str(value) for key, value in extra.items() if value is not None})
+    merged = {key: value for key, value in merged.items() if key not in IGNORED_PARAMS}
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', '')), merged
+
+
+def redact(body: str) -> str:
+    """Replace token fields of a JSON response body"""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(payload, dict) or not any(field in payload for field in REDACTED_FIELDS):
+        return body
+    for field in REDACTED_FIELDS:
+        if field in payload:
+            payload[field] = 'fixture'
+    return json.dumps(payload)
+
+
+class FixtureStore:
+    """One platform's fixture file, loaded for replay or appended while recording."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[Tuple[str, str], List[Dict]] = {}
+        self._served: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    def load(self) -> 'FixtureStore':
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault((entry['method'], entry['url']), []).append(entry)
+        logger.info(f"Loaded {sum(len(e) for e in self._entries.values())} HTTP fixtures from {self.path}")
+        return self
+
+    def lookup(self, method: str, url: str, params: Dict[str, str]) -> Dict:
+        """Best matching fixture for a request; raises FixtureMissing"""
+        with self._lock:
+            candidates = [
+                entry for entry in self._entries.get((method.upper(), url), [])
+                if entry['params'] is None or all(params.get(k) == v for k, v in entry['params'].items())
+            ]
+            if not candidates:
+                self.misses += 1
+                raise FixtureMissing(f"No fixture for {method.upper()} {url} {params}")
+
+            # Most specific first; equally specific recordings in turn
+            specificity = max(len(entry['params'] or {}) for entry in candidates)
+            candidates = [entry for entry in candidates if len(entry['params'] or {}) == specificity]
+            key = id(candidates[0])
+            turn = self._served.get(key, 0)
+            self._served[key] = turn + 1
+            self.hits += 1
+            return candidates[turn % len(candidates)]
+
+    def record(self, method: str, url: str, params: Optional[Dict[str, str]], status: int,
+               headers: Dict[str, str], body: str):
+        entry = {
+            'method': method.upper(),
+            'url': url,
+            'params': params,
+            'status': status,
+            'headers': {k.lower(): v for k, v in headers.items() if k.lower() in KEPT_HEADERS},
+            'body': redact(body),
+        }
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._entries.setdefault((entry['method'], url), []).append(entry)
+            self.recorded += 1
+
+    def stats(self) -> Dict:
+        return {'hits': self.hits, 'misses': self.misses, 'recorded': self.recorded}
+
+
+# requests-based clients (PRAW/prawcore, pytrends)
+
+def _replay_response(entry: Dict, url: str):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = entry['status']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response._content = entry['body'].encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = url
+    response.reason = 'OK' if entry['status'] < 400 else 'Fixture error'
+    return response
+
+
+@contextmanager
+def intercept_requests(store: FixtureStore, mode: str) -> Iterator[FixtureStore]:
+    """
+    Route every requests.Session.request through the store while active
+    (process-wide, so fetch threads are covered too).
+    """
+    import requests
+
+    original = requests.Session.request
+
+    def request(session, method, url, params=None, data=None, **kwargs):
+        base_url, query = split_request(url, params, data)
+        if mode == 'replay':
+            return _replay_response(store.lookup(method, base_url, query), url)
+
+        response = original(session, method, url, params=params, data=data, **kwargs)
+        store.record(method, base_url, query, response.status_code, dict(response.headers), response.text)
+        return response
+
+    requests.Session.request = request
+    try:
+        yield store
+    finally:
+        requests.Session.request = original
+
+
+# googleapiclient (httplib2-style http object)
+
+class FixtureHttp:
+    """
+    httplib2.Http stand-in for googleapiclient.discovery.build(http=...).
+    When replaying a response whose items carry ids, only the ids asked for
+    (the `id` param) are returned, so one fixture serves any videos().list
+    batch.
+    """
+
+    def __init__(self, store: FixtureStore, mode: str, http=None):
+        self.store = store
+        self.mode = mode
+        self.http = http
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        import httplib2
+
+        base_url, query = split_request(uri)
+        if self.mode == 'record':
+            response, content = self.http.request(uri, method=method, body=body, headers=headers, **kwargs)
+            text = content.decode('utf-8') if isinstance(content, bytes) else content
+            self.store.record(method, base_url, query, int(response.status), dict(response), text)
+            return response, content
+
+        entry = self.store.lookup(method, base_url, query)
+        content = entry['body']
+        if 'id' in query and entry['params'] is None:
+            wanted = set(query['id'].split(','))
+            payload = json.loads(content)
+            payload['items'] = [item for item in payload.get('items', []) if item.get('id') in wanted]
+            content = json.dumps(payload)
+
+        response = httplib2.Response({'status': entry['status'], **entry['headers']})
+        return response, content.encode('utf-8')
+
+
+# Settings-driven entry points used by the scrapers
+
+def fixture_mode() -> str:
+    from app.config import settings
+
+    mode = (settings.INGEST_HTTP_FIXTURES or 'off').lower()
+    if mode not in MODES:
+        raise ValueError(f"INGEST_HTTP_FIXTURES must be one of {MODES}, got {mode!r}")
+    return mode
+
+
+def fixture_store(platform: str) -> FixtureStore:
+    from app.config import settings
+
+    store = FixtureStore(os.path.join(settings.INGEST_HTTP_FIXTURES_DIR, f"{platform}.jsonl"))
+    if fixture_mode() == 'replay':
+        store.load()
+    return store
+
+
+@contextmanager
+def fixtures_for(platform: str) -> Iterator[Optional[FixtureStore]]:
+    """Intercept requests-based HTTP for one platform per INGEST_HTTP_FIXTURES (no-op when off)"""
+    mode = fixture_mode()
+    if mode == 'off':
+        yield None
+        return
+
+    store = fixture_store(platform)
+    logger.info(f"HTTP fixtures: {mode} {store.path}")
+    with intercept_requests(store, mode):
+        yield store
+    logger.info(f"HTTP fixtures ({platform}): {store.stats()}")
+
+
+def google_http(platform: str, timeout: Optional[float] = None):
+    """`http` argument for googleapiclient build(), or None when fixtures are off"""
+    mode = fixture_mode()
+    if mode == 'off':
+        return None
+
+    import httplib2
+
+    return FixtureHttp(fixture_store(platform), mode, http=httplib2.Http(timeout=timeout) if mode == 'record' else None)
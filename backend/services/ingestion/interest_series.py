@@ -0,0 +1,96 @@
+"""
+Bulk writes and range reads for google_trends_interest.
+Each Google Trends scrape returns the whole window (7 days of hourly
+points); the overlap with earlier runs is deduplicated on
+(signal_id, observed_at), so the table grows only by new intervals while
+keeping history past the window.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.signal import TrendInterestPoint
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """ISO timestamp from a Trends response; naive ones are UTC (TrendReq tz=0)"""
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+class InterestSeries:
+    """Append and read per-signal interest series."""
+
+    def __init__(self, chunk_size: int = 1000):
+        self.chunk_size = chunk_size
+
+    def points(self, signal_id: int, dates: List[str], values: List[int]) -> List[Dict]:
+        """Rows for one keyword's series as returned by get_interest_over_time"""
+        return [
+            {'signal_id': signal_id, 'observed_at': parse_timestamp(date), 'interest': int(value)}
+            for date, value in zip(dates, values)
+        ]
+
+    def write(self, db: Session, rows: Iterable[Dict]) -> int:
+        """
+        Insert points; a (signal, timestamp) already stored takes the new
+        reading (the newest interval is partial until Google closes it).
+        The caller commits.
+
+        Returns:
+            Number of points written
+        """
+        # ON CONFLICT can't touch a row twice in one statement; keep the last copy
+        unique = {(row['signal_id'], row['observed_at']): row for row in rows}
+        ordered = [unique[key] for key in sorted(unique)]
+        table = TrendInterestPoint.__table__
+
+        for i in range(0, len(ordered), self.chunk_size):
+            stmt = insert(table).values(ordered[i:i + self.chunk_size])
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.signal_id, table.c.observed_at],
+                set_={'interest': stmt.excluded.interest}
+            ))
+
+        return len(ordered)
+
+    def read(
+        self,
+        db: Session,
+        signal_ids: List[int],
+        start: datetime,
+        end: Optional[datetime] = None
+    ) -> Dict[int, List[Tuple[datetime, int]]]:
+        """
+        Series of several signals over [start, end) with one indexed query.
+
+        Returns:
+            signal_id -> [(observed_at, interest), ...] in time order
+        """
+        query = db.query(
+            TrendInterestPoint.signal_id,
+            TrendInterestPoint.observed_at,
+            TrendInterestPoint.interest
+        ).filter(
+            TrendInterestPoint.signal_id.in_(signal_ids),
+            TrendInterestPoint.observed_at >= start
+        )
+        if end is not None:
+            query = query.filter(TrendInterestPoint.observed_at < end)
+
+        series = defaultdict(list)
+        for signal_id, observed_at, interest in query.order_by(
+            TrendInterestPoint.signal_id, TrendInterestPoint.observed_at
+        ):
+            series[signal_id].append((observed_at, interest))
+        return dict(series)
@@ -0,0 +1,100 @@
+"""
+NLTK model preflight for the trend extractor.
+Checks (and optionally installs) the corpora TrendExtractor needs, so that
+images/workers can be prepared ahead of time instead of downloading at import.
+
+Usage:
+    python -m services.ingestion.nltk_preflight            # check only
+    python -m services.ingestion.nltk_preflight --install  # download missing
+"""
+
+import argparse
+import logging
+import sys
+from typing import Dict, List
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# NLTK package name -> resource path used by nltk.data.find().
+# Newer NLTK releases ship punkt_tab / *_eng variants, older ones the
+# originals; only one of each pair has to be present.
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+    'stopwords': 'corpora/stopwords',
+}
+
+REQUIRED_GROUPS = [
+    ('tokenizer', ['punkt_tab', 'punkt']),
+    ('pos_tagger', ['averaged_perceptron_tagger_eng', 'averaged_perceptron_tagger']),
+    ('stopwords', ['stopwords']),
+]
+
+
+def check_nltk_data() -> Dict[str, bool]:
+    """Return {package: installed} for every known NLTK resource"""
+    import nltk
+    
+    status = {}
+    for package, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+            status[package] = True
+        except LookupError:
+            status[package] = False
+    return status
+
+
+def missing_groups(status: Dict[str, bool]) -> List[str]:
+    """Names of required resource groups with no installed package"""
+    return [
+        name for name, packages in REQUIRED_GROUPS
+        if not any(status.get(p) for p in packages)
+    ]
+
+
+def download_nltk_data(status: Dict[str, bool] = None) -> Dict[str, bool]:
+    """Download any missing NLTK packages and return the refreshed status"""
+    import nltk
+    
+    status = status or check_nltk_data()
+    for package, installed in status.items():
+        if installed:
+            continue
+        try:
+            logger.info(f"Downloading NLTK package: {package}")
+            nltk.download(package, quiet=True)
+        except Exception as e:
+            # Older NLTK indexes don't carry every variant; that's fine
+            logger.warning(f"Could not download {package}: {e}")
+    
+    return check_nltk_data()
+
+
+def main() -> int:
+    """Check or install NLTK data; exit non-zero if anything required is missing"""
+    parser = argparse.ArgumentParser(description="Check/install NLTK data for TrendExtractor")
+    parser.add_argument('--install', action='store_true', help="download missing packages")
+    args = parser.parse_args()
+    
+    status = check_nltk_data()
+    if args.install:
+        status = download_nltk_data(status)
+    
+    for package, installed in status.items():
+        logger.info(f"  {'OK     ' if installed else 'MISSING'} {package}")
+    
+    missing = missing_groups(status)
+    if missing:
+        logger.error(f"Missing NLTK data for: {', '.join(missing)}")
+        return 1
+    
+    logger.info("NLTK data ready")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
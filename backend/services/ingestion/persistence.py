@@ -0,0 +1,367 @@
+"""
+Set-based persistence for scraped signals and their detected trends.
+Writes a whole batch with a fixed number of PostgreSQL statements instead
+of per-row lookups:
+    1. upsert raw_signals          INSERT ... ON CONFLICT (identifier_hash) DO UPDATE
+    2. upsert detected_trends      INSERT ... ON CONFLICT (normalized_phrase, category) DO UPDATE
+    3. insert associations         INSERT ... ON CONFLICT DO NOTHING RETURNING
+    4. bump trend counters         UPDATE detected_trends ... FROM (VALUES ...)
+    5. append metric snapshots     INSERT INTO signal_metric_snapshots
+Steps 2-4 are also available on their own (write_trends) for signals that
+are already stored, as used by the post-ingest ExtractionWorker.
+Statements are chunked so very large batches stay under the bind
+parameter limit.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Float, Integer, JSON, String, cast, column, func, literal_column, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.signal import RawSignal, SignalMetricSnapshot, hash_identifier
+from app.models.detected_trend import DetectedTrend, SignalTrendAssociation
+from services.ingestion.phrase_registry import PhraseRegistry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Columns copied from a signal dictionary into raw_signals
+SIGNAL_COLUMNS = (
+    'platform', 'signal_type', 'identifier', 'title', 'content_preview', 'category',
+    'metric_name', 'metric_value', 'signal_metadata', 'content_created_at', 'extractor_version',
+)
+
+MAX_KEYWORDS = 20
+MAX_HASHTAGS = 10
+
+
+def _chunks(rows: List, size: int) -> Iterator[List]:
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _merge_list(current: Optional[List], incoming: List, limit: int) -> List:
+    """Union preserving first-seen order, capped at `limit` items"""
+    merged = list(dict.fromkeys((current or []) + incoming))
+    return merged[:limit]
+
+
+class BulkSignalWriter:
+    """
+    Writes batches of signal dictionaries (as built by the scrapers) with
+    their detected trends and associations in a constant number of round
+    trips. signal_count is incremented in SQL, once per newly created
+    association, so concurrent writers never lose updates. Every metric
+    written is also appended to signal_metric_snapshots unless
+    snapshots=False.
+    """
+
+    def __init__(self, registry: Optional[PhraseRegistry] = None, chunk_size: int = 1000, snapshots: bool = True):
+        self.registry = registry
+        self.chunk_size = chunk_size
+        self.snapshots = snapshots
+
+    def write(self, db: Session, signals: List[Dict]) -> Dict:
+        """
+        Upsert a batch. The caller commits (or rolls back) the session.
+
+        Args:
+            db: Database session
+            signals: List of signal dictionaries
+
+        Returns:
+            Stats dict: signals, signals_inserted, trends_created,
+            associations_created, new_trend_keys, trend_ids (all
+            (category, normalized_phrase) -> id touched by the batch),
+            signal_ids (identifier -> raw_signals.id)
+        """
+        # Later copies of the same identifier win (ON CONFLICT can't touch a row twice)
+        by_identifier = {signal['identifier']: signal for signal in signals}
+        # Rows go out in key order so concurrent writers lock them in the same order
+        signal_ids, signals_inserted = self._upsert_signals(
+            db, [by_identifier[identifier] for identifier in sorted(by_identifier)]
+        )
+        self.record_snapshots(db, [
+            {'signal_id': signal_ids[identifier], 'metric_value': signal.get('metric_value')}
+            for identifier, signal in by_identifier.items()
+        ])
+
+        stats = self.write_trends(db, [
+            (signal_ids[identifier], signal) for identifier, signal in by_identifier.items()
+        ])
+        return {
+            'signals': len(by_identifier),
+            'signals_inserted': signals_inserted,
+            **stats,
+            'signal_ids': signal_ids,
+        }
+
+    def write_trends(self, db: Session, signals: List[Tuple[int, Dict]]) -> Dict:
+        """
+        Upsert the detected trends of stored signals and link them. The
+        caller commits (or rolls back) the session.
+
+        Args:
+            db: Database session
+            signals: (raw_signals.id, signal dictionary) pairs; only category,
+                content_created_at and signal_metadata (detected_trends,
+                keywords, hashtags) are read
+
+        Returns:
+            Stats dict: trends_created, associations_created,
+            new_trend_keys, trend_ids
+        """
+        # Every (signal, phrase) mention, plus per-trend batch aggregates
+        mentions = {}
+        trend_rows = {}
+        batch_keywords = defaultdict(list)
+        batch_hashtags = defaultdict(list)
+        batch_last_seen = {}
+
+        for signal_id, signal in signals:
+            metadata = signal.get('signal_metadata') or {}
+            seen_at = signal.get('content_created_at') or datetime.now(timezone.utc)
+
+            for trend_info in metadata.get('detected_trends', []):
+                key = (signal['category'], trend_info['normalized'])
+                mentions.setdefault((signal_id, key), trend_info)
+
+                if key not in trend_rows:
+                    trend_rows[key] = {
+                        'trend_phrase': trend_info['phrase'],
+                        'normalized_phrase': key[1],
+                        'category': key[0],
+                        'keywords': metadata.get('keywords', [])[:MAX_KEYWORDS],
+                        'hashtags': metadata.get('hashtags', [])[:MAX_HASHTAGS],
+                        'signal_count': 0,
+                        'first_seen': seen_at,
+                        'last_seen': seen_at,
+                        'is_validated': False,
+                        'metadata': {
+                            'extraction_confidence': trend_info['score'],
+                            'extraction_method': trend_info['method']
+                        },
+                    }
+                batch_keywords[key].extend(metadata.get('keywords', []))
+                batch_hashtags[key].extend(metadata.get('hashtags', []))
+                batch_last_seen[key] = max(batch_last_seen.get(key, seen_at), seen_at)
+
+        trends = self._upsert_trends(db, [trend_rows[key] for key in sorted(trend_rows)])
+        trend_ids = {key: row['id'] for key, row in trends.items()}
+
+        new_pairs = self._insert_associations(db, [
+            {
+                'signal_id': signal_id,
+                'detected_trend_id': trend_ids[key],
+                'relevance_score': trend_info['score'],
+                'extraction_method': trend_info['method'],
+            }
+            for (signal_id, key), trend_info in mentions.items()
+        ])
+
+        # One counter bump per new association; keyword/hashtag merge for every touched trend
+        new_mentions = defaultdict(int)
+        for _, trend_id in new_pairs:
+            new_mentions[trend_id] += 1
+
+        self._update_trends(db, [
+            {
+                'id': row['id'],
+                'delta': new_mentions.get(row['id'], 0),
+                'last_seen': batch_last_seen[key],
+                'keywords': _merge_list(row['keywords'], batch_keywords[key], MAX_KEYWORDS),
+                'hashtags': _merge_list(row['hashtags'], batch_hashtags[key], MAX_HASHTAGS),
+            }
+            for key, row in sorted(trends.items(), key=lambda item: item[1]['id'])
+        ])
+
+        new_trend_keys = [key for key, row in trends.items() if row['inserted']]
+        if self.registry is not None:
+            for key, trend_id in trend_ids.items():
+                self.registry.register(key[0], key[1], trend_id)
+
+        return {
+            'trends_created': len(new_trend_keys),
+            'associations_created': len(new_pairs),
+            'new_trend_keys': new_trend_keys,
+            'trend_ids': trend_ids,
+        }
+
+    def _upsert_signals(self, db: Session, signals: List[Dict]) -> Tuple[Dict[str, int], int]:
+        """identifier -> id for every signal, and how many rows were new"""
+        ids = {}
+        inserted = 0
+        table = RawSignal.__table__
+
+        for chunk in _chunks(signals, self.chunk_size):
+            stmt = insert(table).values([
+                dict(
+                    {name: signal.get(name) for name in SIGNAL_COLUMNS},
+                    identifier_hash=hash_identifier(signal['identifier'])
+                )
+                for signal in chunk
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.identifier_hash],
+                set_={
+                    'metric_value': stmt.excluded.metric_value,
+                    'signal_metadata': stmt.excluded.signal_metadata,
+                    # Scrapers that don't extract inline keep the stored version
+                    'extractor_version': func.coalesce(stmt.excluded.extractor_version, table.c.extractor_version),
+                }
+            ).returning(table.c.id, table.c.identifier, literal_column('(xmax = 0)').label('inserted'))
+
+            for row in db.execute(stmt):
+                ids[row.identifier] = row.id
+                inserted += bool(row.inserted)
+
+        return ids, inserted
+
+    def _upsert_trends(self, db: Session, rows: List[Dict]) -> Dict[Tuple[str, str], Dict]:
+        """(category, normalized_phrase) -> {id, keywords, hashtags, inserted}"""
+        trends = {}
+        table = DetectedTrend.__table__
+
+        for chunk in _chunks(rows, self.chunk_size):
+            stmt = insert(table).values(chunk)
+            # A no-op update so RETURNING also yields rows that already existed
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.normalized_phrase, table.c.category],
+                set_={'normalized_phrase': stmt.excluded.normalized_phrase}
+            ).returning(
+                table.c.id, table.c.category, table.c.normalized_phrase,
+                table.c.keywords, table.c.hashtags,
+                literal_column('(xmax = 0)').label('inserted')
+            )
+
+            for row in db.execute(stmt):
+                trends[(row.category, row.normalized_phrase)] = {
+                    'id': row.id,
+                    'keywords': row.keywords,
+                    'hashtags': row.hashtags,
+                    'inserted': bool(row.inserted),
+                }
+
+        return trends
+
+    def _insert_associations(self, db: Session, rows: List[Dict]) -> List[Tuple[int, int]]:
+        """(signal_id, detected_trend_id) pairs that didn't exist yet"""
+        created = []
+        table = SignalTrendAssociation.__table__
+
+        for chunk in _chunks(rows, self.chunk_size):
+            stmt = insert(table).values(chunk).on_conflict_do_nothing(
+                index_elements=[table.c.signal_id, table.c.detected_trend_id]
+            ).returning(table.c.signal_id, table.c.detected_trend_id)
+            created.extend((row.signal_id, row.detected_trend_id) for row in db.execute(stmt))
+
+        return created
+
+    def _update_trends(self, db: Session, rows: List[Dict]):
+        """Atomic signal_count increment plus last_seen/keyword/hashtag refresh"""
+        table = DetectedTrend.__table__
+
+        for chunk in _chunks(rows, self.chunk_size):
+            batch = values(
+                column('id', Integer),
+                column('delta', Integer),
+                column('last_seen', DateTime(timezone=True)),
+                # Serialized JSON, cast back in SET
+                column('keywords', String),
+                column('hashtags', String),
+                name='batch'
+            ).data([
+                (row['id'], row['delta'], row['last_seen'],
+                 json.dumps(row['keywords']), json.dumps(row['hashtags']))
+                for row in chunk
+            ])
+
+            db.execute(
+                update(table)
+                .where(table.c.id == batch.c.id)
+                .values(
+                    signal_count=func.coalesce(table.c.signal_count, 0) + batch.c.delta,
+                    last_seen=func.greatest(table.c.last_seen, batch.c.last_seen),
+                    keywords=cast(batch.c.keywords, JSON),
+                    hashtags=cast(batch.c.hashtags, JSON),
+                )
+            )
+
+    def mark_extracted(self, db: Session, signal_ids: List[int], version: str) -> int:
+        """Stamp signals with the extractor version they were processed by. The caller commits."""
+        table = RawSignal.__table__
+        marked = 0
+        for chunk in _chunks(signal_ids, self.chunk_size):
+            result = db.execute(
+                update(table).where(table.c.id.in_(chunk)).values(extractor_version=version)
+            )
+            marked += result.rowcount
+        return marked
+
+    def refresh_metrics(self, db: Session, rows: List[Dict]) -> int:
+        """
+        Overwrite metric_value and signal_metadata of stored signals without
+        touching trends or associations. The caller commits.
+
+        Args:
+            db: Database session
+            rows: dicts with id, metric_value and signal_metadata
+
+        Returns:
+            Number of signals updated
+        """
+        table = RawSignal.__table__
+        updated = 0
+
+        for chunk in _chunks(rows, self.chunk_size):
+            batch = values(
+                column('id', Integer),
+                column('metric_value', Float),
+                # Serialized JSON, cast back in SET
+                column('signal_metadata', String),
+                name='batch'
+            ).data([
+                (row['id'], row['metric_value'], json.dumps(row['signal_metadata']))
+                for row in chunk
+            ])
+
+            result = db.execute(
+                update(table)
+                .where(table.c.id == batch.c.id)
+                .values(
+                    metric_value=batch.c.metric_value,
+                    signal_metadata=cast(batch.c.signal_metadata, JSON),
+                )
+            )
+            updated += result.rowcount
+
+        self.record_snapshots(db, [
+            {'signal_id': row['id'], 'metric_value': row['metric_value']} for row in rows
+        ])
+        return updated
+
+    def record_snapshots(self, db: Session, rows: List[Dict], observed_at: Optional[datetime] = None) -> int:
+        """
+        Append (signal_id, observed_at, metric_value) rows to the snapshot
+        history. Rows without a metric are skipped. The caller commits.
+
+        Returns:
+            Number of snapshots written
+        """
+        if not self.snapshots:
+            return 0
+
+        observed_at = observed_at or datetime.now(timezone.utc)
+        snapshots = [
+            {'signal_id': row['signal_id'], 'observed_at': observed_at, 'metric_value': row['metric_value']}
+            for row in rows if row['metric_value'] is not None
+        ]
+        for chunk in _chunks(snapshots, self.chunk_size):
+            db.execute(insert(SignalMetricSnapshot.__table__).values(chunk))
+
+        return len(snapshots)
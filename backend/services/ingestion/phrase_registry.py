@@ -0,0 +1,110 @@
+"""
+In-process (category, normalized_phrase) -> DetectedTrend.id dictionary.
+Preloaded once per scrape so saving signals doesn't need a DetectedTrend
+lookup per phrase, and so extraction output can carry integer phrase IDs.
+New phrases are assigned IDs in batches (one INSERT flush per batch).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.detected_trend import DetectedTrend
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PhraseRegistry:
+    """Interns (category, normalized_phrase) keys to detected_trends IDs."""
+
+    def __init__(self):
+        self._ids: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def from_db(cls, db: Session) -> 'PhraseRegistry':
+        """Load every tracked phrase ID in one streaming query"""
+        registry = cls()
+        rows = db.query(
+            DetectedTrend.id,
+            DetectedTrend.category,
+            DetectedTrend.normalized_phrase
+        ).yield_per(5000)
+
+        for trend_id, category, normalized in rows:
+            registry._ids[(category, normalized)] = trend_id
+
+        logger.info(f"Phrase registry loaded {len(registry)} phrase IDs")
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._ids
+
+    def keys(self) -> Iterator[Tuple[str, str]]:
+        """(category, normalized_phrase) pairs, e.g. to seed a KnownPhraseMatcher"""
+        return iter(self._ids)
+
+    def get(self, category: str, normalized_phrase: str) -> Optional[int]:
+        return self._ids.get((category, normalized_phrase))
+
+    def register(self, category: str, normalized_phrase: str, trend_id: int):
+        self._ids[(category, normalized_phrase)] = trend_id
+
+    def forget(self, keys: Iterable[Tuple[str, str]]):
+        """Drop IDs whose INSERT was rolled back"""
+        for key in keys:
+            self._ids.pop(key, None)
+
+    def annotate(self, category: str, trend_phrases: List[Dict]) -> List[Dict]:
+        """Attach `phrase_id` (None for phrases not tracked yet) to extracted phrases"""
+        for trend in trend_phrases:
+            trend['phrase_id'] = self._ids.get((category, trend['normalized']))
+        return trend_phrases
+
+    def assign_ids(self, db: Session, new_trends: Iterable[DetectedTrend]) -> Dict[Tuple[str, str], int]:
+        """
+        Insert DetectedTrend rows for phrases not tracked yet and register
+        their IDs. All rows go out in one flush. Returns the new IDs.
+        """
+        pending = [
+            trend for trend in new_trends
+            if (trend.category, trend.normalized_phrase) not in self._ids
+        ]
+        if not pending:
+            return {}
+
+        db.add_all(pending)
+        db.flush()
+
+        assigned = {}
+        for trend in pending:
+            key = (trend.category, trend.normalized_phrase)
+            self._ids[key] = assigned[key] = trend.id
+
+        logger.info(f"Assigned IDs to {len(assigned)} new phrases")
+        return assigned
+
+
+def new_detected_trend(trend_info: Dict, category: str, metadata: Dict,
+                       seen_at: Optional[datetime]) -> DetectedTrend:
+    """Build an unsaved DetectedTrend for the first signal mentioning a phrase"""
+    seen_at = seen_at or datetime.now(timezone.utc)
+    return DetectedTrend(
+        trend_phrase=trend_info['phrase'],
+        normalized_phrase=trend_info['normalized'],
+        category=category,
+        keywords=metadata.get('keywords', []),
+        hashtags=metadata.get('hashtags', []),
+        signal_count=0,
+        first_seen=seen_at,
+        last_seen=seen_at,
+        trend_metadata={
+            'extraction_confidence': trend_info['score'],
+            'extraction_method': trend_info['method']
+        }
+    )
@@ -0,0 +1,238 @@
+"""
+Staged producer/consumer ingestion pipeline.
+    jobs -> fetch threads -> [bounded queue] -> extract threads -> [bounded queue] -> writer
+Bounded queues give backpressure: a slow writer stalls extraction, which
+stalls fetching, so memory stays flat however many jobs are queued. The
+writer runs on the calling thread (so it can use the caller's DB session)
+and flushes in size- or time-based batches. Each stage reports
+throughput and queue depth.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class StageMetrics:
+    """Counters for one pipeline stage (updated from several threads)."""
+
+    def __init__(self, name: str, input_queue: Optional[queue.Queue] = None):
+        self.name = name
+        self.input_queue = input_queue
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, items_in: int, items_out: int, seconds: float, error: bool = False):
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy_seconds += seconds
+            self.errors += int(error)
+
+    def sample_queue(self):
+        if self.input_queue is not None:
+            depth = self.input_queue.qsize()
+            with self._lock:
+                self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def snapshot(self) -> Dict:
+        elapsed = time.perf_counter() - self.started
+        with self._lock:
+            return {
+                'stage': self.name,
+                'items_in': self.items_in,
+                'items_out': self.items_out,
+                'errors': self.errors,
+                'throughput_per_sec': round(self.items_out / elapsed, 2) if elapsed else None,
+                'busy_seconds': round(self.busy_seconds, 2),
+                'queue_depth': self.input_queue.qsize() if self.input_queue is not None else None,
+                'max_queue_depth': self.max_queue_depth,
+            }
+
+
+class IngestPipeline:
+    """
+    Runs fetch -> extract -> write over a set of jobs.
+
+    Args:
+        fetch: job -> payload (network bound; runs on fetch threads)
+        extract: payload -> result (runs on extract threads; hand CPU work
+            to a process pool from here)
+        write: list of results -> None (runs on the calling thread)
+        fetch_workers: Fetch threads
+        extract_workers: Extract threads
+        queue_size: Capacity of each inter-stage queue
+        batch_size: Flush the writer once pending results weigh this much
+        batch_seconds: ...or once the oldest pending result is this old
+        weight: result -> size counted against batch_size (default 1)
+        report_seconds: Log stage metrics this often (0 disables)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], Any],
+        extract: Callable[[Any], Any],
+        write: Callable[[List[Any]], None],
+        fetch_workers: int = 4,
+        extract_workers: int = 2,
+        queue_size: int = 8,
+        batch_size: int = 500,
+        batch_seconds: float = 5.0,
+        weight: Optional[Callable[[Any], int]] = None,
+        report_seconds: float = 30.0
+    ):
+        self.fetch = fetch
+        self.extract = extract
+        self.write = write
+        self.fetch_workers = fetch_workers
+        self.extract_workers = extract_workers
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.weight = weight or (lambda result: 1)
+        self.report_seconds = report_seconds
+
+        self.jobs: queue.Queue = queue.Queue()
+        self.fetched: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.extracted: queue.Queue = queue.Queue(maxsize=queue_size)
+
+        self.metrics = {
+            'fetch': StageMetrics('fetch', self.jobs),
+            'extract': StageMetrics('extract', self.fetched),
+            'write': StageMetrics('write', self.extracted),
+        }
+
+    def _fetch_loop(self):
+        stage = self.metrics['fetch']
+        while True:
+            stage.sample_queue()
+            job = self.jobs.get()
+            if job is _DONE:
+                return
+            start = time.perf_counter()
+            try:
+                payload = self.fetch(job)
+            except Exception as e:
+                logger.error(f"Fetch failed for {job}: {str(e)}")
+                stage.record(1, 0, time.perf_counter() - start, error=True)
+                continue
+            stage.record(1, 1, time.perf_counter() - start)
+            self.fetched.put(payload)  # Blocks while extraction is behind
+            self.metrics['extract'].sample_queue()
+
+    def _extract_loop(self):
+        stage = self.metrics['extract']
+        while True:
+            payload = self.fetched.get()
+            if payload is _DONE:
+                self.extracted.put(_DONE)
+                return
+            start = time.perf_counter()
+            try:
+                result = self.extract(payload)
+            except Exception as e:
+                logger.error(f"Extraction failed: {str(e)}")
+                stage.record(1, 0, time.perf_counter() - start, error=True)
+                continue
+            stage.record(1, 1, time.perf_counter() - start)
+            self.extracted.put(result)  # Blocks while the writer is behind
+            self.metrics['write'].sample_queue()
+
+    def _close_fetch(self, fetchers: List[threading.Thread]):
+        """Once every fetch thread is done, tell each extract thread to stop"""
+        for thread in fetchers:
+            thread.join()
+        for _ in range(self.extract_workers):
+            self.fetched.put(_DONE)
+
+    def _flush(self, pending: List[Any]):
+        stage = self.metrics['write']
+        start = time.perf_counter()
+        try:
+            self.write(pending)
+            stage.record(len(pending), len(pending), time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"Write of {len(pending)} results failed: {str(e)}")
+            stage.record(len(pending), 0, time.perf_counter() - start, error=True)
+
+    def report(self) -> List[Dict]:
+        return [stage.snapshot() for stage in self.metrics.values()]
+
+    def _log_report(self):
+        for snapshot in self.report():
+            logger.info(
+                f"  {snapshot['stage']:<8} {snapshot['items_out']:>6} done "
+                f"{snapshot['throughput_per_sec']}/s  queue={snapshot['queue_depth']} "
+                f"(max {snapshot['max_queue_depth']})  errors={snapshot['errors']}"
+            )
+
+    def run(self, jobs: Iterable[Any]) -> List[Dict]:
+        """Process every job; returns final per-stage metrics"""
+        for job in jobs:
+            self.jobs.put(job)
+        for _ in range(self.fetch_workers):
+            self.jobs.put(_DONE)
+
+        fetchers = [
+            threading.Thread(target=self._fetch_loop, name=f"ingest-fetch-{i}", daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        extractors = [
+            threading.Thread(target=self._extract_loop, name=f"ingest-extract-{i}", daemon=True)
+            for i in range(self.extract_workers)
+        ]
+        for thread in fetchers + extractors:
+            thread.start()
+        threading.Thread(target=self._close_fetch, args=(fetchers,), daemon=True).start()
+
+        pending = []
+        pending_weight = 0
+        oldest = None
+        running = self.extract_workers
+        last_report = time.perf_counter()
+
+        while running:
+            # Wake up for batch deadlines and periodic reports
+            timeout = self.report_seconds or None
+            if oldest is not None:
+                timeout = max(0.0, self.batch_seconds - (time.perf_counter() - oldest))
+            try:
+                result = self.extracted.get(timeout=timeout)
+            except queue.Empty:
+                result = None
+
+            if result is _DONE:
+                running -= 1
+            elif result is not None:
+                if oldest is None:
+                    oldest = time.perf_counter()
+                pending.append(result)
+                pending_weight += self.weight(result)
+
+            due = oldest is not None and time.perf_counter() - oldest >= self.batch_seconds
+            if pending and (pending_weight >= self.batch_size or due or not running):
+                self._flush(pending)
+                pending, pending_weight, oldest = [], 0, None
+
+            if self.report_seconds and time.perf_counter() - last_report >= self.report_seconds:
+                self._log_report()
+                last_report = time.perf_counter()
+
+        for thread in extractors:
+            thread.join()
+
+        logger.info("Pipeline finished:")
+        self._log_report()
+        return self.report()
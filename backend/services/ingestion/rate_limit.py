@@ -0,0 +1,203 @@
+"""
+Shared request budget for concurrent API clients.
+RateLimitBudget spaces requests so the remaining allowance in the current
+rate-limit window lasts until the window resets, and follows the limits
+the API reports back (e.g. PRAW's reddit.auth.limits after each request).
+AdaptiveTokenBucket is for APIs that publish no limits (Google Trends):
+it probes for the sustainable rate and backs off when throttled.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBudget:
+    """
+    Thread-safe request budget for one rate-limit window.
+
+    acquire() blocks until the caller may send the next request. While
+    more than `pace_below` requests remain they go out immediately; after
+    that they are spread evenly over the rest of the window (remaining /
+    seconds to reset). `reserve` requests are held back for retries and
+    other clients sharing the same credentials.
+    """
+
+    def __init__(
+        self,
+        requests_per_window: int = 100,
+        window_seconds: float = 60.0,
+        reserve: int = 5,
+        pace_below: Optional[int] = None
+    ):
+        self.requests_per_window = requests_per_window
+        self.window_seconds = window_seconds
+        self.reserve = reserve
+        # Default: pace every request
+        self.pace_below = requests_per_window if pace_below is None else pace_below
+
+        self._lock = threading.Lock()
+        self._remaining = float(requests_per_window)
+        self._reset_at = time.monotonic() + window_seconds
+        self._next_slot = 0.0
+
+        self.requests = 0
+        self.waited_seconds = 0.0
+
+    def acquire(self):
+        """Block until one request may be sent, then charge it to the budget"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._reset_at:
+                # Window rolled over without fresh headers; assume a full budget
+                self._remaining = float(self.requests_per_window)
+                self._reset_at = now + self.window_seconds
+
+            usable = self._remaining - self.reserve
+            if usable < 1:
+                # Out of budget: nothing goes out until the window resets
+                slot = self._reset_at
+            elif usable > self.pace_below:
+                slot = now
+            else:
+                interval = max(self._reset_at - now, 0.0) / usable
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + interval
+
+            self._remaining -= 1
+            self.requests += 1
+
+        wait = slot - time.monotonic()
+        if wait > 0:
+            with self._lock:
+                self.waited_seconds += wait
+            time.sleep(wait)
+
+    def update(self, limits: Optional[Dict]):
+        """
+        Sync with the limits reported by the API.
+
+        Args:
+            limits: dict with 'remaining' and 'reset_timestamp' (unix
+                seconds), as exposed by praw's reddit.auth.limits. Missing
+                values (no request made yet) are ignored.
+        """
+        if not limits:
+            return
+        remaining = limits.get('remaining')
+        reset_timestamp = limits.get('reset_timestamp')
+        if remaining is None or reset_timestamp is None:
+            return
+
+        with self._lock:
+            reset_at = time.monotonic() + max(reset_timestamp - time.time(), 0.0)
+            if reset_at > self._reset_at + 1.0:
+                # Server started a new window
+                self._remaining = float(remaining)
+            else:
+                # Same window: requests charged locally may still be in flight,
+                # so never raise the local count
+                self._remaining = min(self._remaining, float(remaining))
+            self._reset_at = reset_at
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'remaining': round(self._remaining, 1),
+                'reset_in_seconds': round(max(self._reset_at - time.monotonic(), 0.0), 1),
+                'waited_seconds': round(self.waited_seconds, 2),
+            }
+
+
+class AdaptiveTokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to throttling (AIMD).
+
+    acquire() blocks until a token is available. Each success raises the
+    rate by `increase` tokens/second up to `max_rate`; each throttle
+    (HTTP 429) halves it down to `min_rate` and pauses all callers for an
+    exponential backoff (`backoff_seconds` * 2^(consecutive throttles - 1),
+    or the server's Retry-After when given).
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 3,
+        min_rate: float = 0.05,
+        max_rate: float = 2.0,
+        increase: float = 0.05,
+        backoff_seconds: float = 5.0,
+        max_backoff_seconds: float = 300.0
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+
+        self.requests = 0
+        self.throttles = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until one request may be sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Tokens may go negative: each waiter reserves its own slot
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+            self.requests += 1
+            self.waited_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self._consecutive_throttles = 0
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Halve the rate and pause every caller until the backoff passes"""
+        with self._lock:
+            self.throttles += 1
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+
+            backoff = retry_after if retry_after is not None else min(
+                self.backoff_seconds * 2 ** (self._consecutive_throttles - 1),
+                self.max_backoff_seconds
+            )
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = max(self._paused_until, now + backoff)
+            logger.warning(f"Throttled; backing off {backoff:.1f}s at {self.rate:.2f} req/s")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttles': self.throttles,
+                'rate_per_second': round(self.rate, 3),
+                'waited_seconds': round(self.waited_seconds, 2),
+            }
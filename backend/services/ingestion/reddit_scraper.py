@@ -4,16 +4,26 @@ Uses PRAW to monitor subreddits and extracts micro-trends from post titles.
 """
 
 import praw
-from datetime import datetime, timezone
-from typing import List, Dict
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Dict, Optional, Tuple
 import logging
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.signal import RawSignal
-from app.models.detected_trend import DetectedTrend, SignalTrendAssociation
+from app.models.detected_trend import DetectedTrend
 from app.config import settings
 from services.ingestion.trend_extractor import TrendExtractor
+from services.ingestion.extraction_cache import ExtractionCache
+from services.ingestion.persistence import BulkSignalWriter
+from services.ingestion.title_prefilter import TitlePrefilter
+from services.ingestion.rate_limit import RateLimitBudget
+from services.ingestion.resilience import REDDIT_HOST, CircuitOpenError, RetryPolicy
+from services.ingestion.checkpoints import CheckpointStore
+from services.ingestion.snapshot_retention import SnapshotRetention
+from services.ingestion.sources import SignalSource, SourceRunner, TrendAnnotator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,20 +47,237 @@ SUBREDDIT_MAP = {
     "Education": ["education", "learnprogramming", "LanguageLearning"],
 }
 
+# Post ID inside a stored permalink identifier (/r/<sub>/comments/<id>/<slug>/)
+PERMALINK_ID = re.compile(r"/comments/([a-z0-9]+)/")
 
-class RedditScraper:
+
+def _fullname_from_identifier(identifier: str) -> Optional[str]:
+    match = PERMALINK_ID.search(identifier)
+    return f"t3_{match.group(1)}" if match else None
+
+
+class RedditScraper(SignalSource):
     """Scrapes Reddit for emerging trend signals with NLP extraction."""
     
+    platform = "reddit"
+    extract_trends = True
+    
     def __init__(self):
         """Initialize Reddit API client and trend extractor."""
+        super().__init__()
         self.reddit = praw.Reddit(
             client_id=settings.REDDIT_CLIENT_ID,
             client_secret=settings.REDDIT_CLIENT_SECRET,
             user_agent=settings.REDDIT_USER_AGENT,
+            timeout=int(settings.SCRAPER_REQUEST_TIMEOUT_SECONDS),
+        )
+        self.extraction_cache = ExtractionCache.from_settings()
+        self.trend_extractor = TrendExtractor(
+            cache=self.extraction_cache,
+            known_phrase_fast_path=settings.KNOWN_PHRASE_FAST_PATH,
+            mode=settings.TREND_EXTRACTOR_MODE,
+            prefilter=TitlePrefilter() if settings.TITLE_PREFILTER_ENABLED else None
+        )
+        self.phrase_registry = None  # Phrase IDs for standalone scrape_* calls
+        # Off: the post-ingest ExtractionWorker links posts to trends instead
+        self.extract_trends = settings.REDDIT_INLINE_EXTRACTION
+        
+        # Shared by every fetch thread; synced from Reddit's rate-limit headers
+        self.rate_limit = RateLimitBudget(
+            requests_per_window=1000, window_seconds=600, reserve=10, pace_below=200
         )
-        self.trend_extractor = TrendExtractor()
+        self._local = threading.local()
+        # Retries with backoff; fail fast while Reddit's circuit is open
+        self.resilience = RetryPolicy.from_settings()
+        self.fetch_workers = settings.REDDIT_FETCH_WORKERS
+        self.posts_per_subreddit = 25
+        
+        # Incremental mode reads only posts newer than each subreddit's checkpoint
+        self.incremental = settings.REDDIT_INCREMENTAL
+        self.checkpoints = CheckpointStore("reddit")
+        
+        # Fetch each category's subreddits as one combined "sub1+sub2" listing
+        self.multireddit = settings.REDDIT_MULTIREDDIT
         logger.info("Reddit scraper initialized with trend extraction")
     
+    def _thread_reddit(self) -> praw.Reddit:
+        """PRAW client for the calling fetch thread (praw.Reddit isn't thread-safe)"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = praw.Reddit(
+                client_id=settings.REDDIT_CLIENT_ID,
+                client_secret=settings.REDDIT_CLIENT_SECRET,
+                user_agent=settings.REDDIT_USER_AGENT,
+                timeout=int(settings.SCRAPER_REQUEST_TIMEOUT_SECONDS),
+            )
+            self._local.reddit = reddit
+        return reddit
+    
+    def _fetch_posts(
+        self,
+        reddit: praw.Reddit,
+        subreddit_name: str,
+        limit: int,
+        time_filter: str
+    ) -> List:
+        """
+        Fetch a subreddit listing, skipping stickied posts and announcements.
+        `subreddit_name` may be a combined "sub1+sub2" multireddit.
+        
+        Listing items come back fully populated, so the returned posts can be
+        read from any thread without further requests. Transient failures
+        re-read the listing after a backoff; while Reddit's circuit is open
+        this raises CircuitOpenError without sending a request.
+        """
+        return self.resilience.call(REDDIT_HOST, self._read_listing, reddit, subreddit_name, limit, time_filter)
+    
+    def _read_listing(self, reddit: praw.Reddit, subreddit_name: str, limit: int, time_filter: str) -> List:
+        if self.incremental:
+            return self._fetch_new_posts(reddit, subreddit_name, limit)
+        
+        if self.rate_limit is not None:
+            # One request per page of up to 100 posts
+            for _ in range(max(1, -(-limit // 100))):
+                self.rate_limit.acquire()
+        
+        subreddit = reddit.subreddit(subreddit_name)
+        posts = [
+            post for post in subreddit.top(time_filter=time_filter, limit=limit)
+            if not post.stickied
+        ]
+        
+        if self.rate_limit is not None:
+            self.rate_limit.update(reddit.auth.limits)
+        return posts
+    
+    def _fetch_new_posts(self, reddit: praw.Reddit, subreddit_name: str, limit: int) -> List:
+        """
+        Submissions newer than the subreddit's checkpoint, newest first.
+        
+        Pages through r/<subreddit>/new and stops once it reaches the
+        high-water mark, so requests scale with the number of new posts.
+        For a "sub1+sub2" multireddit each post is checked against its own
+        subreddit's mark, and paging stops below the oldest of them.
+        `limit` caps the first run and runs after a long gap.
+        """
+        names = subreddit_name.split("+")
+        marks = {name.lower(): self.checkpoints.get(name) for name in names}
+        cursors = {mark['cursor'] for mark in marks.values() if mark}
+        last_created = {
+            name: mark['last_seen_at'].timestamp() if mark and mark['last_seen_at'] else None
+            for name, mark in marks.items()
+        }
+        # Every subreddit needs a mark before anything can be ruled out wholesale
+        stop_below = None if None in last_created.values() else min(last_created.values())
+        
+        posts = []
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        
+        for count, post in enumerate(reddit.subreddit(subreddit_name).new(limit=limit), start=1):
+            if stop_below is not None and post.created_utc < stop_below:
+                break
+            
+            source = names[0].lower() if len(names) == 1 else post.subreddit.display_name.lower()
+            mark_created = last_created.get(source)
+            is_stored = post.name in cursors or (mark_created is not None and post.created_utc < mark_created)
+            if not is_stored and not post.stickied:
+                posts.append(post)
+            
+            # The next item comes from a new page
+            if count % 100 == 0 and self.rate_limit is not None:
+                self.rate_limit.acquire()
+        
+        if self.rate_limit is not None:
+            self.rate_limit.update(reddit.auth.limits)
+        return posts
+    
+    def _fetch_group(
+        self,
+        reddit: praw.Reddit,
+        subreddit_names: List[str],
+        posts_per_subreddit: int,
+        time_filter: str
+    ) -> Dict[str, List]:
+        """
+        Posts for several subreddits, keyed by subreddit name.
+        
+        In multireddit mode the group is read as one combined "sub1+sub2"
+        listing (paged as needed) and each post is mapped back to its source
+        subreddit; otherwise each subreddit is fetched on its own. A
+        combined top() listing is ranked across the group, so busy
+        subreddits can crowd out quiet ones; each is capped at
+        posts_per_subreddit. Incremental reads are not capped per
+        subreddit, since anything dropped would fall behind the checkpoint.
+        """
+        if not self.multireddit or len(subreddit_names) == 1:
+            return {
+                name: self._fetch_posts(reddit, name, posts_per_subreddit, time_filter)
+                for name in subreddit_names
+            }
+        
+        posts = self._fetch_posts(
+            reddit,
+            "+".join(subreddit_names),
+            posts_per_subreddit * len(subreddit_names),
+            time_filter
+        )
+        
+        canonical = {name.lower(): name for name in subreddit_names}
+        grouped = {name: [] for name in subreddit_names}
+        for post in posts:
+            name = canonical.get(post.subreddit.display_name.lower())
+            if name is None:
+                continue
+            if self.incremental or len(grouped[name]) < posts_per_subreddit:
+                grouped[name].append(post)
+        
+        return grouped
+    
+    def _post_metrics(self, post) -> Dict:
+        """Engagement fields that change after a post is first stored"""
+        return {
+            "upvotes": post.score,
+            "upvote_ratio": post.upvote_ratio,
+            "num_comments": post.num_comments,
+            "awards": post.total_awards_received,
+        }
+    
+    def _build_signal(self, post, subreddit_name: str, category: str) -> Dict:
+        """Signal dictionary for one post (trend data is added by TrendAnnotator)"""
+        return {
+            "platform": "reddit",
+            "signal_type": "post",
+            "identifier": f"https://reddit.com{post.permalink}",
+            "title": post.title[:500],
+            "content_preview": post.selftext[:1000] if post.selftext else None,
+            "category": category,
+            "metric_name": "engagement_score",
+            "metric_value": self._calculate_engagement(post),
+            "signal_metadata": {
+                "subreddit": subreddit_name,
+                "fullname": post.name,
+                "author": str(post.author),
+                **self._post_metrics(post),
+                "is_original_content": post.is_original_content,
+                "link_flair_text": post.link_flair_text,
+            },
+            "content_created_at": datetime.fromtimestamp(
+                post.created_utc, 
+                tz=timezone.utc
+            ),
+        }
+    
+    def _signals_from_posts(self, posts: List, subreddit_name: str, category: str) -> List[Dict]:
+        """Build the signals of a fetched listing and extract their trends in one batch"""
+        # Posts already saved this run (e.g. listed in two subreddits) skip extraction
+        signals = [
+            self._build_signal(post, subreddit_name, category)
+            for post in posts
+            if f"https://reddit.com{post.permalink}" not in self.seen
+        ]
+        return TrendAnnotator(self.trend_extractor, self.phrase_registry).annotate(signals)
+    
     def scrape_subreddit(
         self, 
         subreddit_name: str, 
@@ -73,47 +300,8 @@ class RedditScraper:
         signals = []
         
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            # Get top posts from the time period
-            for post in subreddit.top(time_filter=time_filter, limit=limit):
-                # Skip stickied posts and announcements
-                if post.stickied:
-                    continue
-                
-                # Extract trends from title using NLP
-                trend_data = self.trend_extractor.extract_from_title(post.title)
-                
-                signal_data = {
-                    "platform": "reddit",
-                    "signal_type": "post",
-                    "identifier": f"https://reddit.com{post.permalink}",
-                    "title": post.title[:500],
-                    "content_preview": post.selftext[:1000] if post.selftext else None,
-                    "category": category,
-                    "metric_name": "engagement_score",
-                    "metric_value": self._calculate_engagement(post),
-                    "signal_metadata": {
-                        "subreddit": subreddit_name,
-                        "author": str(post.author),
-                        "upvotes": post.score,
-                        "upvote_ratio": post.upvote_ratio,
-                        "num_comments": post.num_comments,
-                        "awards": post.total_awards_received,
-                        "is_original_content": post.is_original_content,
-                        "link_flair_text": post.link_flair_text,
-                        # NEW: Store extracted trend data
-                        "detected_trends": trend_data['trend_phrases'],
-                        "keywords": trend_data['keywords'],
-                        "hashtags": trend_data['hashtags']
-                    },
-                    "content_created_at": datetime.fromtimestamp(
-                        post.created_utc, 
-                        tz=timezone.utc
-                    ),
-                }
-                
-                signals.append(signal_data)
+            posts = self._fetch_posts(self.reddit, subreddit_name, limit, time_filter)
+            signals = self._signals_from_posts(posts, subreddit_name, category)
             
             logger.info(f"Scraped {len(signals)} posts from r/{subreddit_name}")
             
@@ -146,6 +334,19 @@ class RedditScraper:
         
         logger.info(f"Scraping category: {category} ({len(subreddits)} subreddits)")
         
+        if self.multireddit:
+            try:
+                grouped = self._fetch_group(self.reddit, subreddits, posts_per_subreddit, "day")
+            except Exception as e:
+                logger.error(f"Error scraping {category} multireddit: {str(e)}")
+                return []
+            
+            for subreddit_name, posts in grouped.items():
+                signals = self._signals_from_posts(posts, subreddit_name, category)
+                logger.info(f"Scraped {len(signals)} posts from r/{subreddit_name}")
+                all_signals.extend(signals)
+            return all_signals
+        
         for subreddit_name in subreddits:
             signals = self.scrape_subreddit(
                 subreddit_name, 
@@ -158,162 +359,207 @@ class RedditScraper:
     
     def scrape_all_categories(
         self, 
-        posts_per_subreddit: int = 25
+        posts_per_subreddit: int = 25,
+        workers: Optional[int] = None,
+        incremental: Optional[bool] = None
     ) -> Dict[str, int]:
         """
         Scrape all categories and save to database with trend associations.
         
+        Runs through the shared SourceRunner: fetch threads (one PRAW
+        client each) -> extraction (in a process pool when
+        REDDIT_EXTRACT_WORKERS > 0) -> batched writes, so saving never
+        waits for a whole category.
+        
         Args:
-            posts_per_subreddit: Number of posts per subreddit
+            posts_per_subreddit: Number of posts per subreddit (in incremental
+                mode, the cap on new posts read per subreddit)
+            workers: Subreddit listings fetched concurrently (defaults to
+                settings.REDDIT_FETCH_WORKERS; 1 scrapes one subreddit at a time)
+            incremental: Read only posts newer than each subreddit's
+                checkpoint, then refresh metrics of recently stored posts
+                (defaults to settings.REDDIT_INCREMENTAL)
         
         Returns:
             Dictionary with category names and signal counts
         """
-        db = next(get_db())
-        stats = {}
+        if incremental is not None:
+            self.incremental = incremental
+        self.posts_per_subreddit = posts_per_subreddit
         
+        runner = SourceRunner(
+            self,
+            fetch_workers=workers or settings.REDDIT_FETCH_WORKERS,
+            extract_workers=settings.REDDIT_EXTRACT_WORKERS,
+            batch_size=settings.REDDIT_WRITE_BATCH_SIZE,
+            batch_seconds=settings.REDDIT_WRITE_BATCH_SECONDS
+        )
+        
+        db = next(get_db())
         try:
-            for category in SUBREDDIT_MAP.keys():
-                signals = self.scrape_category(category, posts_per_subreddit)
-                
-                # Save signals to database with trend extraction
-                saved_count = self._save_signals_with_trends(db, signals)
-                stats[category] = saved_count
-                
-                logger.info(f"Category {category}: {saved_count} signals saved")
+            saved = runner.run(db)
         finally:
             db.close()
         
+        return {category: saved.get(category, 0) for category in SUBREDDIT_MAP}
+    
+    # SignalSource plugin: one job per category multireddit, or per subreddit
+    
+    def start(self, db: Session):
+        if self.incremental:
+            self.checkpoints.load(db)
+    
+    def jobs(self, db: Session) -> Iterable[Tuple[str, List[str]]]:
+        if self.multireddit:
+            return [(category, list(subreddits)) for category, subreddits in SUBREDDIT_MAP.items()]
+        return [
+            (category, [subreddit_name])
+            for category, subreddits in SUBREDDIT_MAP.items()
+            for subreddit_name in subreddits
+        ]
+    
+    def fetch(self, job: Tuple[str, List[str]]) -> Tuple[str, Dict[str, List]]:
+        category, subreddit_names = job
+        grouped = self._fetch_group(self._thread_reddit(), subreddit_names, self.posts_per_subreddit, "day")
+        return category, grouped
+    
+    def normalize(self, payload: Tuple[str, Dict[str, List]]) -> List[Dict]:
+        category, grouped = payload
+        return [
+            self._build_signal(post, subreddit_name, category)
+            for subreddit_name, posts in grouped.items()
+            for post in posts
+        ]
+    
+    def on_write(self, db: Session, payloads: List[Tuple], result: Optional[Dict]):
+        """Move each subreddit's mark to its newest post, committed with the posts"""
+        if not self.incremental:
+            return
+        for _, grouped in payloads:
+            for subreddit_name, posts in grouped.items():
+                if not posts:
+                    continue
+                newest = max(posts, key=lambda post: post.created_utc)
+                self.checkpoints.advance(
+                    db,
+                    subreddit_name,
+                    newest.name,
+                    datetime.fromtimestamp(newest.created_utc, tz=timezone.utc)
+                )
+    
+    def finish(self, db: Session):
+        if self.incremental:
+            self.refresh_metrics(db)
+    
+    def stats(self) -> Dict:
+        stats = {
+            'rate_limit': self.rate_limit.stats() if self.rate_limit is not None else None,
+            'resilience': self.resilience.stats(),
+        }
+        if self.extraction_cache is not None:
+            stats['extraction_cache'] = self.extraction_cache.stats()
+        if self.trend_extractor.prefilter is not None:
+            stats['title_prefilter'] = self.trend_extractor.prefilter.stats()
         return stats
     
-    def _calculate_engagement(self, post) -> float:
+    def refresh_metrics(self, db: Session, window_hours: Optional[int] = None) -> int:
         """
-        Calculate engagement score combining multiple metrics.
+        Refresh engagement metrics of recently stored posts.
         
-        Args:
-            post: Reddit post object
-        
-        Returns:
-            Engagement score (weighted combination)
-        """
-        # Weighted formula: upvotes * ratio + comments * 2 + awards * 5
-        score = (
-            post.score * post.upvote_ratio +
-            post.num_comments * 2 +
-            post.total_awards_received * 5
-        )
-        return round(score, 2)
-    
-    def _save_signals_with_trends(self, db: Session, signals: List[Dict]) -> int:
-        """
-        Save signals to database and create detected_trends + associations.
+        Posts keep gaining votes and comments for a day or two after they
+        were first stored. Incremental runs don't re-read them from the
+        listings, so their metrics are re-fetched here by fullname (100 per
+        request via reddit.info) and written with one bulk UPDATE, with no
+        extraction and no trend/association writes.
         
         Args:
             db: Database session
-            signals: List of signal dictionaries
+            window_hours: How far back to refresh (defaults to
+                settings.REDDIT_REFRESH_WINDOW_HOURS)
         
         Returns:
-            Number of signals saved
+            Number of signals refreshed
         """
-        saved_count = 0
+        window_hours = window_hours or settings.REDDIT_REFRESH_WINDOW_HOURS
+        since = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+        
+        rows = db.query(RawSignal.id, RawSignal.identifier, RawSignal.signal_metadata).filter(
+            RawSignal.platform == "reddit",
+            RawSignal.content_created_at >= since
+        ).all()
         
-        for signal_data in signals:
+        # Posts saved earlier in this run already have fresh metrics
+        stored = {}
+        for signal_id, identifier, metadata in rows:
+            if identifier in self.seen:
+                continue
+            fullname = (metadata or {}).get("fullname") or _fullname_from_identifier(identifier)
+            if fullname:
+                stored[fullname] = (signal_id, metadata or {})
+        
+        fullnames = list(stored)
+        refreshed_at = datetime.now(timezone.utc).isoformat()
+        updates = []
+        
+        for i in range(0, len(fullnames), 100):
             try:
-                # Check if signal already exists
-                existing = db.query(RawSignal).filter(
-                    RawSignal.identifier == signal_data["identifier"]
-                ).first()
-                
-                if existing:
-                    # Update metrics if changed
-                    existing.metric_value = signal_data["metric_value"]
-                    existing.signal_metadata = signal_data["signal_metadata"]
-                    db.flush()
-                    signal = existing
-                else:
-                    # Create new signal
-                    signal = RawSignal(**signal_data)
-                    db.add(signal)
-                    db.flush()  # Get signal.id
-                
-                # Extract detected trends from metadata
-                metadata = signal_data.get('signal_metadata', {})
-                detected_trends = metadata.get('detected_trends', [])
-                
-                # Process each detected trend
-                for trend_info in detected_trends:
-                    normalized = trend_info['normalized']
-                    category = signal_data['category']
-                    
-                    # Find or create detected_trend
-                    detected_trend = db.query(DetectedTrend).filter(
-                        DetectedTrend.normalized_phrase == normalized,
-                        DetectedTrend.category == category
-                    ).first()
-                    
-                    if not detected_trend:
-                        # Create new detected trend
-                        detected_trend = DetectedTrend(
-                            trend_phrase=trend_info['phrase'],
-                            normalized_phrase=normalized,
-                            category=category,
-                            keywords=metadata.get('keywords', []),
-                            hashtags=metadata.get('hashtags', []),
-                            signal_count=1,
-                            first_seen=signal.content_created_at or datetime.now(timezone.utc),
-                            last_seen=signal.content_created_at or datetime.now(timezone.utc),
-                            metadata={
-                                'extraction_confidence': trend_info['score'],
-                                'extraction_method': trend_info['method']
-                            }
-                        )
-                        db.add(detected_trend)
-                        db.flush()
-                    else:
-                        # Update existing trend
-                        detected_trend.signal_count += 1
-                        detected_trend.last_seen = signal.content_created_at or datetime.now(timezone.utc)
-                        
-                        # Merge keywords and hashtags
-                        if detected_trend.keywords:
-                            all_keywords = set(detected_trend.keywords + metadata.get('keywords', []))
-                            detected_trend.keywords = list(all_keywords)[:20]  # Keep top 20
-                        
-                        if detected_trend.hashtags:
-                            all_hashtags = set(detected_trend.hashtags + metadata.get('hashtags', []))
-                            detected_trend.hashtags = list(all_hashtags)[:10]  # Keep top 10
-                    
-                    # Check if association already exists
-                    existing_assoc = db.query(SignalTrendAssociation).filter(
-                        SignalTrendAssociation.signal_id == signal.id,
-                        SignalTrendAssociation.detected_trend_id == detected_trend.id
-                    ).first()
-                    
-                    if not existing_assoc:
-                        # Create association
-                        assoc = SignalTrendAssociation(
-                            signal_id=signal.id,
-                            detected_trend_id=detected_trend.id,
-                            relevance_score=trend_info['score'],
-                            extraction_method=trend_info['method']
-                        )
-                        db.add(assoc)
-                
-                saved_count += 1
-                
+                posts = self.resilience.call(REDDIT_HOST, self._fetch_info, fullnames[i:i + 100])
+            except CircuitOpenError as e:
+                logger.error(f"Skipping remaining metric refreshes: {str(e)}")
+                break
             except Exception as e:
-                logger.error(f"Error saving signal: {str(e)}")
+                logger.error(f"Error refreshing Reddit metrics: {str(e)}")
                 continue
+            
+            for post in posts:
+                signal_id, metadata = stored[post.name]
+                updates.append({
+                    "id": signal_id,
+                    "metric_value": self._calculate_engagement(post),
+                    "signal_metadata": {
+                        **metadata,
+                        **self._post_metrics(post),
+                        "metrics_refreshed_at": refreshed_at,
+                    },
+                })
         
         try:
+            refreshed = BulkSignalWriter().refresh_metrics(db, updates)
             db.commit()
-            logger.info(f"Committed {saved_count} signals with trend associations")
         except Exception as e:
-            logger.error(f"Error committing signals: {str(e)}")
+            logger.error(f"Error saving refreshed metrics: {str(e)}")
             db.rollback()
             return 0
         
-        return saved_count
+        logger.info(f"Refreshed metrics for {refreshed} posts from the last {window_hours}h")
+        return refreshed
+    
+    def _fetch_info(self, fullnames: List[str]) -> List:
+        """Current state of up to 100 posts by fullname (one request)"""
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        posts = list(self.reddit.info(fullnames=fullnames))
+        if self.rate_limit is not None:
+            self.rate_limit.update(self.reddit.auth.limits)
+        return posts
+    
+    def _calculate_engagement(self, post) -> float:
+        """
+        Calculate engagement score combining multiple metrics.
+        
+        Args:
+            post: Reddit post object
+        
+        Returns:
+            Engagement score (weighted combination)
+        """
+        # Weighted formula: upvotes * ratio + comments * 2 + awards * 5
+        score = (
+            post.score * post.upvote_ratio +
+            post.num_comments * 2 +
+            post.total_awards_received * 5
+        )
+        return round(score, 2)
 
 
 def main():
@@ -352,6 +598,9 @@ def main():
         logger.info(f"\nTop 10 Trends by Signal Count:")
         for trend in top_trends:
             logger.info(f"  '{trend.trend_phrase}' ({trend.category}): {trend.signal_count} signals")
+        
+        # Thin out old metric snapshots written by this and earlier runs
+        SnapshotRetention().apply(db)
     finally:
         db.close()
 
@@ -0,0 +1,310 @@
+"""
+Shared retry, backoff and circuit-breaker layer for the scrapers.
+Every upstream call goes through RetryPolicy.call(host, fn):
+    - transient failures (timeouts, connection errors, 429, 5xx) are
+      retried with full-jitter exponential backoff, honouring Retry-After
+    - retries are drawn from a RetryBudget (a share of all requests), so an
+      outage can't multiply traffic
+    - each host has a CircuitBreaker; after repeated transient failures it
+      opens and calls fail fast with CircuitOpenError until a probe
+      succeeds, so a failing endpoint stops stalling the rest of a run
+Client errors (4xx other than 429) are raised at once; the host answered,
+so they count as a success for its breaker.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Upstream hosts (one breaker each, shared by every scraper in the process)
+REDDIT_HOST = "oauth.reddit.com"
+YOUTUBE_HOST = "youtube.googleapis.com"
+GOOGLE_TRENDS_HOST = "trends.google.com"
+
+# Exception class names treated as transient when no status code is attached
+# (requests, prawcore, httplib2, socket)
+TRANSIENT_ERRORS = {
+    'ConnectionError', 'ConnectTimeout', 'ReadTimeout', 'Timeout', 'TimeoutError', 'timeout',
+    'ChunkedEncodingError', 'RequestException', 'ServerError', 'TooManyRequests',
+    'TooManyRequestsError', 'ServerNotFoundError', 'RemoteDisconnected', 'IncompleteRead',
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """A host's breaker is open; the call was not attempted"""
+
+
+def status_code(error: Exception) -> Optional[int]:
+    """HTTP status of a client library error (requests/prawcore `response`, googleapiclient `resp`)"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_transient(error: Exception) -> bool:
+    """Worth retrying: throttling, server errors, timeouts and dropped connections"""
+    status = status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in TRANSIENT_ERRORS or isinstance(error, (ConnectionError, TimeoutError))
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Retry-After seconds sent with a throttled response, if any"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if headers is None:
+        headers = getattr(error, 'resp', None)  # httplib2.Response is a dict of headers
+    if not hasattr(headers, 'get'):
+        return None
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random = random) -> float:
+    """Full-jitter exponential backoff: uniform over [0, min(cap, base * 2^attempt)]"""
+    return rng.uniform(0.0, min(cap, base * 2 ** attempt))
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on retries relative to requests.
+
+    Every first attempt deposits `ratio` of a retry; every retry withdraws
+    one. `minimum` retries are always available, so short runs can still
+    ride out a blip, while a sustained outage adds at most `ratio` extra
+    load.
+    """
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self._lock = threading.Lock()
+        self._balance = float(minimum)
+
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def on_request(self):
+        with self._lock:
+            self.requests += 1
+            self._balance += self.ratio
+
+    def try_retry(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                self.denied += 1
+                return False
+            self._balance -= 1
+            self.retries += 1
+            return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'denied': self.denied,
+                'balance': round(self._balance, 1),
+            }
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker for one host.
+
+    closed: calls go through; `failure_threshold` consecutive transient
+    failures open it. open: calls are refused until `reset_seconds` pass.
+    half_open: one probe call is let through; success closes the breaker,
+    failure opens it again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_seconds: float = 60.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._lock = threading.Lock()
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> Optional[str]:
+        """
+        'closed' or 'probe' if the call may go ahead, None if refused.
+        The caller that gets 'probe' holds the half-open probe slot and
+        must release() it when the call ends.
+        """
+        with self._lock:
+            if self.state == 'open' and time.monotonic() - self._opened_at >= self.reset_seconds:
+                self.state = 'half_open'
+                self._probing = False
+            if self.state == 'closed':
+                return 'closed'
+            if self.state == 'half_open' and not self._probing:
+                self._probing = True
+                return 'probe'
+            self.rejected += 1
+            return None
+
+    def record_success(self):
+        with self._lock:
+            if self.state != 'closed':
+                logger.info(f"Circuit for {self.host} closed")
+            self.state = 'closed'
+            self._failures = 0
+            self._probing = False
+
+    def release(self):
+        """End this caller's half-open probe whatever its outcome, so the next call can probe"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == 'half_open' or self._failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.opened += 1
+                    logger.warning(
+                        f"Circuit for {self.host} opened after {self._failures} failures; "
+                        f"failing fast for {self.reset_seconds:.0f}s"
+                    )
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'state': self.state, 'opened': self.opened, 'rejected': self.rejected}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    """The process-wide breaker for a host (created from settings on first use)"""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            from app.config import settings
+
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=settings.SCRAPER_BREAKER_FAILURES,
+                reset_seconds=settings.SCRAPER_BREAKER_RESET_SECONDS
+            )
+            _breakers[host] = breaker
+        return breaker
+
+
+class RetryPolicy:
+    """
+    Retries and circuit breaking around upstream calls of one scraper.
+
+    Args:
+        max_attempts: Attempts per call, including the first
+        base_seconds: Backoff base (attempt n waits up to base * 2^n)
+        max_seconds: Longest single backoff
+        budget: Retry budget shared by the scraper's fetch threads
+        classify: error -> retryable (defaults to is_transient)
+        sleep: Injectable for tests and replays
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_seconds: float = 1.0,
+        max_seconds: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        classify: Callable[[Exception], bool] = is_transient,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.budget = budget or RetryBudget()
+        self.classify = classify
+        self.sleep = sleep
+        self.hosts = set()
+
+    @classmethod
+    def from_settings(cls, max_attempts: Optional[int] = None, **kwargs) -> 'RetryPolicy':
+        from app.config import settings
+
+        return cls(
+            max_attempts=max_attempts or settings.SCRAPER_RETRY_MAX_ATTEMPTS,
+            base_seconds=settings.SCRAPER_RETRY_BASE_SECONDS,
+            max_seconds=settings.SCRAPER_RETRY_MAX_SECONDS,
+            budget=RetryBudget(settings.SCRAPER_RETRY_BUDGET_RATIO, settings.SCRAPER_RETRY_BUDGET_MIN),
+            **kwargs
+        )
+
+    def call(self, host: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs) with retries; raises CircuitOpenError while the
+        host's breaker is open, or the last error once retries run out
+        """
+        breaker = breaker_for(host)
+        self.hosts.add(host)
+        self.budget.on_request()
+
+        for attempt in range(self.max_attempts):
+            permit = breaker.allow()
+            if permit is None:
+                raise CircuitOpenError(f"Circuit open for {host}")
+            try:
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    if not self.classify(e):
+                        # The host is reachable; only this request was refused (403, 404, ...)
+                        breaker.record_success()
+                        raise
+                    breaker.record_failure()
+                    if attempt + 1 == self.max_attempts or not self.budget.try_retry():
+                        raise
+                    error = e
+                else:
+                    breaker.record_success()
+                    return result
+            finally:
+                # Our probe never stays claimed, whatever the outcome; calls
+                # already in flight when the breaker opened hold no slot
+                if permit == 'probe':
+                    breaker.release()
+
+            delay = max(
+                backoff_delay(attempt, self.base_seconds, self.max_seconds),
+                min(retry_after(error) or 0.0, self.max_seconds)
+            )
+            logger.warning(
+                f"{host}: {type(error).__name__} on attempt {attempt + 1}/{self.max_attempts}; "
+                f"retrying in {delay:.1f}s"
+            )
+            self.sleep(delay)
+
+    def stats(self) -> Dict:
+        return {
+            'retries': self.budget.stats(),
+            'circuits': {host: breaker_for(host).stats() for host in sorted(self.hosts)},
+        }
@@ -0,0 +1,104 @@
+"""
+Retention policy for signal_metric_snapshots.
+Snapshots are appended on every scrape, so the table is thinned by age:
+    newer than SNAPSHOT_RAW_HOURS       every snapshot
+    up to SNAPSHOT_HOURLY_DAYS old      last snapshot per signal per hour
+    up to SNAPSHOT_DAILY_DAYS old       last snapshot per signal per day
+    older                               deleted
+Engagement metrics are cumulative, so the last value in a bucket is the
+bucket's reading; growth between buckets is preserved.
+"""
+
+import os
+import sys
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Keep the newest snapshot per (signal, bucket) within [start, end)
+_DOWNSAMPLE_SQL = """
+    DELETE FROM signal_metric_snapshots s
+    USING (
+        SELECT id, row_number() OVER (
+            PARTITION BY signal_id, date_trunc(:bucket, observed_at)
+            ORDER BY observed_at DESC, id DESC
+        ) AS rn
+        FROM signal_metric_snapshots
+        WHERE observed_at >= :start AND observed_at < :end
+    ) ranked
+    WHERE s.id = ranked.id AND ranked.rn > 1
+"""
+
+
+class SnapshotRetention:
+    """Applies the age-tiered retention policy to signal_metric_snapshots."""
+
+    def __init__(
+        self,
+        raw_hours: Optional[int] = None,
+        hourly_days: Optional[int] = None,
+        daily_days: Optional[int] = None
+    ):
+        self.raw_hours = settings.SNAPSHOT_RAW_HOURS if raw_hours is None else raw_hours
+        self.hourly_days = settings.SNAPSHOT_HOURLY_DAYS if hourly_days is None else hourly_days
+        self.daily_days = settings.SNAPSHOT_DAILY_DAYS if daily_days is None else daily_days
+
+    def apply(self, db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Downsample and expire snapshots in one transaction (commits).
+
+        Returns:
+            Rows deleted per tier: hourly, daily, expired
+        """
+        now = now or datetime.now(timezone.utc)
+        raw_cutoff = now - timedelta(hours=self.raw_hours)
+        hourly_cutoff = now - timedelta(days=self.hourly_days)
+        daily_cutoff = now - timedelta(days=self.daily_days)
+
+        try:
+            deleted = {
+                'hourly': db.execute(
+                    text(_DOWNSAMPLE_SQL),
+                    {'bucket': 'hour', 'start': hourly_cutoff, 'end': raw_cutoff}
+                ).rowcount,
+                'daily': db.execute(
+                    text(_DOWNSAMPLE_SQL),
+                    {'bucket': 'day', 'start': daily_cutoff, 'end': hourly_cutoff}
+                ).rowcount,
+                'expired': db.execute(
+                    text("DELETE FROM signal_metric_snapshots WHERE observed_at < :cutoff"),
+                    {'cutoff': daily_cutoff}
+                ).rowcount,
+            }
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        logger.info(f"Snapshot retention removed {deleted}")
+        return deleted
+
+
+def main():
+    """Apply snapshot retention once (schedule alongside the scrapers)"""
+    db = next(get_db())
+    try:
+        SnapshotRetention().apply(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
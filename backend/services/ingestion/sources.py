@@ -0,0 +1,246 @@
+"""
+Source plugins and the shared ingestion runner.
+A platform implements SignalSource (jobs -> fetch -> normalize into signal
+dictionaries); SourceRunner drives every source through the same
+IngestPipeline:
+    fetch threads -> normalize + trend extraction -> batched BulkSignalWriter
+so batching, bulk upserts, run-level dedup, extraction and metrics are
+implemented once for all platforms.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from services.ingestion.dedup import SeenSignals
+from services.ingestion.http_fixtures import fixtures_for
+from services.ingestion.persistence import BulkSignalWriter
+from services.ingestion.phrase_matcher import KnownPhraseMatcher
+from services.ingestion.phrase_registry import PhraseRegistry
+from services.ingestion.pipeline import IngestPipeline
+from services.ingestion.trend_extractor import TrendExtractor, extract_titles
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SignalSource:
+    """
+    Base class for a platform plugin.
+
+    Subclasses set `platform`, implement jobs/fetch/normalize, and
+    override the hooks they need. Sources that want trend extraction set
+    `extract_trends` and provide a `trend_extractor`.
+    """
+
+    platform = ""
+    extract_trends = False
+    trend_extractor: Optional[TrendExtractor] = None
+
+    # Concurrent fetch() calls; keep 1 for clients that aren't thread-safe
+    fetch_workers = 1
+
+    def __init__(self):
+        # Identifiers saved this run (sources may preload stored ones to skip them)
+        self.seen = SeenSignals()
+
+    def start(self, db: Session):
+        """Load run state (checkpoints, preloads) before jobs() is called"""
+
+    def jobs(self, db: Session) -> Iterable[Any]:
+        """Units of fetch work"""
+        raise NotImplementedError
+
+    def fetch(self, job: Any) -> Any:
+        """Network call(s) for one job; runs on a fetch thread"""
+        raise NotImplementedError
+
+    def normalize(self, payload: Any) -> List[Dict]:
+        """Signal dictionaries (BulkSignalWriter format) for one fetched payload"""
+        raise NotImplementedError
+
+    def on_write(self, db: Session, payloads: List[Any], result: Optional[Dict]):
+        """Extra writes for a batch, in the same transaction (checkpoints, series)"""
+
+    def on_write_failed(self, payloads: List[Any]):
+        """A batch was rolled back"""
+
+    def finish(self, db: Session):
+        """After every job is written (metric refreshes, checkpoint updates)"""
+
+    def stats(self) -> Dict:
+        return {}
+
+
+class TrendAnnotator:
+    """
+    Runs trend extraction over signal titles in one batch and stores the
+    results (detected_trends, keywords, hashtags) in signal_metadata.
+    With a pool (TrendExtractor.worker_pool) extraction runs in a worker process;
+    `new_phrases` (appended to by the caller as phrases are committed) is sent
+    along so the workers' matchers keep up with the parent's.
+    """
+
+    def __init__(
+        self,
+        extractor: TrendExtractor,
+        registry: Optional[PhraseRegistry] = None,
+        pool: Optional[ProcessPoolExecutor] = None,
+        new_phrases: Optional[List[Tuple[str, str]]] = None
+    ):
+        self.extractor = extractor
+        self.registry = registry
+        self.pool = pool
+        self.new_phrases = new_phrases if new_phrases is not None else []
+
+    def annotate(self, signals: List[Dict]) -> List[Dict]:
+        if not signals:
+            return signals
+
+        titles = [signal.get('title') or '' for signal in signals]
+        categories = [signal['category'] for signal in signals]
+        if self.pool is not None:
+            # A copy: the writer thread may append while the task is pickled
+            chunk = (titles, categories, None, list(self.new_phrases))
+            results, counters = self.pool.submit(extract_titles, chunk).result()
+            self.extractor.add_counters(counters)
+        else:
+            results = self.extractor.extract_many(titles, categories)
+
+        for signal, trend_data in zip(signals, results):
+            phrases = trend_data['trend_phrases']
+            # Carry integer phrase IDs for already-tracked phrases
+            if self.registry is not None:
+                phrases = self.registry.annotate(signal['category'], [dict(trend) for trend in phrases])
+
+            metadata = signal.setdefault('signal_metadata', {})
+            metadata['detected_trends'] = phrases
+            metadata['keywords'] = trend_data['keywords']
+            metadata['hashtags'] = trend_data['hashtags']
+            # Already linked: the ExtractionWorker skips this signal
+            signal['extractor_version'] = self.extractor.version
+
+        return signals
+
+
+class SourceRunner:
+    """
+    Runs one SignalSource end to end and returns signals saved per category.
+
+    Args:
+        source: The platform plugin
+        fetch_workers: Fetch threads (defaults to source.fetch_workers)
+        extract_workers: Extraction processes (0 = extract on a thread)
+        batch_size: Signals per write batch
+        batch_seconds: Longest a fetched result waits to be written
+    """
+
+    def __init__(
+        self,
+        source: SignalSource,
+        fetch_workers: Optional[int] = None,
+        extract_workers: int = 0,
+        batch_size: int = 500,
+        batch_seconds: float = 5.0
+    ):
+        self.source = source
+        self.fetch_workers = fetch_workers or source.fetch_workers
+        self.extract_workers = extract_workers
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.registry: Optional[PhraseRegistry] = None
+        self.matcher: Optional[KnownPhraseMatcher] = None
+        # Phrases committed this run, in order, for the pool workers' matchers
+        self.new_phrases: List[Tuple[str, str]] = []
+
+    def _annotator(self, db: Session) -> Tuple[Optional[TrendAnnotator], Optional[ProcessPoolExecutor]]:
+        extractor = self.source.trend_extractor
+        if not self.source.extract_trends or extractor is None:
+            return None, None
+
+        # Seed the known-phrase fast path from the stored phrase IDs
+        self.matcher = KnownPhraseMatcher()
+        self.matcher.add_many(self.registry.keys())
+        extractor.phrase_matcher = self.matcher
+        self.new_phrases = []
+
+        pool = extractor.worker_pool(self.extract_workers) if self.extract_workers > 0 else None
+        return TrendAnnotator(extractor, self.registry, pool, self.new_phrases), pool
+
+    def run(self, db: Session) -> Dict[str, int]:
+        # Serves requests-based clients from fixtures when INGEST_HTTP_FIXTURES is set
+        with fixtures_for(self.source.platform):
+            return self._run(db)
+
+    def _run(self, db: Session) -> Dict[str, int]:
+        source = self.source
+        stats: Dict[str, int] = {}
+
+        self.registry = PhraseRegistry.from_db(db)
+        source.start(db)
+        annotator, pool = self._annotator(db)
+
+        def extract(payload: Any) -> Tuple[Any, List[Dict]]:
+            # Items already saved this run (e.g. listed twice) skip extraction
+            signals = [
+                signal for signal in source.normalize(payload)
+                if signal['identifier'] not in source.seen
+            ]
+            if annotator is not None:
+                annotator.annotate(signals)
+            return payload, signals
+
+        def write(results: List[Tuple[Any, List[Dict]]]):
+            payloads = [payload for payload, _ in results]
+            signals = [signal for _, batch in results for signal in batch]
+            result = None
+
+            try:
+                if signals:
+                    result = BulkSignalWriter(self.registry).write(db, signals)
+                source.on_write(db, payloads, result)
+                db.commit()
+            except Exception:
+                db.rollback()
+                # Rolled-back phrase IDs must not stay registered
+                if result is not None:
+                    self.registry.forget(result['new_trend_keys'])
+                source.on_write_failed(payloads)
+                raise
+
+            source.seen.add_many(signal['identifier'] for signal in signals)
+            for signal in signals:
+                stats[signal['category']] = stats.get(signal['category'], 0) + 1
+
+            if result is not None:
+                # Match new phrases in later titles without re-tagging
+                if self.matcher is not None:
+                    self.matcher.add_many(result['new_trend_keys'])
+                    self.new_phrases.extend(result['new_trend_keys'])
+                logger.info(
+                    f"Committed {result['signals']} {source.platform} signals "
+                    f"({result['signals_inserted']} new), {result['trends_created']} new trends, "
+                    f"{result['associations_created']} new associations"
+                )
+
+        pipeline = IngestPipeline(
+            source.fetch,
+            extract,
+            write,
+            fetch_workers=self.fetch_workers,
+            extract_workers=max(1, self.extract_workers),
+            batch_size=self.batch_size,
+            batch_seconds=self.batch_seconds,
+            weight=lambda result: len(result[1])
+        )
+        try:
+            pipeline.run(source.jobs(db))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        source.finish(db)
+        logger.info(f"{source.platform}: {source.stats()}, dedup: {source.seen.stats()}")
+        return stats
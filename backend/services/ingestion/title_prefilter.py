@@ -0,0 +1,117 @@
+"""
+Cheap language/quality prefilter ahead of NLP extraction.
+Routes non-English, emoji-only and one-word titles around tokenizing and
+tagging, using only character-class heuristics and a tiny stopword-ratio
+language guess. Skips are counted per reason.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Optional
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+
+# Tiny high-frequency function-word lists; enough to tell English apart
+# from the languages we see most often in scraped titles.
+LANGUAGE_STOPWORDS = {
+    'en': {'the', 'and', 'to', 'of', 'a', 'in', 'is', 'it', 'for', 'my', 'this', 'with',
+           'on', 'i', 'you', 'what', 'how', 'just', 'be', 'are', 'was', 'that', 'so'},
+    'es': {'el', 'la', 'los', 'las', 'de', 'que', 'y', 'en', 'un', 'una', 'por', 'con',
+           'para', 'es', 'mi', 'del', 'se', 'lo', 'como', 'pero'},
+    'fr': {'le', 'la', 'les', 'des', 'de', 'et', 'un', 'une', 'est', 'pour', 'dans',
+           'que', 'qui', 'sur', 'pas', 'avec', 'mon', 'ma', 'du', 'au'},
+    'de': {'der', 'die', 'das', 'und', 'ist', 'nicht', 'ein', 'eine', 'mit', 'ich',
+           'zu', 'den', 'von', 'auf', 'für', 'mein', 'sich', 'auch', 'wie', 'im'},
+    'pt': {'o', 'os', 'as', 'de', 'que', 'e', 'um', 'uma', 'para', 'com', 'não',
+           'meu', 'minha', 'do', 'da', 'em', 'no', 'na', 'se', 'mais'},
+    'it': {'il', 'lo', 'gli', 'di', 'che', 'e', 'un', 'una', 'per', 'con', 'non',
+           'mio', 'mia', 'del', 'della', 'sono', 'nel', 'anche', 'come', 'ma'},
+}
+
+
+class TitlePrefilter:
+    """
+    Decides whether a title is worth running through NLP extraction.
+    check() returns None for titles to keep, or the skip reason.
+    """
+
+    def __init__(
+        self,
+        min_words: int = 2,
+        min_letters: int = 4,
+        min_latin_ratio: float = 0.7,
+        min_language_hits: int = 2
+    ):
+        self.min_words = min_words
+        self.min_letters = min_letters
+        self.min_latin_ratio = min_latin_ratio
+        self.min_language_hits = min_language_hits
+
+        self.passed = 0
+        self.skipped = Counter()
+
+    def guess_language(self, words) -> Optional[str]:
+        """Language whose stopwords hit most often, or None if nothing stands out"""
+        # Distinct words only, so "La La Land" isn't two Spanish hits
+        distinct = set(words)
+        hits = {
+            lang: len(distinct & stopwords)
+            for lang, stopwords in LANGUAGE_STOPWORDS.items()
+        }
+        lang, count = max(hits.items(), key=lambda item: item[1])
+        if count < self.min_language_hits or count == hits['en']:
+            return None
+        return lang
+
+    def check(self, title: str) -> Optional[str]:
+        """Skip reason for a low-value title, or None to keep it"""
+        if not title or not title.strip():
+            return 'empty'
+
+        letters = [ch for ch in title if ch.isalpha()]
+        if len(letters) < self.min_letters:
+            return 'no_text'  # emoji-only, numbers, punctuation
+
+        latin = sum(1 for ch in letters if ch.isascii())
+        if latin / len(letters) < self.min_latin_ratio:
+            return 'non_latin'
+
+        words = [word.lower() for word in WORD_PATTERN.findall(title.replace('#', ' '))]
+        if len(words) < self.min_words:
+            return 'too_short'
+
+        language = self.guess_language(words)
+        if language is not None and language != 'en':
+            return 'non_english'
+
+        return None
+
+    def allow(self, title: str) -> bool:
+        """check() plus counters"""
+        reason = self.check(title)
+        if reason is None:
+            self.passed += 1
+            return True
+        self.skipped[reason] += 1
+        return False
+
+    def take_counters(self) -> Dict:
+        """Counters since the last call, then reset them (see ExtractionCache.take_counters)"""
+        counters = {'passed': self.passed, 'skipped': dict(self.skipped)}
+        self.passed = 0
+        self.skipped = Counter()
+        return counters
+
+    def add_counters(self, counters: Dict):
+        """Fold in counters taken from a pool worker's copy of this prefilter"""
+        self.passed += counters['passed']
+        self.skipped.update(counters['skipped'])
+
+    def stats(self) -> Dict:
+        total = self.passed + sum(self.skipped.values())
+        return {
+            'passed': self.passed,
+            'skipped': sum(self.skipped.values()),
+            'skipped_by_reason': dict(self.skipped),
+            'skip_rate': round(sum(self.skipped.values()) / total, 4) if total else 0.0,
+        }
@@ -5,38 +5,78 @@ Extracts meaningful trend phrases using multiple methods:
 2. Capitalized multi-word phrases (brand/product names)
 3. Noun phrase extraction via POS tagging
 4. Keyword extraction
+A 'fast' mode swaps 3-4 for stopword-bounded n-grams and skips tagging.
 """
 
+import os
 import re
 from collections import defaultdict
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Iterable
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.tag import pos_tag
+from services.ingestion.extraction_cache import ExtractionCache, make_cache_key
+from services.ingestion.phrase_matcher import KnownPhraseMatcher
+from services.ingestion.heavy_hitters import SpaceSaving
+from services.ingestion.title_prefilter import TitlePrefilter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Extra stopwords for social media titles (on top of NLTK's English list)
+SOCIAL_STOPWORDS = frozenset({
+    'reddit', 'post', 'comment', 'new', 'best', 'good', 'great', 'really',
+    'help', 'anyone', 'everyone', 'someone', 'something', 'would', 'could',
+    'get', 'got', 'make', 'made', 'need', 'want', 'use', 'used', 'like',
+    'just', 'know', 'think', 'people', 'time', 'way'
+})
 
-# Download required NLTK data on first run
-def download_nltk_data():
-    """Download required NLTK data packages"""
-    packages = ['punkt', 'averaged_perceptron_tagger', 'stopwords', 'punkt_tab']
-    for package in packages:
-        try:
-            nltk.data.find(f'tokenizers/{package}')
-        except LookupError:
-            try:
-                logger.info(f"Downloading NLTK package: {package}")
-                nltk.download(package, quiet=True)
-            except:
-                pass
+# Bump whenever extraction output changes so cached results are invalidated
+EXTRACTOR_VERSION = "3"
+
+# 'full' runs POS tagging; 'fast' trades recall for throughput (regex + n-grams)
+EXTRACTOR_MODES = ('full', 'fast')
+
+# Titles shorter than this yield no noun phrases, so they are never tagged
+MIN_TAGGED_TITLE_CHARS = 10
+
+PREFLIGHT_HINT = "run `python -m services.ingestion.nltk_preflight --install`"
+
+
+# NLTK is imported and its data loaded lazily, on first use, so importing
+# this module (or services.ingestion) stays cheap and never hits the network.
+# Missing corpora are reported, not downloaded - see nltk_preflight.py.
+
+@lru_cache(maxsize=None)
+def _load_stopwords() -> frozenset:
+    """Load NLTK's English stopwords once per process"""
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except LookupError:
+        logger.warning(f"NLTK stopwords not installed, using built-in list only ({PREFLIGHT_HINT})")
+        return frozenset()
 
-# Initialize on import
-download_nltk_data()
+
+@lru_cache(maxsize=None)
+def _load_tokenizer():
+    """Import NLTK's word tokenizer once per process"""
+    from nltk.tokenize import word_tokenize
+    return word_tokenize
+
+
+@lru_cache(maxsize=None)
+def _load_tagger():
+    """Load the perceptron POS tagger once per process and reuse it"""
+    from nltk.tag import PerceptronTagger
+    try:
+        return PerceptronTagger()
+    except LookupError:
+        logger.error(f"NLTK POS tagger not installed ({PREFLIGHT_HINT})")
+        raise
 
 
 class TrendExtractor:
@@ -45,28 +85,53 @@ class TrendExtractor:
     Extracts trend phrases from social media content.
     """
     
-    def __init__(self):
-        """Initialize with stopwords and patterns"""
-        # Extended stopwords for social media
-        try:
-            base_stopwords = set(stopwords.words('english'))
-        except:
-            nltk.download('stopwords')
-            base_stopwords = set(stopwords.words('english'))
-        
-        self.stopwords = base_stopwords.union({
-            'reddit', 'post', 'comment', 'new', 'best', 'good', 'great', 'really',
-            'help', 'anyone', 'everyone', 'someone', 'something', 'would', 'could',
-            'get', 'got', 'make', 'made', 'need', 'want', 'use', 'used', 'like',
-            'just', 'know', 'think', 'people', 'time', 'way'
-        })
+    def __init__(
+        self,
+        cache: Optional[ExtractionCache] = None,
+        phrase_matcher: Optional[KnownPhraseMatcher] = None,
+        known_phrase_fast_path: bool = False,
+        mode: str = 'full',
+        prefilter: Optional[TitlePrefilter] = None
+    ):
+        """
+        Initialize thresholds; NLTK resources load on first use.
+        
+        Args:
+            cache: Optional ExtractionCache for memoizing title results
+            phrase_matcher: Optional matcher for already-tracked phrases
+            known_phrase_fast_path: Skip NLP for titles with a known phrase
+            mode: 'full' (POS-tagged noun phrases) or 'fast' (regex/n-grams only)
+            prefilter: Optional TitlePrefilter that skips low-value titles
+        """
+        if mode not in EXTRACTOR_MODES:
+            raise ValueError(f"Unknown extractor mode '{mode}', expected one of {EXTRACTOR_MODES}")
+        self.mode = mode
+        self.cache = cache
+        self.prefilter = prefilter
+        self.phrase_matcher = phrase_matcher
+        self.known_phrase_fast_path = known_phrase_fast_path
+        
+        # Extended stopwords for social media (built lazily, see `stopwords`)
+        self._stopwords = None
         
         # Minimum quality thresholds
         self.min_phrase_length = 2  # words
         self.max_phrase_length = 5  # words
         self.min_word_length = 3  # characters
         
-        logger.info("TrendExtractor initialized (NLTK-based)")
+        logger.info(f"TrendExtractor initialized (mode={mode})")
+    
+    @property
+    def version(self) -> str:
+        """Identifies this extractor's output (stored on signals it has processed)"""
+        return f"{EXTRACTOR_VERSION}:{self.mode}"
+    
+    @property
+    def stopwords(self) -> frozenset:
+        """NLTK English stopwords plus social media filler words"""
+        if self._stopwords is None:
+            self._stopwords = _load_stopwords() | SOCIAL_STOPWORDS
+        return self._stopwords
     
     def normalize_phrase(self, phrase: str) -> str:
         """
@@ -128,21 +193,52 @@ class TrendExtractor:
         
         return phrases
     
-    def extract_noun_phrases(self, text: str) -> List[Tuple[str, float]]:
+    def tag_title(self, text: str) -> List[Tuple[str, str]]:
         """
-        Extract noun phrases using NLTK POS tagging.
-        Returns list of (phrase, score) tuples.
+        Shared analysis stage: tokenize and POS tag a title once.
+        The result feeds both extract_noun_phrases and extract_keywords.
         """
-        if not text or len(text) < 10:
+        if not text:
             return []
         
         try:
-            # Tokenize and POS tag
-            tokens = word_tokenize(text.lower())
-            tagged = pos_tag(tokens)
+            tokens = _load_tokenizer()(text.lower())
+            return _load_tagger().tag(tokens)
         except Exception as e:
             logger.error(f"Error in POS tagging: {e}")
             return []
+    
+    def tag_titles(self, texts: List[str]) -> List[List[Tuple[str, str]]]:
+        """
+        Batch version of tag_title.
+        Tokenizes every title, then tags the whole batch in one tag_sents call.
+        """
+        try:
+            word_tokenize = _load_tokenizer()
+            token_lists = [word_tokenize(text.lower()) if text else [] for text in texts]
+            return _load_tagger().tag_sents(token_lists)
+        except Exception as e:
+            logger.error(f"Error in batch POS tagging: {e}")
+            # Fall back to per-title tagging so one bad title doesn't sink the batch
+            return [self.tag_title(text) for text in texts]
+    
+    def extract_noun_phrases(
+        self,
+        text: str,
+        tagged: Optional[List[Tuple[str, str]]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Extract noun phrases using NLTK POS tagging.
+        Returns list of (phrase, score) tuples.
+        
+        Pass `tagged` (from tag_title/tag_titles) to reuse an existing
+        tagging pass instead of tagging the text again.
+        """
+        if not text or len(text) < MIN_TAGGED_TITLE_CHARS:
+            return []
+        
+        if tagged is None:
+            tagged = self.tag_title(text)
         
         # Extract noun phrases using simple grammar patterns
         phrases = []
@@ -185,17 +281,17 @@ class TrendExtractor:
         
         return phrases
     
-    def extract_keywords(self, text: str) -> List[str]:
-        """Extract single important keywords"""
+    def extract_keywords(
+        self,
+        text: str,
+        tagged: Optional[List[Tuple[str, str]]] = None
+    ) -> List[str]:
+        """Extract single important keywords (reuses `tagged` if given)"""
         if not text:
             return []
         
-        try:
-            tokens = word_tokenize(text.lower())
-            tagged = pos_tag(tokens)
-        except Exception as e:
-            logger.error(f"Error extracting keywords: {e}")
-            return []
+        if tagged is None:
+            tagged = self.tag_title(text)
         
         keywords = []
         for word, pos in tagged:
@@ -208,31 +304,104 @@ class TrendExtractor:
         
         return keywords
     
-    def extract_from_title(self, title: str) -> Dict[str, any]:
+    def cache_key(self, title: str) -> str:
+        """Extraction cache key for a title under this extractor's version and mode"""
+        return make_cache_key(title, self.version)
+    
+    def extract_from_title(
+        self,
+        title: str,
+        tagged: Optional[List[Tuple[str, str]]] = None,
+        category: Optional[str] = None
+    ) -> Dict[str, any]:
         """
         Main extraction method for a single post title.
         Returns dict with detected trends and metadata.
+        
+        The title is tokenized and tagged once; pass `tagged` when the
+        caller has already tagged it (e.g. extract_batch). With a cache
+        configured, titles seen in earlier runs skip NLP entirely. With a
+        phrase matcher and `category`, already-tracked phrases are matched
+        first (and, with the fast path on, NLP is skipped when any match).
         """
-        if not title:
-            return {
-                'trend_phrases': [],
-                'keywords': [],
-                'hashtags': [],
-                'method': 'none'
+        if title and self.prefilter is not None and not self.prefilter.allow(title):
+            return self._skipped_result(title)
+        
+        known = self._known_phrases(title, category)
+        if known and self.known_phrase_fast_path:
+            return self._extract_known_only(title, known)
+        
+        if not title or self.cache is None:
+            return self._with_known_phrases(self._extract(title, tagged), known)
+        
+        key = self.cache_key(title)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._extract(title, tagged)
+            self.cache.set(key, result)
+        
+        return self._with_known_phrases(result, known)
+    
+    def _skipped_result(self, title: str) -> Dict:
+        """Result for a title the prefilter routed around NLP"""
+        return {
+            'trend_phrases': [],
+            'keywords': [],
+            'hashtags': self.extract_hashtags(title),
+            'method': 'prefiltered'
+        }
+    
+    def _known_phrases(self, title: str, category: Optional[str]) -> List[Dict]:
+        """Tracked phrases of `category` that occur in the title"""
+        if self.phrase_matcher is None or not title or not category:
+            return []
+        
+        return [
+            {
+                'phrase': phrase,
+                'normalized': phrase,
+                'score': 1.4,  # Already confirmed by earlier signals
+                'method': 'known_phrase'
             }
+            for phrase in self.phrase_matcher.match(category, self.normalize_phrase(title))
+        ]
+    
+    def _with_known_phrases(self, result: Dict, known: List[Dict]) -> Dict:
+        """Merge known-phrase matches into an NLP extraction result"""
+        if not known:
+            return result
         
-        # Extract using multiple methods
+        # NLP phrases go first so they keep their own method/score on overlap
+        return {**result, 'trend_phrases': self._rank_phrases(result['trend_phrases'] + known)}
+    
+    def _extract_known_only(self, title: str, known: List[Dict]) -> Dict:
+        """Fast path: regex methods plus known phrases, no tokenizing or tagging"""
+        hashtags, phrases = self._regex_phrases(title)
+        
+        return {
+            'trend_phrases': self._rank_phrases(phrases + known),
+            'keywords': list(dict.fromkeys(self._untagged_keywords(title)))[:10],
+            'hashtags': hashtags,
+            'method': 'known_phrase'
+        }
+    
+    def _untagged_keywords(self, title: str) -> List[str]:
+        """Keyword candidates without POS tags: every non-stopword word"""
+        return [
+            word for word in self.normalize_phrase(title).split()
+            if len(word) >= self.min_word_length and word.isalpha() and word not in self.stopwords
+        ]
+    
+    def _regex_phrases(self, title: str) -> Tuple[List[str], List[Dict]]:
+        """Hashtags and capitalized phrases (the methods that need no tagging)"""
         hashtags = self.extract_hashtags(title)
         cap_phrases = self.extract_capitalized_phrases(title)
-        noun_phrases = self.extract_noun_phrases(title)
-        keywords = self.extract_keywords(title)
         
-        # Combine all detected phrases
-        all_phrases = []
+        phrases = []
         
         # Add hashtags as trends
         for tag in hashtags:
-            all_phrases.append({
+            phrases.append({
                 'phrase': tag,
                 'normalized': self.normalize_phrase(tag),
                 'score': 1.5,  # Hashtags are explicit signals
@@ -241,23 +410,17 @@ class TrendExtractor:
         
         # Add capitalized phrases
         for phrase in cap_phrases:
-            all_phrases.append({
+            phrases.append({
                 'phrase': phrase,
                 'normalized': self.normalize_phrase(phrase),
                 'score': 1.3,  # Strong signal
                 'method': 'capitalized'
             })
         
-        # Add noun phrases
-        for phrase, score in noun_phrases:
-            all_phrases.append({
-                'phrase': phrase,
-                'normalized': self.normalize_phrase(phrase),
-                'score': score,
-                'method': 'noun_phrase'
-            })
-        
-        # Deduplicate by normalized phrase
+        return hashtags, phrases
+    
+    def _rank_phrases(self, all_phrases: List[Dict]) -> List[Dict]:
+        """Deduplicate by normalized phrase and keep the top 5 by score"""
         seen = set()
         unique_phrases = []
         for item in all_phrases:
@@ -269,17 +432,300 @@ class TrendExtractor:
         # Sort by score
         unique_phrases.sort(key=lambda x: x['score'], reverse=True)
         
+        return unique_phrases[:5]  # Top 5 trends per post
+    
+    def _extract(
+        self,
+        title: str,
+        tagged: Optional[List[Tuple[str, str]]] = None
+    ) -> Dict[str, any]:
+        """Run the extraction methods on one title (no caching)"""
+        if not title:
+            return {
+                'trend_phrases': [],
+                'keywords': [],
+                'hashtags': [],
+                'method': 'none'
+            }
+        
+        if self.mode == 'fast':
+            return self._extract_fast(title)
+        
+        # Extract using multiple methods
+        hashtags, all_phrases = self._regex_phrases(title)
+        
+        if len(title) < MIN_TAGGED_TITLE_CHARS:
+            # Too short for a noun phrase: skip tagging, keep plain keywords
+            noun_phrases = []
+            keywords = self._untagged_keywords(title)
+        else:
+            # Single tokenize/POS-tag pass shared by both NLP extractors
+            if tagged is None:
+                tagged = self.tag_title(title)
+            noun_phrases = self.extract_noun_phrases(title, tagged=tagged)
+            keywords = self.extract_keywords(title, tagged=tagged)
+        
+        # Add noun phrases
+        for phrase, score in noun_phrases:
+            all_phrases.append({
+                'phrase': phrase,
+                'normalized': self.normalize_phrase(phrase),
+                'score': score,
+                'method': 'noun_phrase'
+            })
+        
         return {
-            'trend_phrases': unique_phrases[:5],  # Top 5 trends per post
+            'trend_phrases': self._rank_phrases(all_phrases),
             'keywords': list(set(keywords))[:10],  # Top 10 keywords
             'hashtags': hashtags,
             'method': 'combined'
         }
     
-    def extract_batch(self, titles: List[str], categories: List[str] = None) -> Dict:
+    def _extract_fast(self, title: str) -> Dict[str, any]:
+        """
+        Regex-only extraction tier: hashtags, capitalized phrases and
+        stopword-bounded n-gram windows. Skips tokenizing and POS tagging.
+        """
+        hashtags, all_phrases = self._regex_phrases(title)
+        
+        # Split the title into runs of content words, broken at stopwords,
+        # short words, digits and punctuation
+        runs = [[]]
+        keywords = []
+        for word in re.findall(r"[a-z][a-z'\-]*|[^a-z\s]+", title.lower()):
+            if word[0].isalpha() and len(word) >= self.min_word_length and word not in self.stopwords:
+                runs[-1].append(word)
+                if word.isalpha():
+                    keywords.append(word)
+            elif runs[-1]:
+                runs.append([])
+        
+        # 2-3 word windows inside each run stand in for noun phrases
+        for run in runs:
+            for n in (3, 2):
+                for i in range(len(run) - n + 1):
+                    phrase = ' '.join(run[i:i + n])
+                    all_phrases.append({
+                        'phrase': phrase,
+                        'normalized': self.normalize_phrase(phrase),
+                        'score': 1.0 + 0.1 * (n - 2),  # Prefer longer windows
+                        'method': 'ngram'
+                    })
+        
+        return {
+            'trend_phrases': self._rank_phrases(all_phrases),
+            'keywords': list(set(keywords))[:10],  # Top 10 keywords
+            'hashtags': hashtags,
+            'method': 'fast'
+        }
+    
+    def extract_many(
+        self,
+        titles: List[str],
+        categories: List[str] = None,
+        unfiltered: Optional[List[bool]] = None
+    ) -> List[Dict]:
+        """
+        Per-title extraction results for a batch (batched tagging and cache lookups).
+        Titles flagged in `unfiltered` bypass the prefilter (e.g. bare search
+        keywords, which are often a single word).
+        """
+        return [result for _, _, result in self._iter_title_results(titles, categories, unfiltered)]
+    
+    def _iter_title_results(
+        self,
+        titles: List[str],
+        categories: List[str] = None,
+        unfiltered: Optional[List[bool]] = None
+    ):
+        """Yield (title, category, extraction result) for each title in order"""
+        resolved_categories = [
+            categories[i] if categories and i < len(categories) else 'unknown'
+            for i in range(len(titles))
+        ]
+        results = [None] * len(titles)
+        
+        # Route low-value titles (non-English, emoji-only, one word) around NLP
+        if self.prefilter is not None:
+            for i, title in enumerate(titles):
+                if unfiltered and unfiltered[i]:
+                    continue
+                if title and not self.prefilter.allow(title):
+                    results[i] = self._skipped_result(title)
+        
+        # Match already-tracked phrases first; on the fast path a match skips NLP
+        known = [
+            self._known_phrases(title, category) if results[i] is None else []
+            for i, (title, category) in enumerate(zip(titles, resolved_categories))
+        ]
+        if self.known_phrase_fast_path:
+            for i, matches in enumerate(known):
+                if matches:
+                    results[i] = self._extract_known_only(titles[i], matches)
+                    known[i] = []
+        
+        # Serve repeat titles from the cache in one bulk lookup
+        keys = {}
+        if self.cache is not None:
+            keys = {
+                i: self.cache_key(title)
+                for i, title in enumerate(titles)
+                if title and results[i] is None
+            }
+            cached = self.cache.get_many(list(set(keys.values())))
+            for i, key in keys.items():
+                results[i] = cached.get(key)
+        
+        # Tag the remaining titles in one tag_sents call (fast mode and
+        # short titles are never tagged)
+        pending = [i for i, result in enumerate(results) if result is None]
+        tagged_titles = {}
+        if self.mode == 'full':
+            to_tag = [i for i in pending if titles[i] and len(titles[i]) >= MIN_TAGGED_TITLE_CHARS]
+            tagged_titles = dict(zip(to_tag, self.tag_titles([titles[i] for i in to_tag])))
+        
+        fresh = {}
+        for i in pending:
+            results[i] = self._extract(titles[i], tagged_titles.get(i))
+            if i in keys:
+                fresh[keys[i]] = results[i]
+        
+        if fresh:
+            self.cache.set_many(fresh)
+        
+        for i, title in enumerate(titles):
+            yield title, resolved_categories[i], self._with_known_phrases(results[i], known[i])
+    
+    def _chunk_phrase_stats(self, titles: List[str], categories: List[str]) -> List[Tuple[str, Dict]]:
+        """
+        Build phrase_stats for one chunk of a parallel batch.
+        
+        Kept order-preserving (ordered lists instead of sets, per-occurrence
+        scores instead of a running total) so the parent can merge chunks
+        into exactly the phrase_stats the serial loop would have built.
+        """
+        chunk_stats = {}
+        
+        for title, category, result in self._iter_title_results(titles, categories):
+            for trend in result['trend_phrases']:
+                stats = chunk_stats.setdefault(trend['normalized'], {
+                    'scores': [],
+                    'categories': [],
+                    'methods': [],
+                    'examples': []
+                })
+                stats['scores'].append(trend['score'])
+                if category not in stats['categories']:
+                    stats['categories'].append(category)
+                if trend['method'] not in stats['methods']:
+                    stats['methods'].append(trend['method'])
+                if len(stats['examples']) < 3:
+                    stats['examples'].append(title[:100])
+        
+        return list(chunk_stats.items())
+    
+    @staticmethod
+    def _merge_chunk_stats(phrase_stats: Dict, chunk_stats: List[Tuple[str, Dict]]):
+        """Fold one chunk's stats into the batch-wide phrase_stats"""
+        for norm, chunk in chunk_stats:
+            stats = phrase_stats[norm]
+            stats['count'] += len(chunk['scores'])
+            # Add scores one at a time so float totals match the serial loop
+            for score in chunk['scores']:
+                stats['total_score'] += score
+            stats['categories'].update(chunk['categories'])
+            stats['methods'].update(chunk['methods'])
+            
+            room = 3 - len(stats['examples'])
+            if room > 0:
+                stats['examples'].extend(chunk['examples'][:room])
+    
+    def _extract_parallel(
+        self,
+        titles: List[str],
+        categories: List[str],
+        phrase_stats: Dict,
+        workers: int,
+        chunk_size: int
+    ):
+        """Extract chunks of titles in a process pool and merge the results"""
+        resolved_categories = [
+            categories[i] if categories and i < len(categories) else 'unknown'
+            for i in range(len(titles))
+        ]
+        chunks = [
+            (titles[i:i + chunk_size], resolved_categories[i:i + chunk_size])
+            for i in range(0, len(titles), chunk_size)
+        ]
+        
+        logger.info(f"Extracting {len(titles)} titles in {len(chunks)} chunks across {workers} workers")
+        
+        with self.worker_pool(workers) as executor:
+            # map() yields in submission order, which keeps the merge deterministic
+            for chunk_stats, counters in executor.map(_extract_chunk, chunks):
+                self._merge_chunk_stats(phrase_stats, chunk_stats)
+                self.add_counters(counters)
+    
+    def worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Long-lived process pool whose workers each hold a copy of this
+        extractor. Submit extract_titles((titles, categories)) to it to get
+        extract_many() results plus the worker's counters, which belong in
+        add_counters(). Workers see the known-phrase matcher as it was when
+        the pool started, plus any phrases sent along with extract_titles.
+        
+        Workers are spawned, not forked: the config is pickled, so each one
+        opens its own cache connection and gets fresh locks instead of
+        inheriting the parent's SQLite handle (unsafe across fork) or a lock
+        another thread happened to hold at fork time.
+        """
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self._worker_config(),)
+        )
+    
+    def take_counters(self) -> Dict:
+        """Cache and prefilter counters since the last call (reset afterwards)"""
+        return {
+            'cache': self.cache.take_counters() if self.cache is not None else None,
+            'prefilter': self.prefilter.take_counters() if self.prefilter is not None else None,
+        }
+    
+    def add_counters(self, counters: Dict):
+        """Merge counters a pool worker took from its copy of this extractor"""
+        if self.cache is not None and counters['cache'] is not None:
+            self.cache.add_counters(counters['cache'])
+        if self.prefilter is not None and counters['prefilter'] is not None:
+            self.prefilter.add_counters(counters['prefilter'])
+    
+    def _worker_config(self) -> Dict:
+        """Constructor kwargs used to rebuild this extractor inside pool workers"""
+        return {
+            'cache': self.cache,
+            'phrase_matcher': self.phrase_matcher,
+            'known_phrase_fast_path': self.known_phrase_fast_path,
+            'mode': self.mode,
+            'prefilter': self.prefilter
+        }
+    
+    def extract_batch(
+        self,
+        titles: List[str],
+        categories: List[str] = None,
+        workers: int = 1,
+        chunk_size: int = 500
+    ) -> Dict:
         """
         Extract trends from a batch of titles.
         Returns aggregated trend statistics.
+        
+        Args:
+            titles: Titles to process
+            categories: Category per title (defaults to 'unknown')
+            workers: Number of worker processes (1 = serial, None = all cores)
+            chunk_size: Titles per chunk sent to each worker
         """
         if not titles:
             return {'detected_trends': []}
@@ -293,21 +739,23 @@ class TrendExtractor:
             'examples': []
         })
         
-        for i, title in enumerate(titles):
-            category = categories[i] if categories and i < len(categories) else 'unknown'
-            
-            result = self.extract_from_title(title)
-            
-            for trend in result['trend_phrases']:
-                norm = trend['normalized']
-                phrase_stats[norm]['count'] += 1
-                phrase_stats[norm]['total_score'] += trend['score']
-                phrase_stats[norm]['categories'].add(category)
-                phrase_stats[norm]['methods'].add(trend['method'])
-                
-                # Keep a few example titles
-                if len(phrase_stats[norm]['examples']) < 3:
-                    phrase_stats[norm]['examples'].append(title[:100])
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers > 1 and len(titles) > chunk_size:
+            self._extract_parallel(titles, categories, phrase_stats, workers, chunk_size)
+        else:
+            for title, category, result in self._iter_title_results(titles, categories):
+                for trend in result['trend_phrases']:
+                    norm = trend['normalized']
+                    phrase_stats[norm]['count'] += 1
+                    phrase_stats[norm]['total_score'] += trend['score']
+                    phrase_stats[norm]['categories'].add(category)
+                    phrase_stats[norm]['methods'].add(trend['method'])
+                    
+                    # Keep a few example titles
+                    if len(phrase_stats[norm]['examples']) < 3:
+                        phrase_stats[norm]['examples'].append(title[:100])
         
         # Convert to list and calculate final scores
         detected_trends = []
@@ -335,6 +783,126 @@ class TrendExtractor:
             'unique_trends_found': len(detected_trends)
         }
 
+    def extract_stream(
+        self,
+        titles: Iterable[str],
+        categories: Optional[Iterable[str]] = None,
+        capacity: int = 10000,
+        batch_size: int = 500
+    ) -> Dict:
+        """
+        Streaming, constant-memory variant of extract_batch.
+        
+        Titles (and optional categories) are consumed lazily in batches, and
+        candidate phrases are tracked with a Space-Saving heavy-hitter table
+        of at most `capacity` phrases instead of an unbounded dict. Phrases
+        seen more than N / capacity times are guaranteed to be reported.
+        
+        `signal_count` is the guaranteed (lower-bound) count; the matching
+        upper bound is reported as `signal_count_upper`.
+        """
+        counter = SpaceSaving(capacity)
+        new_stats = lambda: {
+            'total_score': 0.0,
+            'categories': set(),
+            'methods': set(),
+            'examples': []
+        }
+        
+        title_iter = iter(titles)
+        category_iter = iter(categories) if categories is not None else None
+        total = 0
+        
+        while True:
+            batch = list(islice(title_iter, batch_size))
+            if not batch:
+                break
+            batch_categories = list(islice(category_iter, len(batch))) if category_iter else None
+            total += len(batch)
+            
+            for title, category, result in self._iter_title_results(batch, batch_categories):
+                for trend in result['trend_phrases']:
+                    stats = counter.offer(trend['normalized'], new_stats)
+                    stats['total_score'] += trend['score']
+                    stats['methods'].add(trend['method'])
+                    
+                    # Cap per-phrase detail so memory stays bounded
+                    if len(stats['categories']) < 10:
+                        stats['categories'].add(category)
+                    if len(stats['examples']) < 3:
+                        stats['examples'].append(title[:100])
+        
+        detected_trends = []
+        for normalized_phrase, count, error, stats in counter.items():
+            observed = count - error
+            # Only keep trends that appear multiple times
+            if observed >= 2:
+                detected_trends.append({
+                    'normalized_phrase': normalized_phrase,
+                    'signal_count': observed,
+                    'signal_count_upper': count,
+                    'avg_score': stats['total_score'] / observed,
+                    'categories': list(stats['categories']),
+                    'extraction_methods': list(stats['methods']),
+                    'example_titles': stats['examples']
+                })
+        
+        # Sort by signal count and score
+        detected_trends.sort(
+            key=lambda x: (x['signal_count'], x['avg_score']),
+            reverse=True
+        )
+        
+        return {
+            'detected_trends': detected_trends,
+            'total_titles_processed': total,
+            'unique_trends_found': len(detected_trends),
+            'phrases_evicted': counter.evictions
+        }
+
+
+# Per-process extractor for extract_batch(workers > 1); built once per worker
+_worker_extractor = None
+# How many of the phrases sent with extract_titles this worker has matched on
+_worker_phrases_added = 0
+
+
+def _init_worker(config: Dict):
+    """Process pool initializer: build this worker's TrendExtractor once"""
+    global _worker_extractor
+    _worker_extractor = TrendExtractor(**config)
+
+
+def _extract_chunk(chunk: Tuple[List[str], List[str]]) -> Tuple[List[Tuple[str, Dict]], Dict]:
+    """Process pool task: extract one chunk with the worker's extractor"""
+    titles, categories = chunk
+    chunk_stats = _worker_extractor._chunk_phrase_stats(titles, categories)
+    return chunk_stats, _worker_extractor.take_counters()
+
+
+def extract_titles(chunk: Tuple) -> Tuple[List[Dict], Dict]:
+    """
+    Process pool task: extract_many() for one chunk with the worker's
+    extractor, plus the cache/prefilter counters it accumulated (merge them
+    with TrendExtractor.add_counters in the parent).
+
+    chunk is (titles, categories) or (titles, categories, unfiltered,
+    new_phrases), where new_phrases lists every (category, phrase) the
+    parent added to its matcher since the pool started, in order; the
+    worker adds the ones it hasn't seen before extracting.
+    """
+    global _worker_phrases_added
+    titles, categories = chunk[:2]
+    unfiltered, new_phrases = chunk[2:] if len(chunk) > 2 else (None, None)
+
+    matcher = _worker_extractor.phrase_matcher
+    if matcher is not None and new_phrases and len(new_phrases) > _worker_phrases_added:
+        matcher.add_many(new_phrases[_worker_phrases_added:])
+        _worker_phrases_added = len(new_phrases)
+
+    results = _worker_extractor.extract_many(titles, categories, unfiltered)
+    return results, _worker_extractor.take_counters()
+
 
 def main():
     """Test the trend extractor"""
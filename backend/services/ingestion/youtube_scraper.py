@@ -5,21 +5,24 @@ Collects trending Shorts data across all 14 categories
 
 import os
 import sys
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import List, Dict
-import json
+from typing import Iterable, List, Dict, Optional, Tuple
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+import httplib2
 from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.signal import RawSignal
 from app.config import settings
+from services.ingestion.checkpoints import CheckpointStore
+from services.ingestion.http_fixtures import google_http
+from services.ingestion.resilience import YOUTUBE_HOST, RetryPolicy
+from services.ingestion.sources import SignalSource, SourceRunner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -44,11 +47,71 @@ CATEGORY_KEYWORDS = {
 }
 
 
-class YouTubeScraper:
-    def __init__(self, api_key: str):
+# Quota units per call (YouTube Data API v3); the default project quota
+# is 10,000 units per day
+QUOTA_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+}
+
+# Most IDs videos().list accepts in one call
+VIDEOS_PER_REQUEST = 50
+
+# Most results search().list returns per page
+SEARCH_PAGE_SIZE = 50
+
+
+class QuotaTracker:
+    """Counts quota units spent this run against a budget."""
+    
+    def __init__(self, budget: int = 10000):
+        self.budget = budget
+        self.calls = Counter()
+    
+    @property
+    def spent(self) -> int:
+        return sum(QUOTA_COSTS[method] * count for method, count in self.calls.items())
+    
+    @property
+    def remaining(self) -> int:
+        return self.budget - self.spent
+    
+    def can_spend(self, method: str, calls: int = 1) -> bool:
+        return QUOTA_COSTS[method] * calls <= self.remaining
+    
+    def spend(self, method: str, calls: int = 1):
+        self.calls[method] += calls
+    
+    def stats(self) -> Dict:
+        return {
+            "spent": self.spent,
+            "budget": self.budget,
+            "calls": dict(self.calls),
+        }
+
+
+class YouTubeScraper(SignalSource):
+    platform = "youtube"
+    
+    def __init__(self, api_key: str, quota_budget: Optional[int] = None):
         """Initialize YouTube API client"""
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        super().__init__()  # self.seen: videos already stored, checked before the database
+        # http is a record/replay stand-in when INGEST_HTTP_FIXTURES is set
+        timeout = settings.SCRAPER_REQUEST_TIMEOUT_SECONDS
+        http = google_http("youtube", timeout=timeout) or httplib2.Http(timeout=timeout)
+        self.youtube = build('youtube', 'v3', developerKey=api_key, http=http)
+        self.resilience = RetryPolicy.from_settings()  # 5xx/429/timeouts retried; quota errors are not
         self.max_results_per_search = 10  # Conservative to stay within quota
+        self.quota = QuotaTracker(quota_budget or settings.YOUTUBE_QUOTA_PER_RUN)
+        self.checkpoints = CheckpointStore("youtube")  # Last successful search per keyword
+        self.max_search_pages = settings.YOUTUBE_MAX_SEARCH_PAGES
+        
+        # Per-run plan, filled by jobs()
+        self.categories = list(CATEGORY_KEYWORDS.keys())
+        self.candidates = {}
+        self.searched = []
+        self.failed_keywords = set()
+        self.newest = {}
         
     def calculate_engagement_score(self, video: Dict) -> float:
         """
@@ -69,118 +132,272 @@ class YouTubeScraper:
         score = (normalized_views * 0.4) + (normalized_likes * 0.4) + (normalized_comments * 0.2)
         return round(score, 2)
     
-    def search_shorts(self, keyword: str, max_results: int = 10) -> List[Dict]:
+    def search_window(self, keyword: str, now: datetime) -> datetime:
         """
-        Search for YouTube Shorts by keyword
-        Returns list of video IDs
+        publishedAfter for a keyword: its last successful search, minus an
+        overlap for videos indexed late, or YOUTUBE_INITIAL_WINDOW_DAYS back
+        on the first run
         """
-        try:
-            # Search for videos
-            search_response = self.youtube.search().list(
-                q=keyword,
-                part='id,snippet',
-                maxResults=max_results,
-                type='video',
-                videoDuration='short',  # Shorts are typically under 60 seconds
-                order='viewCount',  # Get trending videos
-                publishedAfter='2025-10-01T00:00:00Z'  # Recent videos only
-            ).execute()
-            
-            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-            
-            if not video_ids:
-                return []
-            
-            # Get detailed statistics for these videos
-            videos_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
-            
-            return videos_response.get('items', [])
-            
-        except HttpError as e:
-            logger.error(f"YouTube API error for keyword '{keyword}': {e}")
-            return []
+        checkpoint = self.checkpoints.get(keyword)
+        if checkpoint and checkpoint['last_run_at']:
+            last_run = checkpoint['last_run_at']
+            if last_run.tzinfo is None:
+                last_run = last_run.replace(tzinfo=timezone.utc)
+            return last_run - timedelta(hours=settings.YOUTUBE_WINDOW_OVERLAP_HOURS)
+        return now - timedelta(days=settings.YOUTUBE_INITIAL_WINDOW_DAYS)
     
-    def scrape_category(self, category: str, db: Session) -> int:
+    def search_video_ids(
+        self,
+        keyword: str,
+        max_results: int = 10,
+        published_after: Optional[datetime] = None,
+        published_before: Optional[datetime] = None
+    ) -> Optional[List[str]]:
         """
-        Scrape YouTube Shorts for a specific category
-        Returns number of signals saved
+        Search for YouTube Shorts by keyword (100 quota units per page)
+        Pages are always requested at full size (50 IDs cost the same as 10)
+        and trimmed here. Follows nextPageToken until max_results videos not
+        seen before are found, the window runs out of results, or
+        max_search_pages is hit.
+        Returns list of video IDs, or None if any page failed or the quota
+        ran out before the search finished (the window is searched again
+        next run rather than skipped)
         """
-        keywords = CATEGORY_KEYWORDS.get(category, [category.lower()])
-        signals_saved = 0
+        now = datetime.now(timezone.utc)
+        published_before = published_before or now
+        published_after = published_after or now - timedelta(days=settings.YOUTUBE_INITIAL_WINDOW_DAYS)
         
-        logger.info(f"Scraping {category} with keywords: {keywords}")
+        video_ids = []
+        fresh = 0
+        page_token = None
         
-        for keyword in keywords:
-            videos = self.search_shorts(keyword, max_results=self.max_results_per_search)
+        for _ in range(self.max_search_pages):
+            if not self.quota.can_spend("search.list"):
+                logger.warning(f"Quota budget exhausted, skipping search for '{keyword}'")
+                return None
             
-            for video in videos:
-                try:
-                    video_id = video['id']
-                    snippet = video['snippet']
-                    stats = video['statistics']
-                    
-                    # Create video URL
-                    video_url = f"https://youtube.com/shorts/{video_id}"
-                    
-                    # Check if already exists
-                    existing = db.query(RawSignal).filter(
-                        RawSignal.identifier == video_url
-                    ).first()
-                    
-                    if existing:
-                        continue
-                    
-                    # Calculate engagement score
-                    engagement = self.calculate_engagement_score(video)
-                    
-                    # Extract metadata
-                    metadata = {
-                        "channel_title": snippet.get('channelTitle'),
-                        "channel_id": snippet.get('channelId'),
-                        "published_at": snippet.get('publishedAt'),
-                        "views": int(stats.get('viewCount', 0)),
-                        "likes": int(stats.get('likeCount', 0)),
-                        "comments": int(stats.get('commentCount', 0)),
-                        "tags": snippet.get('tags', []),
-                        "category_id": snippet.get('categoryId'),
-                        "search_keyword": keyword
-                    }
-                    
-                    # Create signal
-                    signal = RawSignal(
-                        platform="youtube",
-                        signal_type="short",
-                        identifier=video_url,
-                        title=snippet.get('title', '')[:500],
-                        content_preview=snippet.get('description', '')[:1000],
-                        category=category,
-                        metric_name="engagement_score",
-                        metric_value=engagement,
-                        signal_metadata=metadata,
-                        content_created_at=datetime.fromisoformat(
-                            snippet['publishedAt'].replace('Z', '+00:00')
-                        )
-                    )
-                    
-                    db.add(signal)
-                    signals_saved += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing video {video.get('id')}: {e}")
-                    continue
+            try:
+                search_response = self._execute("search.list", self.youtube.search().list(
+                    q=keyword,
+                    part='id',
+                    maxResults=SEARCH_PAGE_SIZE,
+                    type='video',
+                    videoDuration='short',  # Shorts are typically under 60 seconds
+                    order='viewCount',  # Get trending videos
+                    publishedAfter=published_after.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    publishedBefore=published_before.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    pageToken=page_token
+                ))
+            except Exception as e:
+                logger.error(f"YouTube API error for keyword '{keyword}': {e}")
+                return None
+            
+            for item in search_response.get('items', []):
+                if fresh >= max_results:
+                    break
+                video_id = item['id']['videoId']
+                video_ids.append(video_id)
+                if f"https://youtube.com/shorts/{video_id}" not in self.seen:
+                    fresh += 1
             
-            # Commit after each keyword to avoid losing progress
+            page_token = search_response.get('nextPageToken')
+            if fresh >= max_results or not page_token:
+                break
+        
+        return video_ids
+    
+    def _execute(self, operation: str, request) -> Dict:
+        """
+        Run an API request through the retry policy, charging the quota for
+        every attempt; raises CircuitOpenError while YouTube's circuit is open
+        """
+        def attempt():
+            self.quota.spend(operation)
+            return request.execute()
+        
+        return self.resilience.call(YOUTUBE_HOST, attempt)
+    
+    def fetch_video_details(self, video_ids: List[str], skipped: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Snippet and statistics for video IDs, 50 per videos().list call
+        (1 quota unit each)
+        IDs whose batch failed or was skipped for quota are appended to
+        `skipped` when given
+        """
+        videos = []
+        for i in range(0, len(video_ids), VIDEOS_PER_REQUEST):
+            batch = video_ids[i:i + VIDEOS_PER_REQUEST]
+            if not self.quota.can_spend("videos.list"):
+                logger.warning("Quota budget exhausted, skipping remaining video details")
+                if skipped is not None:
+                    skipped.extend(video_ids[i:])
+                break
             try:
-                db.commit()
-                logger.info(f"  Keyword '{keyword}': {signals_saved} signals saved so far")
+                response = self._execute("videos.list", self.youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(batch),
+                    maxResults=VIDEOS_PER_REQUEST
+                ))
+                videos.extend(response.get('items', []))
             except Exception as e:
-                logger.error(f"Database commit error: {e}")
-                db.rollback()
+                logger.error(f"YouTube API error fetching {len(batch)} videos: {e}")
+                if skipped is not None:
+                    skipped.extend(batch)
+        return videos
+    
+    def search_shorts(self, keyword: str, max_results: int = 10) -> List[Dict]:
+        """
+        Search for YouTube Shorts by keyword
+        Returns list of video resources with statistics
+        """
+        return self.fetch_video_details(self.search_video_ids(keyword, max_results) or [])
+    
+    def plan_candidates(self, categories: List[str]) -> Tuple[Dict[str, Tuple[str, str]], List[str]]:
+        """
+        Search every keyword of every category first, each over its own
+        rolling publish-date window.
+        Returns video_id -> (category, keyword) for the first search that
+        found it, so a video surfacing under several keywords costs one
+        detail lookup, and the keywords whose search succeeded
+        """
+        now = datetime.now(timezone.utc)
+        candidates = {}
+        searched = []
+        for category in categories:
+            for keyword in CATEGORY_KEYWORDS.get(category, [category.lower()]):
+                if keyword in searched:
+                    continue
+                video_ids = self.search_video_ids(
+                    keyword,
+                    max_results=self.max_results_per_search,
+                    published_after=self.search_window(keyword, now),
+                    published_before=now
+                )
+                if video_ids is None:
+                    continue
+                searched.append(keyword)
+                for video_id in video_ids:
+                    candidates.setdefault(video_id, (category, keyword))
+        return candidates, searched
+    
+    def build_signal(self, video: Dict, category: str, keyword: str) -> Dict:
+        """Signal dictionary for one video resource"""
+        snippet = video['snippet']
+        stats = video['statistics']
+        
+        # Extract metadata
+        metadata = {
+            "channel_title": snippet.get('channelTitle'),
+            "channel_id": snippet.get('channelId'),
+            "published_at": snippet.get('publishedAt'),
+            "views": int(stats.get('viewCount', 0)),
+            "likes": int(stats.get('likeCount', 0)),
+            "comments": int(stats.get('commentCount', 0)),
+            "tags": snippet.get('tags', []),
+            "category_id": snippet.get('categoryId'),
+            "search_keyword": keyword
+        }
+        
+        return {
+            "platform": "youtube",
+            "signal_type": "short",
+            "identifier": f"https://youtube.com/shorts/{video['id']}",
+            "title": snippet.get('title', '')[:500],
+            "content_preview": snippet.get('description', '')[:1000],
+            "category": category,
+            "metric_name": "engagement_score",
+            "metric_value": self.calculate_engagement_score(video),
+            "signal_metadata": metadata,
+            "content_created_at": datetime.fromisoformat(
+                snippet['publishedAt'].replace('Z', '+00:00')
+            ),
+        }
+    
+    def scrape_categories(self, categories: List[str], db: Session) -> Dict[str, int]:
+        """
+        Quota-planned scrape of several categories through the shared SourceRunner:
+        1. search every keyword and collect candidate video IDs
+        2. drop IDs already stored (seen-set, then one IN query)
+        3. fetch details for the rest in full 50-ID videos().list batches
+        4. bulk upsert the new signals in batches
+        Returns number of signals saved per category
+        """
+        self.categories = categories
+        saved = SourceRunner(self).run(db)
+        return {category: saved.get(category, 0) for category in categories}
+    
+    # SignalSource plugin: one job per 50-ID videos().list batch
+    
+    def start(self, db: Session):
+        self.checkpoints.load(db)
+        # Most repeat videos were stored by a recent run
+        self.seen.preload(db, platform="youtube")
+        self.failed_keywords = set()
+        self.newest = {}
+    
+    def jobs(self, db: Session) -> Iterable[List[str]]:
+        self.candidates, self.searched = self.plan_candidates(self.categories)
+        existing = self.seen.existing(
+            db, [f"https://youtube.com/shorts/{video_id}" for video_id in self.candidates]
+        )
+        new_ids = [
+            video_id for video_id in self.candidates
+            if f"https://youtube.com/shorts/{video_id}" not in existing
+        ]
         
-        return signals_saved
+        logger.info(f"Search found {len(self.candidates)} videos, {len(new_ids)} not stored yet")
+        return [new_ids[i:i + VIDEOS_PER_REQUEST] for i in range(0, len(new_ids), VIDEOS_PER_REQUEST)]
+    
+    def fetch(self, video_ids: List[str]) -> List[Dict]:
+        skipped = []
+        videos = self.fetch_video_details(video_ids, skipped=skipped)
+        # Videos never fetched must be found again: hold their keywords' windows
+        self.failed_keywords.update(self.candidates[video_id][1] for video_id in skipped)
+        return videos
+    
+    def normalize(self, videos: List[Dict]) -> List[Dict]:
+        signals = []
+        for video in videos:
+            try:
+                category, keyword = self.candidates[video['id']]
+                signals.append(self.build_signal(video, category, keyword))
+            except Exception as e:
+                logger.error(f"Error processing video {video.get('id')}: {e}")
+        return signals
+    
+    def on_write(self, db: Session, payloads: List[List[Dict]], result: Optional[Dict]):
+        for videos in payloads:
+            for video in videos:
+                _, keyword = self.candidates[video['id']]
+                published = datetime.fromisoformat(video['snippet']['publishedAt'].replace('Z', '+00:00'))
+                self.newest[keyword] = max(self.newest.get(keyword, published), published)
+    
+    def on_write_failed(self, payloads: List[List[Dict]]):
+        # These keywords' windows must not move past videos that weren't saved
+        for videos in payloads:
+            self.failed_keywords.update(self.candidates[video['id']][1] for video in videos)
+    
+    def finish(self, db: Session):
+        """Next run's window starts from here for keywords that were fully saved"""
+        try:
+            for keyword in self.searched:
+                if keyword not in self.failed_keywords:
+                    self.checkpoints.advance(db, keyword, cursor=None, last_seen_at=self.newest.get(keyword))
+            db.commit()
+        except Exception as e:
+            logger.error(f"Checkpoint update error: {e}")
+            db.rollback()
+    
+    def stats(self) -> Dict:
+        return {'quota': self.quota.stats(), 'resilience': self.resilience.stats()}
+    
+    def scrape_category(self, category: str, db: Session) -> int:
+        """
+        Scrape YouTube Shorts for a specific category
+        Returns number of signals saved
+        """
+        logger.info(f"Scraping {category} with keywords: {CATEGORY_KEYWORDS.get(category, [category.lower()])}")
+        return self.scrape_categories([category], db)[category]
 
 
 def main():
@@ -208,17 +425,9 @@ def main():
     category_counts = {}
     
     try:
-        # Scrape each category
-        for category in CATEGORY_KEYWORDS.keys():
-            try:
-                count = scraper.scrape_category(category, db)
-                category_counts[category] = count
-                total_signals += count
-                logger.info(f"Category {category}: {count} signals saved")
-                
-            except Exception as e:
-                logger.error(f"Error scraping {category}: {e}")
-                continue
+        # Plan searches and detail lookups across all categories at once
+        category_counts = scraper.scrape_categories(list(CATEGORY_KEYWORDS.keys()), db)
+        total_signals = sum(category_counts.values())
         
         logger.info(f"\nScraping complete! Total signals: {total_signals}")
         for category, count in category_counts.items():
@@ -0,0 +1,127 @@
+"""Tests for the persistent extraction cache (local SQLite backend)"""
+
+import pickle
+
+import pytest
+
+from services.ingestion import extraction_cache
+from services.ingestion.extraction_cache import ExtractionCache, LocalCacheBackend, make_cache_key
+
+RESULT = {'trend_phrases': [{'normalized': 'glass skin', 'score': 1.2}], 'keywords': ['skin'], 'hashtags': []}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(extraction_cache.time, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalCacheBackend(str(tmp_path / 'cache' / 'extraction.sqlite3'), max_entries=100, ttl_seconds=3600)
+
+
+def test_key_ignores_whitespace_but_not_case_or_version():
+    key = make_cache_key('Glass  Skin\troutine ', 'v1:full')
+    assert key == make_cache_key('Glass Skin routine', 'v1:full')
+    assert key != make_cache_key('glass skin routine', 'v1:full')
+    assert key != make_cache_key('Glass Skin routine', 'v2:full')
+
+
+def test_round_trip(backend):
+    cache = ExtractionCache(backend)
+    cache.set('k1', RESULT)
+
+    assert cache.get('k1') == RESULT
+    assert cache.get_many(['k1', 'k2']) == {'k1': RESULT}
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+
+def test_entries_survive_reopening(backend):
+    ExtractionCache(backend).set('k1', RESULT)
+
+    reopened = ExtractionCache(LocalCacheBackend(backend.path))
+    assert reopened.get('k1') == RESULT
+
+
+def test_expired_entries_miss(backend, clock):
+    cache = ExtractionCache(backend)
+    cache.set('k1', RESULT)
+
+    clock.now += 3599
+    assert cache.get('k1') == RESULT
+    clock.now += 2
+    assert cache.get('k1') is None
+
+
+def test_prune_evicts_least_recently_used(backend, clock):
+    cache = ExtractionCache(backend)
+    for i in range(99):
+        clock.now += 1
+        cache.set(f"k{i}", RESULT)
+    clock.now += 1
+    assert cache.get('k0') == RESULT  # k0 becomes the most recently used
+
+    # The 100th write triggers a prune once the table is over max_entries
+    clock.now += 1
+    cache.set_many({f"new{i}": RESULT for i in range(5)})
+
+    assert backend.size() == 100
+    assert cache.stats()['evictions'] == 4
+    assert cache.get('k0') == RESULT
+    assert cache.get_many(['k1', 'k2', 'k3', 'k4']) == {}
+    assert cache.get('k5') == RESULT
+
+
+def test_prune_drops_expired_first(backend, clock):
+    cache = ExtractionCache(backend)
+    cache.set_many({f"old{i}": RESULT for i in range(50)})
+    clock.now += 7200
+    cache.set_many({f"new{i}": RESULT for i in range(50)})
+
+    assert backend.size() == 50
+    assert cache.stats()['evictions'] == 50
+
+
+def test_backend_pickles_without_its_connection(backend):
+    cache = ExtractionCache(backend)
+    cache.set('k1', RESULT)
+
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.backend._conn is None
+    assert copy.get('k1') == RESULT
+
+
+def test_backend_errors_degrade_to_misses():
+    class BrokenBackend:
+        evictions = 0
+
+        def get_many(self, keys):
+            raise OSError("disk gone")
+
+        def set_many(self, items):
+            raise OSError("disk gone")
+
+    cache = ExtractionCache(BrokenBackend())
+    cache.set('k1', RESULT)
+    assert cache.get('k1') is None
+    assert cache.stats() == {'hits': 0, 'misses': 1, 'hit_rate': 0.0, 'errors': 2, 'evictions': 0}
+
+
+def test_take_counters_resets_and_add_counters_merges(backend):
+    worker, parent = ExtractionCache(backend), ExtractionCache(LocalCacheBackend(backend.path))
+    worker.set('k1', RESULT)
+    worker.get_many(['k1', 'k2'])
+
+    parent.add_counters(worker.take_counters())
+    assert worker.stats()['hits'] == 0 and worker.stats()['misses'] == 0
+    assert parent.stats()['hits'] == 1 and parent.stats()['misses'] == 1
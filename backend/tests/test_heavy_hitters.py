@@ -0,0 +1,73 @@
+"""Tests for the Space-Saving heavy-hitter counter"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from services.ingestion.heavy_hitters import SpaceSaving
+
+
+def offer_all(counter, keys):
+    for key in keys:
+        counter.offer(key, dict)
+
+
+def test_counts_exactly_below_capacity():
+    counter = SpaceSaving(capacity=5)
+    offer_all(counter, 'abacab')
+
+    assert {key: (count, error) for key, count, error, _ in counter.items()} == {
+        'a': (3, 0), 'b': (2, 0), 'c': (1, 0)
+    }
+    assert counter.evictions == 0 and counter.max_error == 0
+
+
+def test_newcomer_replaces_minimum_and_inherits_its_count():
+    counter = SpaceSaving(capacity=2)
+    offer_all(counter, 'aab')
+    offer_all(counter, 'c')
+
+    entries = {key: (count, error) for key, count, error, _ in counter.items()}
+    assert entries == {'a': (2, 0), 'c': (2, 1)}
+    assert counter.evictions == 1
+    assert counter.max_error == 1
+
+
+def test_payload_is_kept_for_monitored_keys_and_rebuilt_after_eviction():
+    counter = SpaceSaving(capacity=1)
+    payload = counter.offer('a', dict)
+    payload['seen'] = True
+    assert counter.offer('a', dict) is payload
+
+    assert counter.offer('b', dict) == {}
+
+
+def test_bounds_hold_and_heavy_hitters_are_monitored():
+    rng = random.Random(3)
+    # Zipf-like stream: a few frequent keys over a long tail
+    stream = [f"k{int(rng.paretovariate(1.2))}" for _ in range(20000)]
+    capacity = 50
+    counter = SpaceSaving(capacity)
+    offer_all(counter, stream)
+
+    truth = Counter(stream)
+    assert len(counter) == capacity
+    for key, count, error, _ in counter.items():
+        assert count - error <= truth[key] <= count
+
+    monitored = {key for key, *_ in counter.items()}
+    for key, true_count in truth.items():
+        if true_count > len(stream) / capacity:
+            assert key in monitored
+
+
+def test_heap_stays_bounded():
+    counter = SpaceSaving(capacity=10)
+    offer_all(counter, [f"k{i % 30}" for i in range(5000)])
+    assert len(counter._heap) <= 4 * counter.capacity
+
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(0)
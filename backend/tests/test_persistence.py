@@ -0,0 +1,161 @@
+"""
+Tests for BulkSignalWriter against PostgreSQL (ON CONFLICT, RETURNING xmax).
+Skipped unless TEST_DATABASE_URL points at a database the tests may create
+tables in; every test runs inside a transaction that is rolled back.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+# app.config requires these; the writer only uses the test connection
+os.environ.setdefault('DATABASE_URL', TEST_DATABASE_URL)
+os.environ.setdefault('SECRET_KEY', 'test')
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models import DetectedTrend, RawSignal, SignalMetricSnapshot, SignalTrendAssociation, Trend
+from services.ingestion.persistence import BulkSignalWriter
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(TEST_DATABASE_URL)
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Only the writer's tables (and trends, which detected_trends references)
+    Base.metadata.create_all(connection, tables=[
+        model.__table__
+        for model in (Trend, RawSignal, SignalMetricSnapshot, DetectedTrend, SignalTrendAssociation)
+    ])
+    session = Session(bind=connection)
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def category():
+    # Unique per test so rows already in a shared database never collide
+    return f"test_{uuid.uuid4().hex[:12]}"
+
+
+def make_signal(category, identifier, phrases, metric_value=10.0):
+    return {
+        'platform': 'reddit',
+        'signal_type': 'post',
+        'identifier': f"{category}/{identifier}",
+        'title': ' '.join(phrases) or identifier,
+        'category': category,
+        'metric_name': 'upvotes',
+        'metric_value': metric_value,
+        'content_created_at': datetime(2026, 10, 1, tzinfo=timezone.utc),
+        'signal_metadata': {
+            'detected_trends': [
+                {'phrase': phrase.title(), 'normalized': phrase, 'score': 1.0, 'method': 'ngram'}
+                for phrase in phrases
+            ],
+            'keywords': [word for phrase in phrases for word in phrase.split()],
+            'hashtags': [],
+        },
+    }
+
+
+def signal_counts(db, category):
+    rows = db.execute(
+        select(DetectedTrend.normalized_phrase, DetectedTrend.signal_count)
+        .where(DetectedTrend.category == category)
+    )
+    return dict(rows.all())
+
+
+def test_first_write_inserts_signals_trends_and_associations(db, category):
+    stats = BulkSignalWriter().write(db, [
+        make_signal(category, 'p1', ['glass skin', 'skin routine']),
+        make_signal(category, 'p2', ['glass skin']),
+    ])
+
+    assert stats['signals'] == 2
+    assert stats['signals_inserted'] == 2
+    assert stats['trends_created'] == 2
+    assert stats['associations_created'] == 3
+    assert sorted(stats['new_trend_keys']) == [(category, 'glass skin'), (category, 'skin routine')]
+    assert set(stats['signal_ids']) == {f"{category}/p1", f"{category}/p2"}
+    assert signal_counts(db, category) == {'glass skin': 2, 'skin routine': 1}
+
+
+def test_rewrite_updates_without_recounting(db, category):
+    writer = BulkSignalWriter()
+    first = writer.write(db, [make_signal(category, 'p1', ['glass skin'], metric_value=10.0)])
+
+    stats = writer.write(db, [
+        make_signal(category, 'p1', ['glass skin'], metric_value=25.0),
+        make_signal(category, 'p2', ['glass skin']),
+    ])
+
+    assert stats['signals'] == 2
+    assert stats['signals_inserted'] == 1
+    assert stats['trends_created'] == 0
+    assert stats['associations_created'] == 1
+    assert stats['signal_ids'][f"{category}/p1"] == first['signal_ids'][f"{category}/p1"]
+    assert signal_counts(db, category) == {'glass skin': 2}
+
+    signal_id = first['signal_ids'][f"{category}/p1"]
+    assert db.get(RawSignal, signal_id).metric_value == 25.0
+    snapshots = db.execute(
+        select(SignalMetricSnapshot.metric_value)
+        .where(SignalMetricSnapshot.signal_id == signal_id)
+        .order_by(SignalMetricSnapshot.id)
+    ).scalars().all()
+    assert snapshots == [10.0, 25.0]
+
+
+def test_duplicate_identifiers_in_a_batch_count_once(db, category):
+    stats = BulkSignalWriter().write(db, [
+        make_signal(category, 'p1', ['glass skin'], metric_value=1.0),
+        make_signal(category, 'p1', ['glass skin'], metric_value=2.0),
+    ])
+
+    assert stats['signals'] == 1 and stats['signals_inserted'] == 1
+    assert stats['associations_created'] == 1
+    assert signal_counts(db, category) == {'glass skin': 1}
+    assert db.get(RawSignal, stats['signal_ids'][f"{category}/p1"]).metric_value == 2.0
+
+
+def test_write_trends_links_stored_signals(db, category):
+    writer = BulkSignalWriter(snapshots=False)
+    stored = writer.write(db, [make_signal(category, 'p1', []), make_signal(category, 'p2', [])])
+    ids = [stored['signal_ids'][f"{category}/{name}"] for name in ('p1', 'p2')]
+    assert stored['associations_created'] == 0
+
+    stats = writer.write_trends(db, [
+        (ids[0], make_signal(category, 'p1', ['quiet luxury'])),
+        (ids[1], make_signal(category, 'p2', ['quiet luxury', 'clean girl'])),
+    ])
+    assert stats['trends_created'] == 2 and stats['associations_created'] == 3
+    assert writer.mark_extracted(db, ids, 'test') == 2
+
+    # Re-linking the same signals creates nothing and leaves the counts alone
+    again = writer.write_trends(db, [(ids[1], make_signal(category, 'p2', ['quiet luxury']))])
+    assert again['trends_created'] == 0 and again['associations_created'] == 0
+    assert signal_counts(db, category) == {'quiet luxury': 2, 'clean girl': 1}
+    assert db.scalar(
+        select(func.count()).select_from(SignalTrendAssociation)
+        .where(SignalTrendAssociation.signal_id.in_(ids))
+    ) == 3
+    assert db.scalar(
+        select(func.count()).select_from(SignalMetricSnapshot)
+        .where(SignalMetricSnapshot.signal_id.in_(ids))
+    ) == 0
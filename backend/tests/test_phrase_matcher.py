@@ -0,0 +1,119 @@
+"""Tests for the word-level Aho-Corasick known-phrase matcher"""
+
+import random
+
+import pytest
+
+from services.ingestion.phrase_matcher import KnownPhraseMatcher, PhraseAutomaton
+
+
+def naive_find(phrases, tokens):
+    """Every phrase occurrence, ordered by end position (longest first on ties)"""
+    matches = []
+    for end in range(1, len(tokens) + 1):
+        found = [
+            phrase for phrase in phrases
+            if tokens[max(0, end - len(phrase.split())):end] == phrase.split()
+        ]
+        matches.extend(sorted(found, key=lambda phrase: -len(phrase.split())))
+    return matches
+
+
+def automaton(*phrases):
+    automaton = PhraseAutomaton()
+    for phrase in phrases:
+        automaton.add(phrase)
+    automaton.build()
+    return automaton
+
+
+def test_matches_whole_tokens_only():
+    found = automaton('skin', 'glass skin').find('my skincare and glass skin routine'.split())
+    assert found == ['glass skin', 'skin']
+
+
+def test_overlapping_phrases_use_output_links():
+    found = automaton('glass skin routine', 'skin routine', 'routine').find('the glass skin routine'.split())
+    assert found == ['glass skin routine', 'skin routine', 'routine']
+
+
+def test_failure_link_after_partial_match():
+    # "a b" fails on "d" and must fall back to "b" to find "b d"
+    assert automaton('a b c', 'b d').find('a b d'.split()) == ['b d']
+
+
+def test_add_reports_duplicates_and_empty_phrases():
+    automaton = PhraseAutomaton()
+    assert automaton.add('glass skin')
+    assert not automaton.add('glass skin')
+    assert not automaton.add('   ')
+    assert automaton.size == 1
+
+
+def test_find_builds_pending_phrases():
+    automaton = PhraseAutomaton()
+    automaton.add('skin routine')
+    assert automaton.find('skin routine'.split()) == ['skin routine']
+
+    automaton.add('glass skin routine')
+    assert automaton.find('glass skin routine'.split()) == ['glass skin routine', 'skin routine']
+
+
+@pytest.mark.parametrize('min_staged, merge_fraction', [(256, 16), (2, 2)])
+def test_agrees_with_brute_force_across_batches(min_staged, merge_fraction):
+    rng = random.Random(7)
+    vocab = ['a', 'b', 'c', 'd']
+    automaton, phrases = PhraseAutomaton(min_staged, merge_fraction), []
+    for _ in range(10):
+        # New phrases between matches must repair links of the existing trie
+        for _ in range(8):
+            phrase = ' '.join(rng.choices(vocab, k=rng.randint(1, 4)))
+            if automaton.add(phrase):
+                phrases.append(phrase)
+        automaton.build()
+
+        for _ in range(20):
+            tokens = rng.choices(vocab, k=rng.randint(0, 12))
+            assert automaton.find(tokens) == naive_find(phrases, tokens)
+
+
+def test_small_batches_leave_the_main_automaton_alone():
+    automaton = PhraseAutomaton(min_staged=4, merge_fraction=2)
+    for phrase in ['glass skin', 'skin routine', 'clean girl', 'quiet luxury', 'slugging']:
+        automaton.add(phrase)
+    automaton.build()
+    main = automaton._main
+    assert main.size == 5 and automaton._staged.size == 0
+
+    automaton.add('glass skin routine')
+    automaton.add('routine')
+    automaton.build()
+    assert automaton._main is main and main.size == 5
+    assert automaton._staged.size == 2
+    assert not automaton.add('glass skin') and not automaton.add('routine')
+    assert automaton.find('my glass skin routine'.split()) == ['glass skin', 'glass skin routine', 'skin routine', 'routine']
+
+    for phrase in ['a', 'b', 'c']:
+        automaton.add(phrase)
+    automaton.build()
+    assert automaton._staged.size == 0 and automaton.size == 10
+
+
+def test_matcher_keeps_categories_apart():
+    matcher = KnownPhraseMatcher()
+    assert matcher.add_many([('beauty', 'glass skin'), ('tech', 'glass screen'), ('beauty', 'glass skin')]) == 2
+
+    assert matcher.match('beauty', 'glass skin and glass screen') == ['glass skin']
+    assert matcher.match('tech', 'glass skin and glass screen') == ['glass screen']
+    assert matcher.match('fashion', 'glass skin') == []
+    assert matcher.size == 2
+
+
+def test_matcher_dedups_matches_and_picks_up_new_phrases():
+    matcher = KnownPhraseMatcher()
+    matcher.add('beauty', 'glass skin')
+    assert matcher.match('beauty', 'glass skin vs glass skin') == ['glass skin']
+
+    assert matcher.add('beauty', 'skin')
+    assert not matcher.add('beauty', 'skin')
+    assert matcher.match('beauty', 'glass skin') == ['glass skin', 'skin']
@@ -0,0 +1,214 @@
+"""Tests for the scraper retry/backoff/circuit-breaker layer"""
+
+import pytest
+
+from services.ingestion import resilience
+from services.ingestion.resilience import (
+    CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy, is_transient, retry_after
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class HTTPFailure(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code, headers)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(resilience.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock):
+    breaker = CircuitBreaker('api.test', failure_threshold=3, reset_seconds=60)
+    monkeypatch.setitem(resilience._breakers, 'api.test', breaker)
+    return breaker
+
+
+def policy(**kwargs):
+    kwargs.setdefault('budget', RetryBudget(ratio=0.2, minimum=10))
+    return RetryPolicy(max_attempts=3, base_seconds=1.0, max_seconds=30.0, sleep=lambda seconds: None, **kwargs)
+
+
+def fail_with(error):
+    def fn():
+        raise error
+    return fn
+
+
+def test_breaker_opens_after_threshold(breaker):
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == 'closed' and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+    assert breaker.stats() == {'state': 'open', 'opened': 1, 'rejected': 1}
+
+
+def test_success_resets_consecutive_failures(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+
+def test_half_open_lets_one_probe_through(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+
+    assert breaker.allow() == 'probe'
+    assert breaker.state == 'half_open'
+    assert breaker.allow() is None  # Second caller waits for the probe
+
+
+def test_probe_success_closes_and_failure_reopens(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and breaker.opened == 2
+    assert not breaker.allow()
+
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.allow()
+
+
+def test_policy_retries_transient_errors_then_succeeds(breaker):
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise HTTPFailure(503)
+        return 'ok'
+
+    assert policy().call('api.test', flaky) == 'ok'
+    assert len(attempts) == 3
+    assert breaker.state == 'closed'
+
+
+def test_policy_raises_client_errors_without_retrying(breaker):
+    attempts = []
+
+    def forbidden():
+        attempts.append(1)
+        raise HTTPFailure(403)
+
+    with pytest.raises(HTTPFailure):
+        policy().call('api.test', forbidden)
+    assert len(attempts) == 1
+
+
+def test_client_error_from_probe_does_not_wedge_breaker(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+
+    with pytest.raises(HTTPFailure):
+        policy().call('api.test', fail_with(HTTPFailure(404)))
+
+    # The host answered, so the breaker closed and later calls go through
+    assert breaker.state == 'closed'
+    assert policy().call('api.test', lambda: 'ok') == 'ok'
+
+
+def test_probe_is_released_when_probe_is_interrupted(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+
+    with pytest.raises(KeyboardInterrupt):
+        policy().call('api.test', fail_with(KeyboardInterrupt()))
+
+    assert breaker.state == 'half_open'
+    assert breaker.allow() == 'probe'
+
+
+def test_call_in_flight_when_breaker_opened_keeps_others_probe(breaker, clock):
+    def interrupted_mid_outage():
+        # Other threads trip the breaker and take the probe while this call runs
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 60
+        assert breaker.allow() == 'probe'
+        raise KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        policy().call('api.test', interrupted_mid_outage)
+
+    assert breaker.state == 'half_open'
+    assert breaker.allow() is None
+
+
+def test_open_circuit_fails_fast(breaker):
+    calls = []
+    with pytest.raises(TimeoutError):
+        policy().call('api.test', fail_with(TimeoutError('slow')))
+    assert breaker.state == 'open'
+
+    with pytest.raises(CircuitOpenError):
+        policy().call('api.test', lambda: calls.append(1))
+    assert calls == []
+
+
+def test_retry_budget_caps_retries(breaker):
+    budget = RetryBudget(ratio=0.0, minimum=1)
+    attempts = []
+
+    def failing():
+        attempts.append(1)
+        raise ConnectionError('reset')
+
+    with pytest.raises(ConnectionError):
+        policy(budget=budget).call('api.test', failing)
+    assert len(attempts) == 2  # First attempt plus the single budgeted retry
+    assert budget.stats()['denied'] == 1
+
+
+def test_backoff_honours_retry_after(breaker):
+    delays = []
+    retry_policy = RetryPolicy(max_attempts=2, base_seconds=0.01, max_seconds=30.0, sleep=delays.append)
+    attempts = []
+
+    def throttled():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise HTTPFailure(429, {'Retry-After': '7'})
+        return 'ok'
+
+    assert retry_policy.call('api.test', throttled) == 'ok'
+    assert delays == [7.0]
+
+
+def test_error_classification():
+    assert is_transient(HTTPFailure(429))
+    assert is_transient(HTTPFailure(502))
+    assert not is_transient(HTTPFailure(404))
+    assert is_transient(TimeoutError())
+    assert not is_transient(ValueError())
+    assert retry_after(HTTPFailure(429, {'Retry-After': '12'})) == 12.0
+    assert retry_after(HTTPFailure(429)) is None
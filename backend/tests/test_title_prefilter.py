@@ -0,0 +1,66 @@
+"""Tests for the title prefilter's skip reasons and counters"""
+
+import pytest
+
+from services.ingestion.title_prefilter import TitlePrefilter
+
+
+@pytest.mark.parametrize('title, reason', [
+    ('', 'empty'),
+    ('   ', 'empty'),
+    ('🔥🔥🔥 100%', 'no_text'),
+    ('lol', 'no_text'),
+    ('新しいスキンケアのルーティン', 'non_latin'),
+    ('Новый уход за кожей', 'non_latin'),
+    ('skincare', 'too_short'),
+    ('#glassskin', 'too_short'),
+    ('mi rutina de la mañana para el pelo', 'non_english'),
+    ('le meilleur sérum pour la peau', 'non_english'),
+    ('meine Routine und die beste Creme ist', 'non_english'),
+])
+def test_skip_reasons(title, reason):
+    assert TitlePrefilter().check(title) == reason
+
+
+@pytest.mark.parametrize('title', [
+    'My glass skin routine finally works',
+    'Quiet luxury outfit ideas',
+    'La La Land is the best movie of the year',
+    'Café recommendations in the city',
+])
+def test_keeps_english_titles(title):
+    assert TitlePrefilter().check(title) is None
+
+
+def test_one_foreign_stopword_is_not_enough():
+    # "de" alone shouldn't flag an English title
+    assert TitlePrefilter().check('Best pain de mie recipe') is None
+
+
+def test_thresholds_are_configurable():
+    prefilter = TitlePrefilter(min_words=1)
+    assert prefilter.check('skincare') is None
+
+
+def test_allow_counts_passes_and_skips_by_reason():
+    prefilter = TitlePrefilter()
+    titles = ['My glass skin routine', 'skincare', 'lol', 'skincare', '']
+    assert [prefilter.allow(title) for title in titles] == [True, False, False, False, False]
+
+    stats = prefilter.stats()
+    assert stats['passed'] == 1
+    assert stats['skipped'] == 4
+    assert stats['skipped_by_reason'] == {'too_short': 2, 'no_text': 1, 'empty': 1}
+    assert stats['skip_rate'] == 0.8
+
+
+def test_take_counters_resets_and_add_counters_merges():
+    worker, parent = TitlePrefilter(), TitlePrefilter()
+    worker.allow('My glass skin routine')
+    worker.allow('skincare')
+    parent.allow('skincare')
+
+    parent.add_counters(worker.take_counters())
+    assert worker.stats()['passed'] == 0 and worker.stats()['skipped'] == 0
+    assert parent.stats()['passed'] == 1
+    assert parent.stats()['skipped_by_reason'] == {'too_short': 2}